@@ -0,0 +1,16 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''VHDL-extras library
+   Reference models of the arithmetic packages
+
+   Each module mirrors a VHDL package and provides bit-exact models of its
+   functions. The models accept NumPy arrays and evaluate all of the
+   elements at once. Bit vectors are represented as unsigned integers with
+   the leftmost element of the vector in the most significant bit. Vectors
+   are limited to 64 bits.
+'''
+
+# Copyright © 2014 Kevin Thibedeau
+
+# This file is part of VHDL-extras.
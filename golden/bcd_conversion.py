@@ -0,0 +1,86 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''VHDL-extras library
+   Reference model of bcd_conversion
+
+   to_binary() follows the reverse double dabble algorithm used in the VHDL
+   function so that invalid digits convert the same way. The corrections
+   for all digits are applied together with SWAR arithmetic on the packed
+   digits.
+'''
+
+# Copyright © 2014 Kevin Thibedeau
+
+# This file is part of VHDL-extras.
+
+from __future__ import print_function, division
+
+import numpy as np
+
+from golden.bits import U64, mask, as_vectors, result, check_width
+
+
+def decimal_size(n):
+    '''Model of decimal_size()'''
+    return len(str(n))
+
+
+def bit_size(n):
+    '''Model of sizing.bit_size()'''
+    return max(1, n.bit_length())
+
+
+def _digit_lsbs(digits):
+    '''Integer with the LSB of each BCD digit set'''
+    return int('1' * digits, 16) if digits > 0 else 0
+
+
+def to_bcd(binary, width):
+    '''Model of to_bcd()
+
+    width is the size of the binary input. The result has
+    decimal_size(2**width - 1) digits. Double dabble never produces invalid
+    digits so the result is computed directly from the decimal digits.
+    '''
+    check_width(width)
+    digits = decimal_size(2**width - 1)
+    check_width(digits * 4)
+
+    b, scalar = as_vectors(binary)
+    b &= U64(mask(width))
+
+    bcd = np.zeros_like(b)
+    for d in range(digits):
+        q = b // U64(10)
+        bcd |= (b - q * U64(10)) << U64(4*d)
+        b = q
+
+    return result(bcd, scalar)
+
+
+def to_binary(bcd, width):
+    '''Model of bcd_conversion.to_binary()
+
+    width is the size of the BCD input. The result has
+    bit_size(10**(width // 4) - 1) bits.
+    '''
+    check_width(width)
+    digits = width // 4
+    bits = bit_size(10**digits - 1)
+    check_width(bits)
+
+    sr, scalar = as_vectors(bcd)
+    sr &= U64(mask(width))
+    lsbs = U64(_digit_lsbs(digits))
+
+    binary = np.zeros_like(sr)
+    for i in range(bits):
+        binary |= (sr & U64(1)) << U64(i)
+        sr >>= U64(1)
+        # Subtract 3 from digits that are 8 or more. There are no borrows
+        # between digits.
+        ge8 = (sr >> U64(3)) & lsbs
+        sr -= (ge8 << U64(1)) + ge8
+
+    return result(binary, scalar)
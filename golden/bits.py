@@ -0,0 +1,92 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''VHDL-extras library
+   Bit manipulation helpers for the reference models
+'''
+
+# Copyright © 2014 Kevin Thibedeau
+
+# This file is part of VHDL-extras.
+
+from __future__ import print_function, division
+
+import numpy as np
+
+U64 = np.uint64
+MAX_WIDTH = 64
+
+
+def mask(width):
+    '''Integer with the low width bits set'''
+    return (1 << width) - 1
+
+
+def as_vectors(x):
+    '''Convert x to a uint64 array
+
+    Returns a tuple with the array and a flag that is True when x was a
+    scalar.
+    '''
+    a = np.asarray(x)
+    scalar = a.ndim == 0
+    return np.atleast_1d(a).astype(U64), scalar
+
+
+def result(a, scalar):
+    '''Return an int for scalar inputs and the array otherwise'''
+    return int(a[0]) if scalar else a
+
+
+def check_width(width, limit=MAX_WIDTH):
+    if width < 1 or width > limit:
+        raise ValueError('Width {} is out of range 1 to {}'.format(width, limit))
+
+
+def reverse_bits(x, width):
+    '''Reverse the order of the low width bits of an int'''
+    r = 0
+    for _ in range(width):
+        r = (r << 1) | (x & 1)
+        x >>= 1
+    return r
+
+
+def parity(a):
+    '''XOR reduction of each element of a uint64 array
+
+    Returns an array of 0 and 1 values.
+    '''
+    a = a ^ (a >> U64(32))
+    a ^= a >> U64(16)
+    a ^= a >> U64(8)
+    a ^= a >> U64(4)
+    return (U64(0x6996) >> (a & U64(0xF))) & U64(1)
+
+
+def linear_tables(contribution, width):
+    '''Build byte lookup tables for a linear function over GF(2)
+
+    contribution(i) is the output of the function when only input bit i
+    is set. Returns an array with a 256 entry table for each byte of the
+    input.
+    '''
+    nbytes = (width + 7) // 8
+    tables = np.zeros((nbytes, 256), dtype=U64)
+    for k in range(nbytes):
+        t = [0] * 256
+        for v in range(1, 256):
+            low = v & -v
+            bit = 8*k + low.bit_length() - 1
+            t[v] = t[v ^ low] ^ (contribution(bit) if bit < width else 0)
+        tables[k] = t
+
+    return tables
+
+
+def apply_tables(tables, a):
+    '''Evaluate a linear function with tables from linear_tables()'''
+    r = tables[0][a & U64(0xFF)]
+    for k in range(1, len(tables)):
+        r ^= tables[k][(a >> U64(8*k)) & U64(0xFF)]
+    return r
@@ -0,0 +1,125 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''VHDL-extras library
+   Reference model of crc_ops
+
+   The CRC state, polynomial, and data are integers with their width given
+   separately. next_crc() is linear over GF(2) in the state and the data so
+   it is evaluated with byte lookup tables built from a bit-serial model of
+   the VHDL function.
+'''
+
+# Copyright © 2014 Kevin Thibedeau
+
+# This file is part of VHDL-extras.
+
+from __future__ import print_function, division
+
+import numpy as np
+
+from golden.bits import U64, mask, as_vectors, result, check_width, reverse_bits, \
+    linear_tables, apply_tables
+
+
+def init_crc(xor_in):
+    return xor_in
+
+
+def next_crc_serial(crc, poly, reflect_in, data, width, data_width):
+    '''Bit-serial model of next_crc() for a single value'''
+    if reflect_in:
+        data = reverse_bits(data, data_width)
+
+    msb = 1 << (width - 1)
+    for b in range(data_width-1, -1, -1):
+        leftbit = crc & msb
+        crc = (crc << 1) & mask(width)
+        if ((data >> b) & 1) != (1 if leftbit else 0):
+            crc ^= poly
+
+    return crc
+
+
+_table_cache = {}
+
+def _crc_tables(poly, reflect_in, width, data_width):
+    key = (poly, reflect_in, width, data_width)
+    tables = _table_cache.get(key)
+    if tables is None:
+        crc_t = linear_tables(lambda i: next_crc_serial(1 << i, poly, reflect_in, 0, width, data_width), \
+            width)
+        data_t = linear_tables(lambda i: next_crc_serial(0, poly, reflect_in, 1 << i, width, data_width), \
+            data_width)
+        tables = _table_cache[key] = (crc_t, data_t)
+    return tables
+
+
+def next_crc(crc, poly, reflect_in, data, width, data_width):
+    '''Model of next_crc()
+
+    crc and data can be scalars or arrays. width is the size of the CRC and
+    polynomial and data_width is the size of the data vector.
+    '''
+    check_width(width)
+    check_width(data_width)
+    crc, crc_scalar = as_vectors(crc)
+    data, data_scalar = as_vectors(data)
+
+    crc_t, data_t = _crc_tables(poly, reflect_in, width, data_width)
+    r = apply_tables(crc_t, crc) ^ apply_tables(data_t, data)
+    return result(r, crc_scalar and data_scalar)
+
+
+def end_crc(crc, reflect_out, xor_out, width):
+    '''Model of end_crc()'''
+    check_width(width)
+    crc, scalar = as_vectors(crc)
+    if reflect_out:
+        r = np.zeros_like(crc)
+        for i in range(width):
+            r |= ((crc >> U64(i)) & U64(1)) << U64(width - 1 - i)
+        crc = r
+
+    return result(crc ^ U64(xor_out), scalar)
+
+
+def crc_table(poly, width, slices=1):
+    '''Model of crc_table()
+
+    Returns a list of slices tables with 256 entries each. Entry x of
+    table k is the CRC of byte x followed by slices-1-k zero bytes starting
+    from a zero state.
+    '''
+    return [[next_crc_serial(0, poly, False, x << 8*(slices-1-k), width, 8*slices) \
+        for x in range(256)] for k in range(slices)]
+
+
+def next_crc_bytes(crc, table, reflect_in, data, width, data_width):
+    '''Model of next_crc_bytes() for a single value
+
+    data_width must be a multiple of 8. Up to len(table) bytes are
+    processed with each group of lookups.
+    '''
+    slices = len(table)
+    if reflect_in:
+        data = reverse_bits(data, data_width)
+
+    pos = data_width
+    while pos > 0:
+        m = min(slices, pos // 8)
+        g = 8 * m
+        grp = (data >> (pos - g)) & mask(g)
+        if width <= g:
+            grp ^= crc << (g - width)
+            crc = 0
+        else:
+            grp ^= crc >> (width - g)
+            crc = (crc << g) & mask(width)
+
+        for k in range(m):
+            crc ^= table[slices-m+k][(grp >> (g - 8 - 8*k)) & 0xFF]
+        pos -= g
+
+    return crc
+
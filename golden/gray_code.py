@@ -0,0 +1,38 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''VHDL-extras library
+   Reference model of gray_code
+'''
+
+# Copyright © 2014 Kevin Thibedeau
+
+# This file is part of VHDL-extras.
+
+from __future__ import print_function, division
+
+from golden.bits import U64, mask, as_vectors, result, check_width
+
+
+def to_gray(binary, width):
+    '''Model of to_gray()'''
+    check_width(width)
+    b, scalar = as_vectors(binary)
+    b &= U64(mask(width))
+    return result(b ^ (b >> U64(1)), scalar)
+
+
+def to_binary(gray, width):
+    '''Model of to_binary()
+
+    Each result bit is the XOR of the gray code bits at and above it. This
+    is computed as a prefix XOR in log2(width) steps.
+    '''
+    check_width(width)
+    g, scalar = as_vectors(gray)
+    g &= U64(mask(width))
+    shift = 1
+    while shift < width:
+        g ^= g >> U64(shift)
+        shift *= 2
+    return result(g, scalar)
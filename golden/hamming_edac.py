@@ -0,0 +1,142 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''VHDL-extras library
+   Reference model of hamming_edac
+
+   Encoded data is an integer with the data bits above the parity bits the
+   same as the ecc_vector returned by hamming_encode(). The parity of each
+   data bit is the position it occupies in the interleaved message so the
+   encoder and syndrome generator reduce to byte lookup tables.
+'''
+
+# Copyright © 2014 Kevin Thibedeau
+
+# This file is part of VHDL-extras.
+
+from __future__ import print_function, division
+
+import numpy as np
+
+from golden.bits import U64, mask, as_vectors, result, check_width, \
+    linear_tables, apply_tables
+
+
+def floor_log2(n):
+    return n.bit_length() - 1
+
+def ceil_log2(n):
+    return (n - 1).bit_length()
+
+def is_power_of_2(n):
+    return n & (n - 1) == 0
+
+
+def hamming_message_size(data_size):
+    '''Model of hamming_message_size()'''
+    psize = floor_log2(data_size) + 1
+    if (2**psize - 1) - psize < data_size: # Not enough parity bits
+        psize += 1
+    return data_size + psize
+
+def hamming_parity_size(message_size):
+    '''Model of hamming_parity_size()'''
+    return ceil_log2(message_size + 1)
+
+def hamming_data_size(message_size):
+    '''Model of hamming_data_size()'''
+    return message_size - hamming_parity_size(message_size)
+
+
+def data_positions(data_size):
+    '''Message positions of each data bit starting with bit 0'''
+    msg_size = hamming_message_size(data_size)
+    return [i for i in range(1, msg_size+1) if not is_power_of_2(i)]
+
+
+def hamming_encode_serial(data, data_size):
+    '''Model of hamming_encode() for a single value'''
+    psize = hamming_parity_size(hamming_message_size(data_size))
+    parity = 0
+    for j, pos in enumerate(data_positions(data_size)):
+        if (data >> j) & 1:
+            parity ^= pos
+    return (data << psize) | parity
+
+def hamming_decode_serial(encoded, data_size):
+    '''Model of hamming_decode() for a single value'''
+    psize = hamming_parity_size(hamming_message_size(data_size))
+    data = encoded >> psize
+    syndrome = (hamming_encode_serial(data, data_size) ^ encoded) & mask(psize)
+    for j, pos in enumerate(data_positions(data_size)):
+        if pos == syndrome:
+            data ^= 1 << j
+    return data
+
+
+_table_cache = {}
+
+def _hamming_tables(data_size):
+    tables = _table_cache.get(data_size)
+    if tables is None:
+        positions = data_positions(data_size)
+        psize = hamming_parity_size(hamming_message_size(data_size))
+        parity_t = linear_tables(lambda i: positions[i], data_size)
+
+        # Data bit flipped for each syndrome. Syndromes for parity bits and
+        # positions beyond the message don't change the data.
+        fix_t = np.zeros(2**psize, dtype=U64)
+        for j, pos in enumerate(positions):
+            fix_t[pos] = 1 << j
+
+        tables = _table_cache[data_size] = (parity_t, fix_t)
+    return tables
+
+
+def _check_size(data_size):
+    check_width(data_size)
+    check_width(hamming_message_size(data_size))
+
+
+def hamming_parity(data, data_size):
+    '''Hamming parity bits for data'''
+    _check_size(data_size)
+    data, scalar = as_vectors(data)
+    parity_t, _ = _hamming_tables(data_size)
+    return result(apply_tables(parity_t, data & U64(mask(data_size))), scalar)
+
+
+def hamming_encode(data, data_size):
+    '''Model of hamming_encode()'''
+    _check_size(data_size)
+    data, scalar = as_vectors(data)
+    data &= U64(mask(data_size))
+    psize = hamming_parity_size(hamming_message_size(data_size))
+    parity_t, _ = _hamming_tables(data_size)
+    return result((data << U64(psize)) | apply_tables(parity_t, data), scalar)
+
+
+def hamming_syndrome(encoded, data_size):
+    '''Syndrome of an encoded value. Nonzero values indicate an error.'''
+    _check_size(data_size)
+    encoded, scalar = as_vectors(encoded)
+    psize = hamming_parity_size(hamming_message_size(data_size))
+    parity_t, _ = _hamming_tables(data_size)
+    data = (encoded >> U64(psize)) & U64(mask(data_size))
+    return result(apply_tables(parity_t, data) ^ (encoded & U64(mask(psize))), scalar)
+
+
+def hamming_decode(encoded, data_size):
+    '''Model of hamming_decode()'''
+    _check_size(data_size)
+    encoded, scalar = as_vectors(encoded)
+    psize = hamming_parity_size(hamming_message_size(data_size))
+    parity_t, fix_t = _hamming_tables(data_size)
+    data = (encoded >> U64(psize)) & U64(mask(data_size))
+    syndrome = apply_tables(parity_t, data) ^ (encoded & U64(mask(psize)))
+    return result(data ^ fix_t[syndrome], scalar)
+
+
+def hamming_has_error(encoded, data_size):
+    '''Model of hamming_has_error(). Returns booleans.'''
+    return hamming_syndrome(encoded, data_size) != 0
@@ -0,0 +1,190 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''VHDL-extras library
+   Reference model of lfsr_ops
+
+   The state is an integer with bit 1 of the VHDL shift register in the MSB.
+   Tap maps are integers one bit shorter than the state with tap_map bit 1
+   in the MSB so that they line up with bits 1 to n-1 of the state.
+'''
+
+# Copyright © 2014 Kevin Thibedeau
+
+# This file is part of VHDL-extras.
+
+from __future__ import print_function, division
+
+import numpy as np
+
+from golden.bits import U64, mask, as_vectors, result, check_width
+from golden import bits
+
+NORMAL = 'normal'
+INVERTED = 'inverted'
+
+
+def next_galois_lfsr(state, tap_map, width, kind=NORMAL, full_cycle=False):
+    '''Model of next_galois_lfsr()'''
+    check_width(width)
+    sr, scalar = as_vectors(state)
+    sr &= U64(mask(width))
+    upper = sr >> U64(1) # Bits 1 to n-1
+    fb = sr & U64(1)
+
+    if full_cycle:
+        if kind == NORMAL:
+            extra = upper == 0
+        else:
+            extra = upper == U64(mask(width-1))
+        fb ^= extra.astype(U64)
+
+    taps = U64(tap_map & mask(width-1))
+    if kind == NORMAL:
+        upper ^= taps * fb
+    else:
+        upper ^= taps * (fb ^ U64(1))
+
+    return result((fb << U64(width-1)) | upper, scalar)
+
+
+def next_fibonacci_lfsr(state, tap_map, width, kind=NORMAL, full_cycle=False):
+    '''Model of next_fibonacci_lfsr()'''
+    check_width(width)
+    sr, scalar = as_vectors(state)
+    sr &= U64(mask(width))
+    lower = sr & U64(mask(width-1)) # Bits 2 to n
+    fb = sr >> U64(width-1)
+
+    if full_cycle:
+        if kind == NORMAL:
+            extra = lower == 0
+        else:
+            extra = lower == U64(mask(width-1))
+        fb ^= extra.astype(U64)
+
+    fb ^= bits.parity(lower & U64(tap_map & mask(width-1)))
+    if kind == INVERTED:
+        fb ^= U64(1)
+
+    return result((lower << U64(1)) | fb, scalar)
+
+
+def lfsr_matrix(next_fn, tap_map, width, steps=1, kind=NORMAL):
+    '''Model of galois_lfsr_matrix() and fibonacci_lfsr_matrix()
+
+    next_fn is next_galois_lfsr or next_fibonacci_lfsr. The affine transition
+    is returned as a tuple of the images of each state bit (LSB first) and a
+    constant offset rather than the flattened VHDL matrix.
+    '''
+    offset = next_fn(0, tap_map, width, kind)
+    base = ([next_fn(1 << j, tap_map, width, kind) ^ offset for j in range(width)], offset)
+    matrix = ([1 << j for j in range(width)], 0) # Identity
+
+    while steps > 0:
+        if steps & 1:
+            matrix = _compose(base, matrix)
+        steps >>= 1
+        if steps > 0:
+            base = _compose(base, base)
+    return matrix
+
+
+def _apply_linear(cols, state):
+    r = 0
+    for j, c in enumerate(cols):
+        if (state >> j) & 1:
+            r ^= c
+    return r
+
+
+def _compose(a, b):
+    '''Affine map that applies b then a'''
+    return ([_apply_linear(a[0], c) for c in b[0]], _apply_linear(a[0], b[1]) ^ a[1])
+
+
+def leap_lfsr(state, matrix, width):
+    '''Model of leap_lfsr()'''
+    check_width(width)
+    sr, scalar = as_vectors(state)
+    cols, offset = matrix
+    r = np.full_like(sr, U64(offset))
+    for j, c in enumerate(cols):
+        r ^= U64(c) * ((sr >> U64(j)) & U64(1))
+    return result(r, scalar)
+
+
+def jump_galois_lfsr(state, tap_map, width, steps, kind=NORMAL):
+    '''Model of jump_galois_lfsr()'''
+    return leap_lfsr(state, lfsr_matrix(next_galois_lfsr, tap_map, width, steps, kind), width)
+
+
+def jump_fibonacci_lfsr(state, tap_map, width, steps, kind=NORMAL):
+    '''Model of jump_fibonacci_lfsr()'''
+    return leap_lfsr(state, lfsr_matrix(next_fibonacci_lfsr, tap_map, width, steps, kind), width)
+
+
+def to_tap_map(coeffs, map_length, reverse=False):
+    '''Model of to_tap_map()
+
+    Coefficients of 0 are placeholders and are ignored.
+    '''
+    tm = 0
+    for c in coeffs:
+        if c == 0:
+            continue
+        if reverse:
+            tm |= 1 << (c - 1)
+        else:
+            tm |= 1 << (map_length - c)
+    return tm
+
+
+# Coefficients from lfsr_ops.LFSR_COEFF_TABLE indexed by the LFSR size
+LFSR_COEFF_TABLE = [None, None] + [
+    (1,0,0), (1,0,0), (1,0,0), (2,0,0), (1,0,0), (1,0,0),
+    (6,5,1), (4,0,0), (3,0,0), (2,0,0), (7,4,3), (4,3,1),
+    (12,11,1), (1,0,0), (5,3,2), (3,0,0), (7,0,0), (6,5,1),
+    (3,0,0), (2,0,0), (1,0,0), (5,0,0), (4,3,1), (3,0,0),
+    (8,7,1), (8,7,1), (3,0,0), (2,0,0), (16,15,1), (3,0,0),
+    (28,27,1), (13,0,0), (15,14,1), (2,0,0), (11,0,0), (12,10,2),
+    (6,5,1), (4,0,0), (21,19,2), (3,0,0), (23,22,1), (6,5,1),
+    (27,26,1), (4,3,1), (21,20,1), (5,0,0), (28,27,1), (9,0,0),
+    (27,26,1), (16,15,1), (3,0,0), (16,15,1), (37,36,1), (24,0,0),
+    (22,21,1), (7,0,0), (19,0,0), (22,21,1), (1,0,0), (16,15,1),
+    (57,56,1), (1,0,0), (4,3,1), (18,0,0), (10,9,1), (10,9,1),
+    (9,0,0), (29,27,2), (16,15,1), (6,0,0), (53,47,6), (25,0,0),
+    (16,15,1), (11,10,1), (36,35,1), (31,30,1), (20,19,1), (9,0,0),
+    (38,37,1), (4,0,0), (38,35,3), (46,45,1), (13,0,0), (28,27,1),
+    (13,12,1), (13,0,0), (72,71,1), (38,0,0), (19,18,1), (84,83,1),
+    (13,12,1), (2,0,0), (21,0,0), (11,0,0), (49,47,2), (6,0,0),
+    (11,0,0), (47,45,2), (37,0,0), (7,6,1), (6,5,3), (9,0,0), (11,10,1),
+    (16,0,0), (15,0,0), (9,7,4), (31,0,0), (5,4,2), (6,4,1), (10,0,0),
+    (11,6,4), (9,0,0), (11,2,1), (8,7,5), (6,5,2), (5,2,1), (33,0,0),
+    (8,0,0), (9,6,2), (18,0,0), (6,2,1), (2,0,0), (37,0,0), (7,6,5),
+    (7,4,2), (1,0,0), (7,2,1), (5,0,0), (3,0,0), (8,3,2), (29,0,0), (9,8,2),
+    (57,0,0), (11,0,0), (8,3,2), (21,0,0), (8,7,1), (8,5,3), (29,0,0),
+    (13,6,1), (21,0,0), (5,3,2), (7,4,2), (52,0,0), (5,3,2), (11,4,2),
+    (27,0,0), (10,9,7), (53,0,0), (3,0,0), (6,3,2), (1,0,0), (9,5,1),
+    (7,5,4), (9,5,3), (6,5,2), (8,6,5), (31,0,0), (5,3,2), (18,0,0),
+    (8,7,4), (7,6,3), (12,6,5), (9,8,3), (10,3,2), (6,0,0), (16,9,6),
+    (34,0,0), (23,0,0), (6,5,2), (7,0,0), (8,5,2), (13,0,0), (6,0,0),
+    (12,11,9), (8,0,0), (87,0,0), (4,2,1), (12,10,7), (7,6,1), (8,6,1),
+    (56,0,0), (9,8,7), (24,0,0), (9,8,6), (7,6,5), (6,5,2), (6,5,2),
+    (13,6,2), (9,0,0), (15,11,5), (15,0,0), (87,0,0), (8,3,2), (11,9,2),
+    (9,4,2), (65,0,0), (34,0,0), (5,3,2), (14,0,0), (55,0,0), (8,7,1),
+    (10,4,3), (9,5,2), (10,9,5), (43,0,0), (9,3,1), (6,0,0), (12,4,3),
+    (11,10,8), (105,0,0), (6,5,2), (5,3,1), (23,0,0), (7,3,1), (45,0,0),
+    (11,0,0), (8,4,1), (12,10,9), (8,6,2), (8,5,2), (33,0,0), (12,7,2),
+    (32,0,0), (10,7,3), (10,9,4), (12,11,2), (10,4,1), (8,7,6), (26,0,0),
+    (11,9,4), (74,0,0), (31,0,0), (9,6,1), (5,0,0), (7,4,1), (5,2,1),
+    (36,0,0), (8,5,3), (70,0,0), (11,6,1), (8,5,1), (9,4,1), (6,4,1),
+    (11,2,1), (82,0,0), (15,14,10), (86,0,0), (103,0,0), (7,4,2), (67,0,0),
+    (7,3,2), (7,2,1), (52,0,0), (10,5,2)
+]
+
+def lfsr_taps(size):
+    '''Model of lfsr_taps()'''
+    if size < 2 or size >= len(LFSR_COEFF_TABLE):
+        raise ValueError('Size is out of range for predefined LCAR rules')
+    return to_tap_map(LFSR_COEFF_TABLE[size], size - 1)
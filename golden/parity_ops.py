@@ -0,0 +1,36 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''VHDL-extras library
+   Reference model of parity_ops
+'''
+
+# Copyright © 2014 Kevin Thibedeau
+
+# This file is part of VHDL-extras.
+
+from __future__ import print_function, division
+
+from golden.bits import U64, as_vectors, result
+from golden import bits
+
+EVEN = 'even'
+ODD = 'odd'
+
+
+def parity(ptype, val):
+    '''Model of parity()
+
+    Leading zeros don't change the parity so no width is needed.
+    '''
+    val, scalar = as_vectors(val)
+    p = bits.parity(val)
+    if ptype == ODD:
+        p ^= U64(1)
+    return result(p, scalar)
+
+
+def check_parity(ptype, val, parity_bit):
+    '''Model of check_parity(). Returns booleans.'''
+    p = parity(ptype, val)
+    return p == parity_bit
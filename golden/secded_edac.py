@@ -0,0 +1,62 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''VHDL-extras library
+   Reference model of secded_edac
+
+   Encoded data is the Hamming encoding shifted left with the overall
+   parity bit in the LSB.
+'''
+
+# Copyright © 2014 Kevin Thibedeau
+
+# This file is part of VHDL-extras.
+
+from __future__ import print_function, division
+
+from golden.bits import U64, mask, as_vectors, result, check_width
+from golden import bits
+from golden.hamming_edac import hamming_message_size, hamming_parity_size, \
+    hamming_encode, hamming_decode, hamming_syndrome
+
+
+def secded_message_size(data_size):
+    '''Model of secded_message_size()'''
+    return hamming_message_size(data_size) + 1
+
+def secded_parity_size(message_size):
+    '''Model of secded_parity_size()'''
+    return hamming_parity_size(message_size - 1) + 1
+
+def secded_data_size(message_size):
+    '''Model of secded_data_size()'''
+    return message_size - secded_parity_size(message_size)
+
+
+def secded_encode(data, data_size):
+    '''Model of secded_encode()'''
+    check_width(secded_message_size(data_size))
+    h, scalar = as_vectors(hamming_encode(data, data_size))
+    return result((h << U64(1)) | bits.parity(h), scalar)
+
+
+def secded_decode(encoded, data_size):
+    '''Model of secded_decode()'''
+    check_width(secded_message_size(data_size))
+    encoded, scalar = as_vectors(encoded)
+    return result(hamming_decode(encoded >> U64(1), data_size), scalar)
+
+
+def secded_has_errors(encoded, data_size):
+    '''Model of secded_has_errors()
+
+    Returns a tuple of booleans for single-bit and double-bit errors.
+    '''
+    check_width(secded_message_size(data_size))
+    encoded, scalar = as_vectors(encoded)
+    encoded &= U64(mask(secded_message_size(data_size)))
+    single = bits.parity(encoded) == 1
+    double = ~single & (hamming_syndrome(encoded >> U64(1), data_size) != 0)
+    if scalar:
+        return bool(single[0]), bool(double[0])
+    return single, double
@@ -42,6 +42,21 @@
 --#  produce additional padding bits in the file. Sign extension is performed
 --#  when writing padded signed arrays.
 --#
+--#  A file of words written with the same width and endianness can serve as
+--#  a compact vector file for streaming stimulus into and responses out of a
+--#  testbench. The test/vector_file.py module reads and writes this format.
+--#
+--#  Large files can be moved in blocks with the octet_vector procedures and
+--#  the word block procedures. An octet_file holds scalar octets so it can
+--#  only be transferred one octet per file operation. The octet_vector
+--#  procedures are a convenience that loops over the octets and they are no
+--#  faster than reading or writing each octet directly. A block of words is
+--#  packed into one unsigned vector with the first word in the least
+--#  significant bits. The word block procedures are faster than the single
+--#  word procedures because they pack or unpack all of the words in one pass
+--#  without a resize and endianness dispatch for each word. The octets
+--#  themselves are still transferred one at a time.
+--#
 --# EXAMPLE USAGE:
 --#  file fh : octet_file open read_mode is "foo.bin";
 --#  signal uword : unsigned(15 downto 0);
@@ -49,9 +64,22 @@
 --#  ...
 --#  read(fh, little_endian, uword); -- read 16 bits from two octets
 --#  read(fh, big_endian, sword);    -- read 20 bits from three octets
+--#
+--#  -- Read up to 1024 12-bit words in one call
+--#  variable samples : unsigned(1024*12-1 downto 0);
+--#  variable count   : natural;
+--#  read(fh, little_endian, 12, samples, count);
+--#
+--#  -- Apply stimulus vectors until the end of the file
+--#  while not endfile(stim) loop
+--#    read(stim, little_endian, stim_word);
+--#    ...
+--#    write(resp, little_endian, resp_word);
+--#  end loop;
 --------------------------------------------------------------------
 
 library ieee;
+use ieee.std_logic_1164.all;
 use ieee.numeric_bit.all;
 
 package binaryio is
@@ -63,6 +91,9 @@ package binaryio is
   --# File of 8-bit bytes.
   type octet_file is file of octet;
 
+  --# Array of 8-bit bytes.
+  type octet_vector is array (natural range <>) of octet;
+
   --# Endianness of multi-byte words.
   --#
   --# * little-endian = least significant octet first : 1234, 123, etc.
@@ -99,12 +130,65 @@ package binaryio is
   --#  Word:        Data to write into the file. Will be sign extended if not a multiple of 8-bits.
   procedure write( file Fh : octet_file; Octet_order : endianness; Word : signed );
 
+  --## Read binary data into a std_ulogic_vector.
+  --# Args:
+  --#  Fh:          File handle
+  --#  Octet_order: Endianness of the octets
+  --#  Word:        Data read from the file
+  procedure read( file Fh : octet_file; Octet_order : endianness;
+    Word : out std_ulogic_vector );
+
+  --## Write a std_ulogic_vector to a file. Metavalues are written as '0'.
+  --# Args:
+  --#  Fh:          File handle
+  --#  Octet_order: Endianness of the octets
+  --#  Word:        Data to write into the file
+  procedure write( file Fh : octet_file; Octet_order : endianness;
+    Word : std_ulogic_vector );
+
+  --%% Block read and write procedures
+
+  --## Read octets until the vector is full or the end of the file is reached.
+  --#  Each octet is a separate file read.
+  --# Args:
+  --#  Fh:     File handle
+  --#  Octets: Data read from the file
+  --#  Length: Number of octets read
+  procedure read( file Fh : octet_file; Octets : out octet_vector; Length : out natural );
+
+  --## Write all octets of a vector to a file. Each octet is a separate
+  --#  file write.
+  --# Args:
+  --#  Fh:     File handle
+  --#  Octets: Data to write into the file
+  procedure write( file Fh : octet_file; Octets : octet_vector );
+
+  --## Read a block of words packed into an unsigned vector. The first word
+  --#  is placed in the least significant bits. Reading stops early at the
+  --#  end of the file.
+  --# Args:
+  --#  Fh:          File handle
+  --#  Octet_order: Endianness of the octets in each word
+  --#  Word_size:   Number of bits in each word
+  --#  Words:       Data read from the file. Length must be a multiple of Word_size.
+  --#  Count:       Number of words read
+  procedure read( file Fh : octet_file; Octet_order : endianness; Word_size : positive;
+    Words : out unsigned; Count : out natural );
+
+  --## Write a block of words packed into an unsigned vector. The first word
+  --#  is taken from the least significant bits.
+  --# Args:
+  --#  Fh:          File handle
+  --#  Octet_order: Endianness of the octets in each word
+  --#  Word_size:   Number of bits in each word
+  --#  Words:       Data to write into the file. Length must be a multiple of Word_size.
+  procedure write( file Fh : octet_file; Octet_order : endianness; Word_size : positive;
+    Words : unsigned );
+
 end package;
 
 package body binaryio is
 
-  type octet_vector is array (natural range <>) of octet;
-
   --## Read an unsigned value
   procedure read( file Fh : octet_file; Octet_order : endianness;
     Word : out unsigned ) is
@@ -196,4 +280,122 @@ package body binaryio is
 
   end procedure;
 
+
+  --## Read a std_ulogic_vector value
+  procedure read( file Fh : octet_file; Octet_order : endianness;
+    Word : out std_ulogic_vector ) is
+
+    variable word_uns : unsigned(Word'length-1 downto 0);
+  begin
+    read(Fh, Octet_order, word_uns);
+    Word := to_stdulogicvector(bit_vector(word_uns));
+  end procedure;
+
+  --## Write a std_ulogic_vector value
+  procedure write( file Fh : octet_file; Octet_order : endianness;
+    Word : std_ulogic_vector ) is
+  begin
+    write(Fh, Octet_order, unsigned(to_bitvector(Word)));
+  end procedure;
+
+
+  --## Read a block of octets
+  procedure read( file Fh : octet_file; Octets : out octet_vector; Length : out natural ) is
+    variable count : natural := 0;
+  begin
+    for i in Octets'range loop
+      exit when endfile(Fh);
+      read(Fh, Octets(i));
+      count := count + 1;
+    end loop;
+
+    Length := count;
+  end procedure;
+
+  --## Write a block of octets
+  procedure write( file Fh : octet_file; Octets : octet_vector ) is
+  begin
+    for i in Octets'range loop
+      write(Fh, Octets(i));
+    end loop;
+  end procedure;
+
+
+  --## Read a block of unsigned words
+  procedure read( file Fh : octet_file; Octet_order : endianness; Word_size : positive;
+    Words : out unsigned; Count : out natural ) is
+
+    constant NUM_OCTETS : positive := (Word_size - 1)/8 + 1;
+    constant NUM_WORDS  : natural := Words'length / Word_size;
+
+    variable octets : octet_vector(0 to NUM_WORDS*NUM_OCTETS-1);
+    variable octets_read : natural;
+    variable words_read  : natural;
+    variable word_aligned : unsigned(NUM_OCTETS*8-1 downto 0);
+    variable block_data : unsigned(NUM_WORDS*Word_size-1 downto 0) := (others => '0');
+    variable ix : natural;
+  begin
+    assert Words'length mod Word_size = 0
+      report "Words length must be a multiple of Word_size"
+      severity failure;
+
+    read(Fh, octets, octets_read);
+    words_read := octets_read / NUM_OCTETS;
+
+    if octets_read mod NUM_OCTETS /= 0 then
+      report "End of file reached before read completed"
+        severity error;
+    end if;
+
+    for w in 0 to words_read-1 loop
+      for o in 0 to NUM_OCTETS-1 loop
+        if Octet_order = little_endian then
+          ix := w*NUM_OCTETS + o;
+        else -- big-endian
+          ix := w*NUM_OCTETS + NUM_OCTETS-1 - o;
+        end if;
+
+        word_aligned(o*8+7 downto o*8) := to_unsigned(octet'pos(octets(ix)), 8);
+      end loop;
+
+      block_data((w+1)*Word_size-1 downto w*Word_size) := word_aligned(Word_size-1 downto 0);
+    end loop;
+
+    Words := block_data;
+    Count := words_read;
+  end procedure;
+
+  --## Write a block of unsigned words
+  procedure write( file Fh : octet_file; Octet_order : endianness; Word_size : positive;
+    Words : unsigned ) is
+
+    constant NUM_OCTETS : positive := (Word_size - 1)/8 + 1;
+    constant NUM_WORDS  : natural := Words'length / Word_size;
+
+    alias words_desc : unsigned(Words'length-1 downto 0) is Words;
+    variable octets : octet_vector(0 to NUM_WORDS*NUM_OCTETS-1);
+    variable word_aligned : unsigned(NUM_OCTETS*8-1 downto 0);
+    variable ix : natural;
+  begin
+    assert Words'length mod Word_size = 0
+      report "Words length must be a multiple of Word_size"
+      severity failure;
+
+    for w in 0 to NUM_WORDS-1 loop
+      word_aligned := resize(words_desc((w+1)*Word_size-1 downto w*Word_size), word_aligned'length);
+
+      for o in 0 to NUM_OCTETS-1 loop
+        if Octet_order = little_endian then
+          ix := w*NUM_OCTETS + o;
+        else -- big-endian
+          ix := w*NUM_OCTETS + NUM_OCTETS-1 - o;
+        end if;
+
+        octets(ix) := octet'val(to_integer(word_aligned(o*8+7 downto o*8)));
+      end loop;
+    end loop;
+
+    write(Fh, octets);
+  end procedure;
+
 end package body;
@@ -75,6 +75,28 @@
 --#    end loop;
 --#    crc := end_crc(crc, reflect_out, xor_out);
 --#
+--#  Data that comes in whole bytes can be processed faster in simulation with
+--#  next_crc_bytes. It uses a lookup table generated once for a polynomial by
+--#  the crc_table function. The table can be split into several slices that
+--#  each cover one byte of a group so that multiple bytes are processed with
+--#  each set of lookups. The result is the same as next_crc.
+--#
+--#    constant CRC_TABLE : bit_vector := crc_table(poly, 4); -- Slice-by-4
+--#    ...
+--#    crc := init_crc(xor_in);
+--#    for i in data'range loop
+--#      crc := next_crc_bytes(crc, CRC_TABLE, reflect_in, data(i));
+--#    end loop;
+--#    crc := end_crc(crc, reflect_out, xor_out);
+--#
+--#  next_crc is linear over GF(2) so the new state for a fixed data width can
+--#  be expressed as a matrix that selects the state and data bits XORed into
+--#  each bit of the result. The crc_matrix function derives this matrix as a
+--#  constant and next_crc_parallel applies it. Each result bit is then a single
+--#  XOR tree rather than the long chain produced by unrolling the serial
+--#  algorithm. The parallel_crc component uses these to process wide data
+--#  words every clock cycle with an optional pipeline stage.
+--#
 --#  A synthesizable component is provided to serve as a guide to using these
 --#  functions in practical designs. The input data port has been left unconstrained
 --#  to allow variable sized data to be fed into the CRC. Limiting its width to
@@ -127,6 +149,48 @@ package crc_ops is
   function next_crc(Crc : bit_vector; Poly : bit_vector; Reflect_in : boolean;
     Data : bit_vector) return bit_vector;
 
+  --## Generate a lookup table for next_crc_bytes. The result contains Slices
+  --#  tables of 256 entries that are each Poly'length bits wide.
+  --# Args:
+  --#   Poly:   Polynomial for the CRC
+  --#   Slices: Number of bytes processed with each group of lookups
+  --# Returns:
+  --#   Lookup table.
+  function crc_table(Poly : bit_vector; Slices : positive := 1) return bit_vector;
+
+  --## Add new data to the CRC using a lookup table from crc_table.
+  --# Args:
+  --#   Crc:        Current CRC state
+  --#   Table:      Lookup table for the polynomial
+  --#   Reflect_in: Reverse bits of Data when true
+  --#   Data:       Next data word to add to CRC. Length must be a multiple of 8.
+  --# Returns:
+  --#   New state of CRC.
+  function next_crc_bytes(Crc : bit_vector; Table : bit_vector; Reflect_in : boolean;
+    Data : bit_vector) return bit_vector;
+
+  --## Generate the XOR matrix for a CRC processing Data_width bits at a time.
+  --#  Row i selects the bits combined into bit i of the new state. The
+  --#  first Poly'length columns of a row select bits of the current state and
+  --#  the remaining Data_width columns select bits of the data.
+  --# Args:
+  --#   Poly:       Polynomial for the CRC
+  --#   Data_width: Number of data bits processed at once
+  --# Returns:
+  --#   Matrix with Poly'length rows of Poly'length + Data_width bits.
+  function crc_matrix(Poly : bit_vector; Data_width : positive) return bit_vector;
+
+  --## Add new data to the CRC using a matrix from crc_matrix.
+  --# Args:
+  --#   Crc:        Current CRC state
+  --#   Matrix:     XOR matrix for the polynomial and data width
+  --#   Reflect_in: Reverse bits of Data when true
+  --#   Data:       Next data word to add to CRC
+  --# Returns:
+  --#   New state of CRC.
+  function next_crc_parallel(Crc : bit_vector; Matrix : bit_vector; Reflect_in : boolean;
+    Data : bit_vector) return bit_vector;
+
   --## Finalize the CRC.
   --# Args:
   --#  Crc:         Current CRC state
@@ -164,6 +228,36 @@ package crc_ops is
     );
   end component;
 
+  --## Calculate a CRC over a full data word every clock cycle. The CRC
+  --#  parameters are fixed by generics so that the XOR matrix is a constant.
+  --#  When PIPELINE is true the contribution of Data is computed in a separate
+  --#  register stage ahead of the CRC feedback loop. This adds one cycle of
+  --#  latency.
+  component parallel_crc is
+    generic (
+      POLY        : bit_vector; --# Polynomial
+      XOR_IN      : bit_vector; --# Invert (XOR) initial state
+      XOR_OUT     : bit_vector; --# Invert (XOR) final state
+      REFLECT_IN  : boolean;    --# Swap input bit order
+      REFLECT_OUT : boolean;    --# Swap output bit order
+      PIPELINE    : boolean := false; --# Register the data contribution
+      RESET_ACTIVE_LEVEL : std_ulogic := '1' --# Asynch. reset control level
+    );
+    port (
+      --# {{clocks|}}
+      Clock : in std_ulogic; --# System clock
+      Reset : in std_ulogic; --# Asynchronous reset
+
+      --# {{control|}}
+      Initialize : in std_ulogic;      --# Reset the CRC state
+
+      --# {{data|}}
+      Enable   : in std_ulogic;        --# Indicates data is valid for next CRC update
+      Data     : in std_ulogic_vector; --# New data
+      Checksum : out std_ulogic_vector --# Computed CRC
+    );
+  end component;
+
 end package;
 
 package body crc_ops is
@@ -182,6 +276,35 @@ package body crc_ops is
     return result;
   end function;
 
+  --// Convert a byte to an integer
+  function to_index(v : bit_vector) return natural is
+    variable result : natural := 0;
+  begin
+    for i in v'range loop
+      result := result * 2;
+      if v(i) = '1' then
+        result := result + 1;
+      end if;
+    end loop;
+    return result;
+  end function;
+
+  --// Convert an integer to a byte
+  function to_byte(n : natural) return bit_vector is
+    variable result : bit_vector(7 downto 0);
+    variable nv : natural := n;
+  begin
+    for i in result'reverse_range loop
+      if nv mod 2 = 1 then
+        result(i) := '1';
+      else
+        result(i) := '0';
+      end if;
+      nv := nv / 2;
+    end loop;
+    return result;
+  end function;
+
 
 -- PUBLIC:
 -- =======
@@ -220,6 +343,140 @@ package body crc_ops is
     return sreg;
   end function;
 
+  --## Generate a lookup table for next_crc_bytes
+  function crc_table(Poly : bit_vector; Slices : positive := 1) return bit_vector is
+    constant WIDTH : positive := Poly'length;
+    variable table : bit_vector(0 to Slices*256*WIDTH-1);
+    variable data  : bit_vector(Slices*8-1 downto 0);
+    variable zero  : bit_vector(WIDTH-1 downto 0) := (others => '0');
+    variable ix    : natural;
+  begin
+    -- Entry x of slice k is the CRC of byte x followed by Slices-1-k zero bytes
+    for k in 0 to Slices-1 loop
+      for x in 0 to 255 loop
+        data := (others => '0');
+        data((Slices-k)*8-1 downto (Slices-k-1)*8) := to_byte(x);
+        ix := (k*256 + x) * WIDTH;
+        table(ix to ix+WIDTH-1) := next_crc(zero, Poly, false, data);
+      end loop;
+    end loop;
+
+    return table;
+  end function;
+
+  --## Add new data to the CRC using a lookup table
+  function next_crc_bytes(Crc : bit_vector; Table : bit_vector; Reflect_in : boolean;
+    Data : bit_vector) return bit_vector is
+    constant WIDTH  : positive := Crc'length;
+    constant SLICES : natural := Table'length / (256*WIDTH);
+    alias table_a : bit_vector(0 to Table'length-1) is Table;
+
+    variable sreg : bit_vector(WIDTH-1 downto 0) := Crc;
+    variable d : bit_vector(Data'length-1 downto 0) := Data;
+    variable grp : bit_vector(SLICES*8-1 downto 0);
+    variable pos, bytes, gbits, ix : natural;
+  begin
+    assert Data'length mod 8 = 0 report "Data must be a multiple of 8-bits" severity failure;
+    assert SLICES > 0 and Table'length = SLICES*256*WIDTH
+      report "Mismatched table and CRC state size" severity failure;
+
+    if Reflect_in then
+      d := reversed(d);
+    end if;
+
+    -- Process groups of up to SLICES bytes from the left
+    pos := d'length;
+    while pos > 0 loop
+      bytes := pos / 8;
+      if bytes > SLICES then
+        bytes := SLICES;
+      end if;
+      gbits := bytes * 8;
+
+      -- Combine the leading bits of the CRC with the data
+      grp(gbits-1 downto 0) := d(pos-1 downto pos-gbits);
+      if WIDTH <= gbits then
+        grp(gbits-1 downto gbits-WIDTH) := grp(gbits-1 downto gbits-WIDTH) xor sreg;
+        sreg := (others => '0');
+      else
+        grp(gbits-1 downto 0) := grp(gbits-1 downto 0) xor sreg(WIDTH-1 downto WIDTH-gbits);
+        sreg(WIDTH-1 downto gbits) := sreg(WIDTH-gbits-1 downto 0);
+        sreg(gbits-1 downto 0) := (others => '0');
+      end if;
+
+      -- Partial groups use the slices for the trailing bytes
+      for k in 0 to bytes-1 loop
+        ix := ((SLICES-bytes+k)*256 + to_index(grp(gbits-8*k-1 downto gbits-8*k-8))) * WIDTH;
+        sreg := sreg xor table_a(ix to ix+WIDTH-1);
+      end loop;
+
+      pos := pos - gbits;
+    end loop;
+
+    return sreg;
+  end function;
+
+  --## Generate the XOR matrix for a parallel CRC
+  function crc_matrix(Poly : bit_vector; Data_width : positive) return bit_vector is
+    constant WIDTH : positive := Poly'length;
+    constant COLS  : positive := WIDTH + Data_width;
+    variable matrix : bit_vector(0 to WIDTH*COLS-1);
+    variable unit_crc, zero_crc : bit_vector(WIDTH-1 downto 0) := (others => '0');
+    variable unit_data, zero_data : bit_vector(Data_width-1 downto 0) := (others => '0');
+    variable col : bit_vector(WIDTH-1 downto 0);
+  begin
+    -- next_crc is linear so each column is the result for a single set bit
+    for j in 0 to COLS-1 loop
+      if j < WIDTH then
+        unit_crc := zero_crc;
+        unit_crc(j) := '1';
+        col := next_crc(unit_crc, Poly, false, zero_data);
+      else
+        unit_data := zero_data;
+        unit_data(j-WIDTH) := '1';
+        col := next_crc(zero_crc, Poly, false, unit_data);
+      end if;
+
+      for i in col'range loop
+        matrix(i*COLS + j) := col(i);
+      end loop;
+    end loop;
+
+    return matrix;
+  end function;
+
+  --## Add new data to the CRC using an XOR matrix
+  function next_crc_parallel(Crc : bit_vector; Matrix : bit_vector; Reflect_in : boolean;
+    Data : bit_vector) return bit_vector is
+    constant WIDTH : positive := Crc'length;
+    constant COLS  : positive := WIDTH + Data'length;
+    alias matrix_a : bit_vector(0 to Matrix'length-1) is Matrix;
+
+    variable d : bit_vector(Data'length-1 downto 0) := Data;
+    variable inputs : bit_vector(COLS-1 downto 0);
+    variable result : bit_vector(WIDTH-1 downto 0);
+    variable b : bit;
+  begin
+    assert Matrix'length = WIDTH*COLS
+      report "Mismatched matrix and CRC state or data size" severity failure;
+
+    if Reflect_in then
+      d := reversed(d);
+    end if;
+
+    inputs := d & Crc;
+
+    for i in result'range loop
+      b := '0';
+      for j in inputs'range loop
+        b := b xor (matrix_a(i*COLS + j) and inputs(j));
+      end loop;
+      result(i) := b;
+    end loop;
+
+    return result;
+  end function;
+
   --## Finalize the CRC
   function end_crc(Crc : bit_vector; Reflect_out: boolean; Xor_out : bit_vector)
     return bit_vector is
@@ -292,3 +549,88 @@ begin
   end process;
 
 end architecture;
+
+
+
+library ieee;
+use ieee.std_logic_1164.all;
+
+library extras;
+use extras.crc_ops.all;
+
+entity parallel_crc is
+  generic (
+    POLY        : bit_vector;
+    XOR_IN      : bit_vector;
+    XOR_OUT     : bit_vector;
+    REFLECT_IN  : boolean;
+    REFLECT_OUT : boolean;
+    PIPELINE    : boolean := false;
+    RESET_ACTIVE_LEVEL : std_ulogic := '1'
+  );
+  port (
+    Clock : in std_ulogic;
+    Reset : in std_ulogic;
+
+    Initialize : in std_ulogic;      -- Reset the CRC state
+
+    Enable   : in std_ulogic;        -- Indicates data is valid for next CRC update
+    Data     : in std_ulogic_vector; -- New data
+    Checksum : out std_ulogic_vector -- Computed CRC
+  );
+end entity;
+
+
+architecture rtl of parallel_crc is
+  constant MATRIX : bit_vector := crc_matrix(POLY, Data'length);
+
+  constant ZERO_CRC  : bit_vector(POLY'length-1 downto 0) := (others => '0');
+  constant ZERO_DATA : bit_vector(Data'length-1 downto 0) := (others => '0');
+
+  signal crc_reg   : bit_vector(POLY'length-1 downto 0);
+  signal data_term : bit_vector(POLY'length-1 downto 0); -- Contribution of Data to the new state
+  signal update, init : std_ulogic;
+begin
+
+  -- The data columns of the matrix only depend on Data so they can be
+  -- computed ahead of the feedback loop through crc_reg
+  pl: if PIPELINE generate
+    dr: process(Clock, Reset) is
+    begin
+      if Reset = RESET_ACTIVE_LEVEL then
+        data_term <= (others => '0');
+        update <= '0';
+        init <= '0';
+      elsif rising_edge(Clock) then
+        data_term <= next_crc_parallel(ZERO_CRC, MATRIX, REFLECT_IN, to_bitvector(Data));
+        update <= Enable;
+        init <= Initialize;
+      end if;
+    end process;
+  end generate;
+
+  no_pl: if not PIPELINE generate
+    data_term <= next_crc_parallel(ZERO_CRC, MATRIX, REFLECT_IN, to_bitvector(Data));
+    update <= Enable;
+    init <= Initialize;
+  end generate;
+
+  r: process(Clock, Reset) is
+    variable crc_reg_v : bit_vector(crc_reg'range);
+  begin
+    if Reset = RESET_ACTIVE_LEVEL then
+      crc_reg <= (others => '0');
+      Checksum <= (Checksum'range => '0');
+    elsif rising_edge(Clock) then
+      crc_reg_v := crc_reg;
+      if init = '1' then
+        crc_reg_v := init_crc(XOR_IN);
+      elsif update = '1' then
+        crc_reg_v := next_crc_parallel(crc_reg, MATRIX, false, ZERO_DATA) xor data_term;
+      end if;
+      crc_reg <= crc_reg_v;
+      Checksum <= to_stdulogicvector(end_crc(crc_reg_v, REFLECT_OUT, XOR_OUT));
+    end if;
+  end process;
+
+end architecture;
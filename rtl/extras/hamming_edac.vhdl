@@ -126,6 +126,22 @@
 --#    parity_bits    := hamming_parity(message); -- also acts as the syndrome
 --#    hamming_word   <= hamming_encode(word, parity_bits);
 --#    corrected_word <= hamming_decode(message, parity_bits);
+--#
+--#  TABLE DRIVEN CODING: The standard functions derive the parity bits from
+--#  an interleaved message on every call. The parity check matrix only
+--#  depends on the data size so it can be computed once as a constant with
+--#  hamming_matrix(). Column k of the matrix is the message position of data
+--#  bit k. The parity bits are the XOR of the columns for all data bits that
+--#  are '1' and no interleaving is needed. The syndrome is the parity of the
+--#  received data XORed with the received parity bits. A constant table from
+--#  hamming_syndrome_table() maps a syndrome to the data bit that needs to be
+--#  corrected:
+--#    constant MATRIX : bit_vector := hamming_matrix(word'length);
+--#    constant SYN_TABLE : syndrome_table := hamming_syndrome_table(word'length);
+--#    ...
+--#    hamming_word <= hamming_encode(word, MATRIX);
+--#    corrected_word <= hamming_decode(hamming_word, MATRIX, SYN_TABLE);
+--#    if hamming_has_error(hamming_syndrome(hamming_word, MATRIX)) then ...
 --------------------------------------------------------------------
 
 library ieee;
@@ -143,6 +159,10 @@ package hamming_edac is
     right : integer;
   end record;
 
+  --## Map from a syndrome to the index of a data bit with an error. Syndromes
+  --#  that don't correspond to a data bit map to -1.
+  type syndrome_table is array( natural range <> ) of integer;
+
   --## Convert a plain vector into ecc_vector.
   --# Args:
   --#   Arg: Vector to convert
@@ -294,6 +314,61 @@ package hamming_edac is
   --#   true if message has a parity error.
   function hamming_has_error( Syndrome : unsigned ) return boolean;
 
+  --%% Table driven encode and decode functions
+
+  --## Build the parity check matrix for the data bits. Column k holds the
+  --#  message position of data bit k with its LSB first.
+  --# Args:
+  --#   Data_size: Number of data bits
+  --# Returns:
+  --#   Flattened matrix with Data_size columns of parity size bits.
+  function hamming_matrix( Data_size : positive ) return bit_vector;
+
+  --## Build a table mapping each syndrome to the data bit in error.
+  --# Args:
+  --#   Data_size: Number of data bits
+  --# Returns:
+  --#   Table indexed by syndrome values.
+  function hamming_syndrome_table( Data_size : positive ) return syndrome_table;
+
+  --## Generate Hamming parity bits directly from the data using a parity
+  --#  check matrix.
+  --# Args:
+  --#   Data: Raw data
+  --#   Matrix: Matrix from hamming_matrix()
+  --# Returns:
+  --#   Parity bits.
+  function hamming_parity( Data : std_ulogic_vector; Matrix : bit_vector ) return unsigned;
+
+  --## Encode the supplied data into an ecc_vector using a parity check
+  --#  matrix.
+  --# Args:
+  --#   Data: Raw data
+  --#   Matrix: Matrix from hamming_matrix()
+  --# Returns:
+  --#   Encoded data with parity.
+  function hamming_encode( Data : std_ulogic_vector; Matrix : bit_vector ) return ecc_vector;
+
+  --## Compute the syndrome of an ecc_vector using a parity check matrix.
+  --# Args:
+  --#   Encoded_data: Encoded (uninterleaved) message
+  --#   Matrix: Matrix from hamming_matrix()
+  --# Returns:
+  --#   Syndrome that is nonzero when there is an error.
+  function hamming_syndrome( Encoded_data : ecc_vector; Matrix : bit_vector ) return unsigned;
+
+  --## Decode an ecc_vector into the plain data bits, potentially correcting
+  --#  a single-bit error if a bit has flipped. This version uses a parity
+  --#  check matrix and syndrome table.
+  --# Args:
+  --#   Encoded_data: Encoded (uninterleaved) message
+  --#   Matrix: Matrix from hamming_matrix()
+  --#   Table: Table from hamming_syndrome_table()
+  --# Returns:
+  --#   Decoded data.
+  function hamming_decode( Encoded_data : ecc_vector; Matrix : bit_vector;
+    Table : syndrome_table ) return std_ulogic_vector;
+
 end package;
 
 
@@ -605,4 +680,104 @@ package body hamming_edac is
     return Syndrome /= 0;
   end function;
 
+
+  --## Build the parity check matrix for the data bits
+  function hamming_matrix( Data_size : positive ) return bit_vector is
+    constant MSG_SIZE : positive := hamming_message_size(Data_size);
+    constant PSIZE : positive := hamming_parity_size(MSG_SIZE);
+
+    variable matrix : bit_vector(0 to Data_size*PSIZE-1) := (others => '0');
+    variable data_ix : natural := 0;
+  begin
+    for pos in 1 to MSG_SIZE loop
+      if 2**ceil_log2(pos) /= pos then -- not power of 2, this is a data bit
+        for j in 0 to PSIZE-1 loop
+          if (pos / 2**j) mod 2 = 1 then
+            matrix(data_ix*PSIZE + j) := '1';
+          end if;
+        end loop;
+        data_ix := data_ix + 1;
+      end if;
+    end loop;
+
+    return matrix;
+  end function;
+
+  --## Build a table mapping each syndrome to the data bit in error
+  function hamming_syndrome_table( Data_size : positive ) return syndrome_table is
+    constant MSG_SIZE : positive := hamming_message_size(Data_size);
+
+    variable table : syndrome_table(0 to 2**hamming_parity_size(MSG_SIZE)-1) := (others => -1);
+    variable data_ix : natural := 0;
+  begin
+    for pos in 1 to MSG_SIZE loop
+      if 2**ceil_log2(pos) /= pos then -- not power of 2, this is a data bit
+        table(pos) := data_ix;
+        data_ix := data_ix + 1;
+      end if;
+    end loop;
+
+    return table;
+  end function;
+
+  --## Generate Hamming parity bits directly from the data using a parity
+  --#  check matrix.
+  function hamming_parity( Data : std_ulogic_vector; Matrix : bit_vector ) return unsigned is
+    constant PSIZE : positive := Matrix'length / Data'length;
+
+    alias data_asc : std_ulogic_vector(0 to Data'length-1) is Data;
+    alias mx : bit_vector(0 to Matrix'length-1) is Matrix;
+    variable pb : bit_vector(0 to PSIZE-1) := (others => '0');
+    variable result : unsigned(PSIZE downto 1);
+  begin
+    assert Matrix'length = Data'length * PSIZE
+      report "Matrix size does not match data size"
+      severity failure;
+
+    -- The data is in descending order so the rightmost bit is data bit 0
+    for k in 0 to Data'length-1 loop
+      if data_asc(Data'length-1 - k) = '1' then
+        pb := pb xor mx(k*PSIZE to k*PSIZE + PSIZE-1);
+      end if;
+    end loop;
+
+    for j in pb'range loop
+      result(j+1) := to_stdulogic(pb(j));
+    end loop;
+
+    return result;
+  end function;
+
+  --## Encode the supplied data into an ecc_vector using a parity check
+  --#  matrix.
+  function hamming_encode( Data : std_ulogic_vector; Matrix : bit_vector ) return ecc_vector is
+  begin
+    return hamming_encode(Data, hamming_parity(Data, Matrix));
+  end function;
+
+  --## Compute the syndrome of an ecc_vector using a parity check matrix
+  function hamming_syndrome( Encoded_data : ecc_vector; Matrix : bit_vector ) return unsigned is
+  begin
+    return hamming_parity(get_data(Encoded_data), Matrix) xor get_parity(Encoded_data);
+  end function;
+
+  --## Decode an ecc_vector into the plain data bits, potentially correcting
+  --#  a single-bit error if a bit has flipped. This version uses a parity
+  --#  check matrix and syndrome table.
+  function hamming_decode( Encoded_data : ecc_vector; Matrix : bit_vector;
+    Table : syndrome_table ) return std_ulogic_vector is
+
+    variable data : std_ulogic_vector(Encoded_data'high downto 0);
+    variable data_ix : integer;
+  begin
+    data := get_data(Encoded_data);
+    data_ix := Table(to_integer(hamming_syndrome(Encoded_data, Matrix)));
+
+    if data_ix >= 0 then -- Correct the bad bit
+      data(data_ix) := not data(data_ix);
+    end if;
+
+    return data;
+  end function;
+
 end package body;
@@ -218,116 +218,276 @@ package body lcar_ops is
   -- as constants in lfsr_ops.
 
   -- NOTE: These constants were taken from a PDF that showed signs of being OCR
-  -- generated. Many 1's were listed as l's and a 0 was shown as a G. There may
-  -- be other latent errors.
+  -- generated. Many 1's were listed as l's and a 0 was shown as a G. All of
+  -- the entries have since been checked for maximal length with
+  -- scripts/maxlen_tables.py.
+
+  -- The entries above 100 were found by scripts/maxlen_tables.py with a
+  -- random search for rules with a primitive characteristic polynomial.
   
   -- The rules in the table have been padded out with '-' to make all strings
   -- the same length. Use the lcar_rule(Size) function to index and strip the
   -- don't cares from these predefined rules.
 
-  subtype lcar_table_entry is std_ulogic_vector(1 to 100);
+  subtype lcar_table_entry is std_ulogic_vector(1 to 256);
   type lcar_rule_list is array( natural range <> ) of lcar_table_entry;
 
-  constant LCAR_RULE_TABLE : lcar_rule_list(2 to 100) := (
-    "10--------------------------------------------------------------------------------------------------", -- 2
-    "110-------------------------------------------------------------------------------------------------", -- 3
-    "0101------------------------------------------------------------------------------------------------", -- 4
-    "01111-----------------------------------------------------------------------------------------------", -- 5
-    "000110----------------------------------------------------------------------------------------------", -- 6
-    "1011001---------------------------------------------------------------------------------------------", -- 7
-    "01001011--------------------------------------------------------------------------------------------", -- 8
-    "010011100-------------------------------------------------------------------------------------------", -- 9
-    "1111000011------------------------------------------------------------------------------------------", -- 10
-    "01000011010-----------------------------------------------------------------------------------------", -- 11
-    "100101010011----------------------------------------------------------------------------------------", -- 12
-    "0111001110110---------------------------------------------------------------------------------------", -- 13
-    "01000111001111--------------------------------------------------------------------------------------", -- 14
-    "100000011000001-------------------------------------------------------------------------------------", -- 15
-    "0001111001001000------------------------------------------------------------------------------------", -- 16
-    "10011000110011001-----------------------------------------------------------------------------------", -- 17
-    "110001000000010011----------------------------------------------------------------------------------", -- 18
-    "1101011101101001011---------------------------------------------------------------------------------", -- 19
-    "01101011100001010110--------------------------------------------------------------------------------", -- 20
-    "010010011001010010010-------------------------------------------------------------------------------", -- 21
-    "0100011010101101100010------------------------------------------------------------------------------", -- 22
-    "01011010101100101011010-----------------------------------------------------------------------------", -- 23
-    "110100111100100111001011----------------------------------------------------------------------------", -- 24
-    "1010000011111011100000101---------------------------------------------------------------------------", -- 25
-    "11001101111101111010110011--------------------------------------------------------------------------", -- 26
-    "000110100110001011101011000-------------------------------------------------------------------------", -- 27
-    "0101101110000001100111011010------------------------------------------------------------------------", -- 28
-    "01001000100101111100100010010-----------------------------------------------------------------------", -- 29
-    "101000100111001101101010000101----------------------------------------------------------------------", -- 30
-    "1111101101100001100011011011111---------------------------------------------------------------------", -- 31
-    "00001100010001110000110000000110--------------------------------------------------------------------", -- 32
-    "111001011001000110000100110100111-------------------------------------------------------------------", -- 33
-    "1000111110101101001101000011110001------------------------------------------------------------------", -- 34
-    "11101000101110011110001110100010111-----------------------------------------------------------------", -- 35
-    "010010010001100001011111000010010010----------------------------------------------------------------", -- 36
-    "1000100010110100000000110010100010001---------------------------------------------------------------", -- 37
-    "11111011011100010000010000111011011111--------------------------------------------------------------", -- 38
-    "010101110100111100011111111001011101010-------------------------------------------------------------", -- 39
-    "1100110000011000000100010100000100110011------------------------------------------------------------", -- 40
-    "01111100100100001011101010000100100111110-----------------------------------------------------------", -- 41
-    "111011101111111010101100010101000001110111----------------------------------------------------------", -- 42
-    "0011010100010100011001100000010100010101100---------------------------------------------------------", -- 43
-    "01110101111100010000011101010110010000101110--------------------------------------------------------", -- 44
-    "001110001110111111010011100111111011100011100-------------------------------------------------------", -- 45
-    "0111101000001010000001110111001101100001011110------------------------------------------------------", -- 46
-    "10010110101010000110110111101100001010101101001-----------------------------------------------------", -- 47
-    "010100000001111101000100101101111001111000001010----------------------------------------------------", -- 48
-    "1000010000010010101101111011011010100100000100001---------------------------------------------------", -- 49
-    "01111110111111111101000010011111011010001101111110--------------------------------------------------", -- 50
-    "110001111110101000010000101100101110101011111100011-------------------------------------------------", -- 51
-    "0011110000011110100111101101111110010111100000111100------------------------------------------------", -- 52
-    "01111100111100100001000000110011011100100111100111110-----------------------------------------------", -- 53
-    "100111001111101110101100101100110011010000101010111001----------------------------------------------", -- 54
-    "0111101101101110011100110010001111011111011011011011110---------------------------------------------", -- 55
-    "10101011011101011111000110101111010101001010111011010101--------------------------------------------", -- 56
-    "110100111001011011010110100110001011010110110100111001011-------------------------------------------", -- 57
-    "1000110011001110111011000100101100110010110111001100110001------------------------------------------", -- 58
-    "01110100000011000100001010010000110111111000011000000101110-----------------------------------------", -- 59
-    "111001111010010111010000101111001101000010111010010111100111----------------------------------------", -- 60
-    "1010010010111011110100111100100000100101010111101110100100101---------------------------------------", -- 61
-    "10110111010110111010110111010111011010110111010110111010110111--------------------------------------", -- 62
-    "100000000000000000000000000000011000000000000000000000000000001-------------------------------------", -- 63
-    "1001110101001101111011011001100100111001101101111011001010111001------------------------------------", -- 64
-    "10000011110010010001111001101111001100101101110001001001111000001-----------------------------------", -- 65
-    "001110000110010010101001101000111001011101100101010010011000011100----------------------------------", -- 66
-    "0000011001011000010011010101111101100100010101100100001101001100000---------------------------------", -- 67
-    "10101100000100001111111101011101101101101010111111110000100000110101--------------------------------", -- 68
-    "110000110011100111110111110100110111111001011111011111001110011000011-------------------------------", -- 69
-    "0011001111111111110001010001000011000000110100101000111111111111001100------------------------------", -- 70
-    "10010110111101100111111000000010111010111000000011111100110111101101001-----------------------------", -- 71
-    "101111101110011010101010101011110110000101111100000000001110000001111101----------------------------", -- 72
-    "0111111100000011110100010010111101001101011110100100010111100000011111110---------------------------", -- 73
-    "01101010011010010101011101000000111011010011110010111010101001011001010110--------------------------", -- 74
-    "001010000000010110000000110010110001101110001010011000000011010000000010100-------------------------", -- 75
-    "0111100111110100001100111101101110000011110101111111101001000010111110011110------------------------", -- 76
-    "11110100001101110101011111011100001110000011110101001101010101110110000101111-----------------------", -- 77
-    "100100101101101010100001101101010101111110101101011101100001010101101101001001----------------------", -- 78
-    "0111011100100111111111001101101000010101110100001011011001111111110010011101110---------------------", -- 79
-    "01010110010000100000101000110011101111011110101011011101111000000100001001101010--------------------", -- 80
-    "001000100010010111000011011111011010000010010010110111110110000111010010001000100-------------------", -- 81
-    "0100001100100011011111111000011100001010100101010001001100101111101100010011000010------------------", -- 82
-    "11011110000000000111111110101101011110011011111111000110110010010000000000001111011-----------------", -- 83
-    "110010110110100011010000100100110110011011011110101011001001000010110001011011010011----------------", -- 84
-    "1001100100000101011101111110100111101101111011100001001011111111011101010000010011001---------------", -- 85
-    "01110100100111101111001010010011100101111101000010000111001001010011110111100100101110--------------", -- 86
-    "101001000100011010000101100010111001001100110001100100111010001101000010110001000100101-------------", -- 87
-    "0001101101011111110001111011001100100100111001011001000110011110110101000000000001011000------------", -- 88
-    "00010101110100010000010001101011001000110011110000111010100101001001000001000101110101000-----------", -- 89
-    "100010001110000000100011100010010101100110101011111101011010010001110001000000011100010001----------", -- 90
-    "0101000100001111101011101010110011111101100110010000111111111000101101100010111011010101110---------", -- 91
-    "01010111100000011000010100000100101000001111100001010100010100100000101000011000000111101010--------", -- 92
-    "000010010010010001110001101101011011111111010100110111111110110101101100011100010010010010000-------", -- 93
-    "1110110101101110111111001001100111110111110100110101110001011110011001001111110111011010110111------", -- 94
-    "01001010010001101011000000000001100111110101010111010101111100110000000000011010110001001010010-----", -- 95
-    "111101111011000000100010011011011101011001000110111000110101001100101011100001000000110111101111----", -- 96
-    "0011111111001010001101000011100010000001111001010111101111000000100011100001011000101001111111100---", -- 97
-    "10111101100100110001111011100110010001101011011010101010010110001001100111011110001100100110111101--", -- 98
-    "100011001111010110010110110010110101110101001000001100100101011101011010011011010011010111100110001-", -- 99
-    "1111111110010000000111100101111111000110101100111010011111001000011100111010011110000000100111111111"  -- 100
+  constant LCAR_RULE_TABLE : lcar_rule_list(2 to 256) := (
+    "10--------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 2
+    "110-------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 3
+    "0101------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 4
+    "01111-----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 5
+    "000110----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 6
+    "1011001---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 7
+    "01001011--------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 8
+    "010011100-------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 9
+    "1111000011------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 10
+    "01000011010-----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 11
+    "100101010011----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 12
+    "0111001110110---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 13
+    "01000111001111--------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 14
+    "100000011000001-------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 15
+    "0001111001001000------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 16
+    "10011000110011001-----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 17
+    "110001000000010011----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 18
+    "1101011101101001011---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 19
+    "01101011100001010110--------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 20
+    "010010011001010010010-------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 21
+    "0100011010101101100010------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 22
+    "01011010101100101011010-----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 23
+    "110100111100100111001011----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 24
+    "1010000011111011100000101---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 25
+    "11001101111101111010110011--------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 26
+    "000110100110001011101011000-------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 27
+    "0101101110000001100111011010------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 28
+    "01001000100101111100100010010-----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 29
+    "101000100111001101101010000101----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 30
+    "1111101101100001100011011011111---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 31
+    "00001100010001110000110000000110--------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 32
+    "111001011001000110000100110100111-------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 33
+    "1000111110101101001101000011110001------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 34
+    "11101000101110011110001110100010111-----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 35
+    "010010010001100001011111000010010010----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 36
+    "1000100010110100000000110010100010001---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 37
+    "11111011011100010000010000111011011111--------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 38
+    "010101110100111100011111111001011101010-------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 39
+    "1100110000011000000100010100000100110011------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 40
+    "01111100100100001011101010000100100111110-----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 41
+    "111011101111111010101100010101000001110111----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 42
+    "0011010100010100011001100000010100010101100---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 43
+    "01110101111100010000011101010110010000101110--------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 44
+    "001110001110111111010011100111111011100011100-------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 45
+    "0111101000001010000001110111001101100001011110------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 46
+    "10010110101010000110110111101100001010101101001-----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 47
+    "010100000001111101000100101101111001111000001010----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 48
+    "1000010000010010101101111011011010100100000100001---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 49
+    "01111110111111111101000010011111011010001101111110--------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 50
+    "110001111110101000010000101100101110101011111100011-------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 51
+    "0011110000011110100111101101111110010111100000111100------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 52
+    "01111100111100100001000000110011011100100111100111110-----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 53
+    "100111001111101110101100101100110011010000101010111001----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 54
+    "0111101101101110011100110010001111011111011011011011110---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 55
+    "10101011011101011111000110101111010101001010111011010101--------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 56
+    "110100111001011011010110100110001011010110110100111001011-------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 57
+    "1000110011001110111011000100101100110010110111001100110001------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 58
+    "01110100000011000100001010010000110111111000011000000101110-----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 59
+    "111001111010010111010000101111001101000010111010010111100111----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 60
+    "1010010010111011110100111100100000100101010111101110100100101---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 61
+    "10110111010110111010110111010111011010110111010110111010110111--------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 62
+    "100000000000000000000000000000011000000000000000000000000000001-------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 63
+    "1001110101001101111011011001100100111001101101111011001010111001------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 64
+    "10000011110010010001111001101111001100101101110001001001111000001-----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 65
+    "001110000110010010101001101000111001011101100101010010011000011100----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 66
+    "0000011001011000010011010101111101100100010101100100001101001100000---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 67
+    "10101100000100001111111101011101101101101010111111110000100000110101--------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 68
+    "110000110011100111110111110100110111111001011111011111001110011000011-------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 69
+    "0011001111111111110001010001000011000000110100101000111111111111001100------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 70
+    "10010110111101100111111000000010111010111000000011111100110111101101001-----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 71
+    "101111101110011010101010101011110110000101111100000000001110000001111101----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 72
+    "0111111100000011110100010010111101001101011110100100010111100000011111110---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 73
+    "01101010011010010101011101000000111011010011110010111010101001011001010110--------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 74
+    "001010000000010110000000110010110001101110001010011000000011010000000010100-------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 75
+    "0111100111110100001100111101101110000011110101111111101001000010111110011110------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 76
+    "11110100001101110101011111011100001110000011110101001101010101110110000101111-----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 77
+    "100100101101101010100001101101010101111110101101011101100001010101101101001001----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 78
+    "0111011100100111111111001101101000010101110100001011011001111111110010011101110---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 79
+    "01010110010000100000101000110011101111011110101011011101111000000100001001101010--------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 80
+    "001000100010010111000011011111011010000010010010110111110110000111010010001000100-------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 81
+    "0100001100100011011111111000011100001010100101010001001100101111101100010011000010------------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 82
+    "11011110000000000111111110101101011110011011111111000110110010010000000000001111011-----------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 83
+    "110010110110100011010000100100110110011011011110101011001001000010110001011011010011----------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 84
+    "1001100100000101011101111110100111101101111011100001001011111111011101010000010011001---------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 85
+    "01110100100111101111001010010011100101111101000010000111001001010011110111100100101110--------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 86
+    "101001000100011010000101100010111001001100110001100100111010001101000010110001000100101-------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 87
+    "0001101101011111110001111011001100100100111001011001000110011110110101000000000001011000------------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 88
+    "00010101110100010000010001101011001000110011110000111010100101001001000001000101110101000-----------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 89
+    "100010001110000000100011100010010101100110101011111101011010010001110001000000011100010001----------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 90
+    "0101000100001111101011101010110011111101100110010000111111111000101101100010111011010101110---------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 91
+    "01010111100000011000010100000100101000001111100001010100010100100000101000011000000111101010--------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 92
+    "000010010010010001110001101101011011111111010100110111111110110101101100011100010010010010000-------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 93
+    "1110110101101110111111001001100111110111110100110101110001011110011001001111110111011010110111------------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 94
+    "01001010010001101011000000000001100111110101010111010101111100110000000000011010110001001010010-----------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 95
+    "111101111011000000100010011011011101011001000110111000110101001100101011100001000000110111101111----------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 96
+    "0011111111001010001101000011100010000001111001010111101111000000100011100001011000101001111111100---------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 97
+    "10111101100100110001111011100110010001101011011010101010010110001001100111011110001100100110111101--------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 98
+    "100011001111010110010110110010110101110101001000001100100101011101011010011011010011010111100110001-------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 99
+    "1111111110010000000111100101111111000110101100111010011111001000011100111010011110000000100111111111------------------------------------------------------------------------------------------------------------------------------------------------------------", -- 100
+    "01111000110100010110110110001110100011111001111010011111010010001011111011111000110011111011001001001-----------------------------------------------------------------------------------------------------------------------------------------------------------", -- 101
+    "101010111011011100101010010011011101010010000100010000000011100101100110011000111011110101000010111000----------------------------------------------------------------------------------------------------------------------------------------------------------", -- 102
+    "1010111000010000110011100001110110010010011110110000010001000000011000001010011001101000010111011100100---------------------------------------------------------------------------------------------------------------------------------------------------------", -- 103
+    "11100001111111011100011101100100011011110010100110100110001110000000110000011100110000010110111010010010--------------------------------------------------------------------------------------------------------------------------------------------------------", -- 104
+    "010001010101001110111111011000000100110000110111010100010001111101011010010000001101011000100101000010010-------------------------------------------------------------------------------------------------------------------------------------------------------", -- 105
+    "1000110100101101110111100111001000101010110111011100001101011111001001001100110101110101010000000001011101------------------------------------------------------------------------------------------------------------------------------------------------------", -- 106
+    "01110110100101110000011011110010001111001100000101111010100100100111111101011100001111111010000101111110001-----------------------------------------------------------------------------------------------------------------------------------------------------", -- 107
+    "001000010111010110100001001111011101101011010010101010001011111010000000011100001111011000100100100101111011----------------------------------------------------------------------------------------------------------------------------------------------------", -- 108
+    "1111001100111001110101001110110011100111011110011001110100011100010110100011011111001000011010111101110001011---------------------------------------------------------------------------------------------------------------------------------------------------", -- 109
+    "11101100110110101100101111111010111100111011000100110111010101010110001101010110010001111101010100001100101001--------------------------------------------------------------------------------------------------------------------------------------------------", -- 110
+    "001100001111101101010110011010000001001111110001000100000011011000101100110000111010100011000010001101011011001-------------------------------------------------------------------------------------------------------------------------------------------------", -- 111
+    "1100100100000010010110111000111110100100101111111000111001101110010010001001101010001111110001111000001100110000------------------------------------------------------------------------------------------------------------------------------------------------", -- 112
+    "01010010000010111101010010000110011101001101110001101000011011110011111010100010001011010011010001010010111011100-----------------------------------------------------------------------------------------------------------------------------------------------", -- 113
+    "010100101110101100111000011110101001001001001101011001101011010101010110010001101111000100101101110100010000000010----------------------------------------------------------------------------------------------------------------------------------------------", -- 114
+    "1101001111110011010100000000111011001100011011010000100010110011011011110001100111100000000100001101010110110101010---------------------------------------------------------------------------------------------------------------------------------------------", -- 115
+    "01101010101100101010001110100111101101111010010011011100111111011010111110001111011100100111011001111010111011010000--------------------------------------------------------------------------------------------------------------------------------------------", -- 116
+    "100100111110100011010010101011111011100101010000001010001100110110111000011110011010011100111100101100101010010011110-------------------------------------------------------------------------------------------------------------------------------------------", -- 117
+    "0001101100010100000111001101010000011111001101100110111011111001111011101001101111000011010001000111001111101100101101------------------------------------------------------------------------------------------------------------------------------------------", -- 118
+    "10001101111011110000110101101000101001100010001011101010000001001000011110101011000111101011011000011011100100000010101-----------------------------------------------------------------------------------------------------------------------------------------", -- 119
+    "000001101011010100111001100101010111101000011010111101110101010010000000101001001011001101110001000000010110100000011100----------------------------------------------------------------------------------------------------------------------------------------", -- 120
+    "1100100011011110111111110010101000001001001110001010101101100000010000111001110010011000000011100101101000110100100011110---------------------------------------------------------------------------------------------------------------------------------------", -- 121
+    "01101000110100110110011000101011111110101111011101000000000101110011011101001011100011111000011010110010011011010111110100--------------------------------------------------------------------------------------------------------------------------------------", -- 122
+    "011000101011110100111100100001100010000010110010000101001110010010000100010010101110110011111110100011101101110001011111001-------------------------------------------------------------------------------------------------------------------------------------", -- 123
+    "1011111101110101101111110101000001000000011111011000101010110011010111101010101000001001101000101111011101000000001111000101------------------------------------------------------------------------------------------------------------------------------------", -- 124
+    "10010010100000100100001110001000001110000000001011110000001111111001111100110001010000001100101111100000110011100001010011110-----------------------------------------------------------------------------------------------------------------------------------", -- 125
+    "010001101001011101011001101110010001110010000110110000100101101110111101010110110010111011011000000001001011100001001011000010----------------------------------------------------------------------------------------------------------------------------------", -- 126
+    "1100000110011100100110010111001011000110000110100000111010111101110011001011010110100000001100101011111110011010000110010101010---------------------------------------------------------------------------------------------------------------------------------", -- 127
+    "10110010100001001000110011011000100000111000101001010000001111011011000000101010001111000100010101101010010001010010000101100110--------------------------------------------------------------------------------------------------------------------------------", -- 128
+    "010100011100000000100111101001000000110110111110110011011001010010110011100110111010101001000101000001011100101110001010110001001-------------------------------------------------------------------------------------------------------------------------------", -- 129
+    "1000010010110011111001001010000011100111110001100000011000001011010000111101010000010010010110101110011111011011000100110010000111------------------------------------------------------------------------------------------------------------------------------", -- 130
+    "01000101010111010110010110011010011010011101011111010011000111011010011111001101010011001000111100110000001001011110010110110111010-----------------------------------------------------------------------------------------------------------------------------", -- 131
+    "001100011010100111001100000110101001101000101011100011111111010000111110100111001001101110010100010000100101001001100000001010000010----------------------------------------------------------------------------------------------------------------------------", -- 132
+    "1110010111010000100000101010000001111110000000101110000110100010110111000010101110000001110000001000101010010001111011010000100111000---------------------------------------------------------------------------------------------------------------------------", -- 133
+    "00110000110000101001100011010101110111001111011111001010110001001100010000101101010001101100101011011001010111001010100110110100111011--------------------------------------------------------------------------------------------------------------------------", -- 134
+    "011001100000110001011100100010111101001011010100111010001010100000100110101111110100111101011110100110111100000110110001101000010010101-------------------------------------------------------------------------------------------------------------------------", -- 135
+    "0110010000101111111001000100111001101000111010011101111100000110010010111110001100001111101101111010100100100111001100011110101101100101------------------------------------------------------------------------------------------------------------------------", -- 136
+    "01010010011101000110111101101100101111000001001010011011110001011110111010011101010100001100111110110001010011101100001100010111101100011-----------------------------------------------------------------------------------------------------------------------", -- 137
+    "000100111100101111110010011111111010111001000100000010111101000001100000100110001010010011111110111011100101111101100111100100100101011000----------------------------------------------------------------------------------------------------------------------", -- 138
+    "0111110010101010010010001011010111110101011000111110011101110011101011111100001011001011110010000010010110010010000110011010000110101011101---------------------------------------------------------------------------------------------------------------------", -- 139
+    "01000100000010110110000111110111000100011100010101010010100001111011000110111100001110101010000111101111001001010111111100110101101011000010--------------------------------------------------------------------------------------------------------------------", -- 140
+    "100001001000010100010101111110111010101100010011110010010111110001100110010000111010110110010101111110001111110001110011111001111010010001111-------------------------------------------------------------------------------------------------------------------", -- 141
+    "1111111000001000111100010111001100000011011100111011000000100001010110011010100100011001100010111100110110100000000001100110010011001111000100------------------------------------------------------------------------------------------------------------------", -- 142
+    "00111111000111100001000000111100110110111000001001010011111001100000010011100011101100111100100000111010011111010010010100101010010100011110111-----------------------------------------------------------------------------------------------------------------", -- 143
+    "110001011101111010010111111000000011101111111000011111101100110111111110001001010100000110001001010111000100010010000100000001100010011111001001----------------------------------------------------------------------------------------------------------------", -- 144
+    "1100111000010000010011100110111010001100011101110101001101110100000110011100101000100011110000000111111010100001000001001100001100011100110111010---------------------------------------------------------------------------------------------------------------", -- 145
+    "10010101111100000011001000001100001110101111011000100110010110001001101000101101011001110100101110111010010110001001110100011111000101010000100110--------------------------------------------------------------------------------------------------------------", -- 146
+    "010111011000010101000010110001010010000111100111000100011101010001011010110000100000101100001010100011101101000101010100100001001111110100001000111-------------------------------------------------------------------------------------------------------------", -- 147
+    "1101101010110100110000101000110111010110000100110001000001000000001011101011001111111101000101100100001101011101101111010110101111100101000010100010------------------------------------------------------------------------------------------------------------", -- 148
+    "00001111001010111000001001010100010001001000110000010010011010101110000000110110101010100010011111100001011001000000100010100100001010001011100111001-----------------------------------------------------------------------------------------------------------", -- 149
+    "101010110011000101010010100011001100101100110110010110110101101100110001100011010101001011001001001111010110110100101011110100110000000111110111000110----------------------------------------------------------------------------------------------------------", -- 150
+    "0010100111100011011001100010101011100100101111100000111101010100111111011000101111111000100100100101111001101110010011111011101000010010000011101001001---------------------------------------------------------------------------------------------------------", -- 151
+    "00000111110101011110100000000110100010011000000000011011100111001000011111001110110011101001101101111111010110110101110001101001101110100110110111010100--------------------------------------------------------------------------------------------------------", -- 152
+    "111001010101101111101011001110110101001011101110100110111110011100100110111110101001101010001000111111100001101000011001110000101101011011000000000011011-------------------------------------------------------------------------------------------------------", -- 153
+    "1010010011010000001101010001101001111001101001100000001101101010011010001010011011101110101110101101010100100011100010011010011010010011000010101010001011------------------------------------------------------------------------------------------------------", -- 154
+    "00011001111111001101011010110100010100100000100000011111100001010111001001101010000000000110000011111111001001100101010110011010101010000000111100010100011-----------------------------------------------------------------------------------------------------", -- 155
+    "011001000100101011010011101110010100001110101100101010001000100100001111101101111011101000010000110001100010011010000000110100111000011000011110100101011001----------------------------------------------------------------------------------------------------", -- 156
+    "1101010011000010000011100010100100100100101101101110011111001000100110000110011001101001101000110100010100110100111011010010101110100110010101101011100101000---------------------------------------------------------------------------------------------------", -- 157
+    "01111000000111101110100100010001100001110001001011100001011010010110000011001100010011111010010000100010011010101110100110110001101111001000011110110100111011--------------------------------------------------------------------------------------------------", -- 158
+    "101101000000110010111111110110011001000111011100110001111010100110101101000111101010011111010000010011011101010110111101101011010001111011100111111001001100101-------------------------------------------------------------------------------------------------", -- 159
+    "0001011001000110010001000011001011101000101110111000001011011111101000000010010100000111010010010101010000110100010000011001000000001010110000001110110110000001------------------------------------------------------------------------------------------------", -- 160
+    "00100110101011010111000010110011110111001111110000110010100011111000000101111001101010010000000001011110000101011010110111101011010001111110110110100010001000001-----------------------------------------------------------------------------------------------", -- 161
+    "111110010101100110110111110001000110011101000111101100010100110110101110011110100001100011000100111010010001110111110011001101001100110110001101011101000110101010----------------------------------------------------------------------------------------------", -- 162
+    "0010111010010001101110100100001111001011101100011101111111010000010001100111010010011010010100011100010010111000000110101011010110101100111010011010100001000101001---------------------------------------------------------------------------------------------", -- 163
+    "10111101001100001001110101001001110000011111100010100000111001101100101100000100111110111111011111111001110101101011100101000101010011101101000001010001011000000100--------------------------------------------------------------------------------------------", -- 164
+    "001111111111010001101111000100111001000011001110111010011111000111111000010010001111001100101101011101010000000101000011011111101101110010010100001110011111100000011-------------------------------------------------------------------------------------------", -- 165
+    "1011101011011010110010000101110010100011100110011101001010010101001010001010110000100110001110011001101010011100011001001110100010011111110000101101000111110001001010------------------------------------------------------------------------------------------", -- 166
+    "01110000011101000101000100000101001111100001011001110010010110100100010000111011001001010111000000101010011001000001000000100111111000011010101010100000110000101100100-----------------------------------------------------------------------------------------", -- 167
+    "010011110111100100101010100011001000101110011111100000001100100011000010110001010010101110110000101101000110010100001101000011110011100100011101100110011010010011001010----------------------------------------------------------------------------------------", -- 168
+    "0010100101011011110001010010110011010010000000101000100101101011111000110001100100000100000000000011101011010001011011011110001111110101111011101110101110111101101001010---------------------------------------------------------------------------------------", -- 169
+    "01111100101111101111001001100011101000100110100010011001110000110001110100111000001000110001000011100100011001100000111101110101110010111011100110111001001011100111010110--------------------------------------------------------------------------------------", -- 170
+    "000001101100101011101100000100111111101100010001110001101000001101101110010001100010100101000100101111111110001111111001101011110101100011101110100111001100111101001110010-------------------------------------------------------------------------------------", -- 171
+    "1101010111111110100010101101001110001010101110100111111000011000110110100111100010001100000011101101111001111110100111000010111100000011110000100011001110101000110110000000------------------------------------------------------------------------------------", -- 172
+    "10100101101000110101001101100110100011000100011101011010110101010101001001110001100001100011000111100000000111101111100110011001001011011111100110000111001110110000011110001-----------------------------------------------------------------------------------", -- 173
+    "010101010100101100010011000011101011111001000011111100111110001110111011000000110001000101111000010010010000001000111101111010110000110011100011000101101001001111010011000010----------------------------------------------------------------------------------", -- 174
+    "0111111000101010101111000001101000101110110001110000001001001100001010111000101010011000101001111110001010001101110001001001110111101111100111111010110101011111001011011001001---------------------------------------------------------------------------------", -- 175
+    "00011000100000110110011010110101011001110110000010110010111010111100111001111001111010110001101101110101000001010010100011111010101010011011101100001110001110110100011000010100--------------------------------------------------------------------------------", -- 176
+    "001000010001000100111010111011010111111101111011010001011101010011111010010011100011101111100110111010110011000011000001100110010111101010000110101001011010010110110001001001011-------------------------------------------------------------------------------", -- 177
+    "0100110001101110101000100010001001000101000011000100001001011110010011001110111001101111001011110101101100000001100010011010001110111001010010011000111010011011001101010100111010------------------------------------------------------------------------------", -- 178
+    "00011011001110100111110010010111010000111011111011111011000101110011111110110001110010011110110000010110100011100100011010100000001001000101011110001010011001001101000111000100101-----------------------------------------------------------------------------", -- 179
+    "011000110111000010111001111100001010101001001001001101110100101011111101100011011110010111000101011101000011010100110001101101100011000001000101100111010101011010111011011101100001----------------------------------------------------------------------------", -- 180
+    "1001100110111010101101111001110001010101010101110100010000000010001110110111000011001000000110110101101100001010110101001011101001110100001001000001111000101111011010100011001101100---------------------------------------------------------------------------", -- 181
+    "10011001010011000010111010100000011000010010111010111100010101000110110110100101100001011011010000110010110110101100000011000101100011011111011011101001111001110011110010100001101100--------------------------------------------------------------------------", -- 182
+    "101001110101100001101100111110011111010101110000011011000001100110111100000000110001001111011001001100111111100000001110101101011010111101111101111000010111110001111011001001010110101-------------------------------------------------------------------------", -- 183
+    "0010101001111011101100110111110110010101100100010110000000111011010101010100100101110101000001111101111110011000001000010010001011001101001100001000001100111000110110101010111101000110------------------------------------------------------------------------", -- 184
+    "11111111110001100010100001100000010000110011101001000101011100111111110001010000000000011100001010100110101000001110000101010001111100101101100001100001011111100000011101000110011000110-----------------------------------------------------------------------", -- 185
+    "000110010000001010111000011111011110000000101001000010010010110000010101111100101001011110010011101000011010101000000100110111110110010100001000011000101111011011001111000010111111111111----------------------------------------------------------------------", -- 186
+    "0110011011110101010000010000100100010110001101001000101101011111011111010010111110010001001100000100010010001011111001110001110001000010100001100010010010001010101001001000010101100110010---------------------------------------------------------------------", -- 187
+    "11100111001001110010110000110010110010011000001110101001001000011111110001101101110011000011000100010110011101110000001000000001101111101010111110010111101011101111101011001001100000110110--------------------------------------------------------------------", -- 188
+    "100001001100000111100111000001000110011110010011100111011100001100000101110001100101000010011101100001000011010100100101100101101101000010101101111100100110010001111100100000110001100000101-------------------------------------------------------------------", -- 189
+    "0010010000010100110110000100100001110100000001101010110101110000111010011110100111010000111000011000011110101010110000001000100011001111010010111011101010001101001100111010001100011100000101------------------------------------------------------------------", -- 190
+    "11111111111000111010011000010011010010011010111101000110010010001011111101001100111000000100000011011011101000100100011000111110110100101000101110110101001111000111001101100010101101100111101-----------------------------------------------------------------", -- 191
+    "000010010110010010011110010010001001011101010101111111011110011000110011111011001001011110000111001001101111001100100011110000011110111111000010001100001010000000000111011111111110111011111111----------------------------------------------------------------", -- 192
+    "0110001011110100100000001110011101011010001001111011111110001011001001110010011100001101100010010000001000010011110001011001110100000101111110110101000011110001011001000011010001001000010110110---------------------------------------------------------------", -- 193
+    "11010110000100100001110111011110111001000100101100001110001101000011100111001110111000011000110001100011101101110011100101111110110011100111110101111100111000111001111111011110010000110100111010--------------------------------------------------------------", -- 194
+    "010001011101011101101000100110101011100110100000100000000001100111111001111000100110101000011100110010001101101010011100011000011001011101101100100100011000111000101001000101001001100011010001000-------------------------------------------------------------", -- 195
+    "0010000010111000001111010010110110100010000100111110000101011101001011011100011011001100111001111011011100011011100110100001001101001000110001001010100011100000000000001001100011110001011001010111------------------------------------------------------------", -- 196
+    "00100110111100010101101111110101111110011010101001110111001001101000001000100011001100001011111100101000011101010101111000110111010010100010000011101101010001110110110111001100100010110000110010111-----------------------------------------------------------", -- 197
+    "100000101011011010101000110100010011111110011001110000011110010000100010000100101010110000001010111011001100110111001101010101100001111001100111110001000101010010111010001001100011010000000001011101----------------------------------------------------------", -- 198
+    "1111000000110111001100011010100100110011100010101110000001100111101001000010101100111111010110000011100011101101110111011000011100001101100010100000111000111110010011000100010110101101000111001111110---------------------------------------------------------", -- 199
+    "01111101111110101100100010001011100100001000111011110101010001000001000111101010010101001100000010001111010110111010100111010010000100010101000000011011011000100010111100010101011001001000001100101101--------------------------------------------------------", -- 200
+    "110010000111011100001110110001000110100111100000011001110101100100111000011100001101100001110011000101100000011110010011100001010110011001111111001111100011011001001011010001111100001001111100001001101-------------------------------------------------------", -- 201
+    "1101010111000110000011010101010011111011100011001101110111110001101010100110001111010101111010111110001000000111111011011111110011111000100011111001101000111011001110000010100110000101001011100100100000------------------------------------------------------", -- 202
+    "10000000001001001010111110001010111110100011110011110011101011110010111110110111110011110000100111110010110011011100011100001101111101000110010101110000000101010010101011110101111000100110111111111010100-----------------------------------------------------", -- 203
+    "110110100100011100000110000000110011110100101001010000111010010110111010001101110111111100110000001000101001111011010000101000001011010001110100100111000001111011101100100111011011101010111100100010011111----------------------------------------------------", -- 204
+    "0111100101110111010011001101000111010111110111001111011010110011011001100010011011010011101010010010010000001011111010111010110011100110011110011110110001011010100010101111110101100101101111101001100110100---------------------------------------------------", -- 205
+    "11101000000110111010011110110011011000010110111110000100001110000100100011100011011100001011101000101000110101010010100000001010111011000101000100011100001110100000110100101010000000100010100110111110100001--------------------------------------------------", -- 206
+    "010101101001010010100011111100010110001011111000000100010101010100011010011000010111010011110111010101011101111100100000000011111000011010100000101100001101001000110000000000111011011001111101101011101100111-------------------------------------------------", -- 207
+    "1010101000011011010101101111001000010111010111101101000001010011011101000100011011101010011000010101001101100111101010110101100110000110001011011100111001001001111001110001100100100010011111010010111111001000------------------------------------------------", -- 208
+    "11110111111101010100001000110110011010001111001000011100001100011111110111111000101101101101000011000010010110011100000111111101101010100010011100000100010110000101110001111110000000000001011100000011111011010-----------------------------------------------", -- 209
+    "110111110010101110001110111111010110001100101101010100101100111010101111011110101000110101011011010110110101110011001111000001101011000000010111100110000000111101110010111110011101101010111001110110111100001011----------------------------------------------", -- 210
+    "1101111001101000111000111100100110000101001100000010110011111110001101101100111000000100001100111010011110101111001100111101000010010111010110010101110010110011101011010100100101110001011010011101100010111110011---------------------------------------------", -- 211
+    "10101000111000111101001111011001111111001001001100000000100101101110111010010110000011101100011000000101001101001111011000000100011101011111011110000100000101110001001010111100111011111101111000010010101101101111--------------------------------------------", -- 212
+    "010010001110101101101111101100100100101001010100000100010110001000010001010111110000000000101011001100110001001100101000011001111111011111100010011110101000100011000010001101000100100111000110111010000110111010000-------------------------------------------", -- 213
+    "0110001000111110000001101110110100101101100011111101010000101010111110000100100111010111010011001011011101111110011100110010101001010110110110101011100110001010001010001110100101010000000010111001000110011011000101------------------------------------------", -- 214
+    "10001010100110011000101000011100011010110010110001011100011100011101010011000100111001110011101110001101110001110110010011010111110101111101011011011100101111001001010011011011011011000011001011000011100100011101110-----------------------------------------", -- 215
+    "111110011101001111000010001011001110001110010010010010110101110001111000100100011100000100100111011110111100010000101101111110111111101011010011110001100010100111110001111010001000011100011001101110110011111110000110----------------------------------------", -- 216
+    "1111101101101000110110100011010001111010110010110101101010000000110000110111110001001101001110100110101001011010000101110111001100000101111110100110001111110000111011110111011100111001111000011110001011111011101100011---------------------------------------", -- 217
+    "10101101111000101000011011100101010011111001000000110001010100101010101011111001111011111101011100000110001011100110010000111100101111000100011111111100010011110001110001111001110001011011000001000110111110111000100100--------------------------------------", -- 218
+    "101001101010101010010000101011101100110101111101001101000001110010010101100011000000101010000000100100101010101111010100111101010001100000110100000001110010111101101010110111110110101011101111001100011100111001110100110-------------------------------------", -- 219
+    "0010110110011111010010111100001001101110100100111000111010100010011110100011101111111100101011100101000111101110110011101100000000100011110111010100110111010011011010000000110101110111010101000010100111011011100001101000------------------------------------", -- 220
+    "11000010100111101101001010110101101110000101010001001101001011000010111110010001010111101101010110110001110000110000010101000110010000000110101010110100111011000010010000001000010001110111001101100111011110001111101011001-----------------------------------", -- 221
+    "101010011111100010100101010001000111110100011001111110101011011011000011100001101111010110101011110001110011100010001100111100110101100011011011111000101100010110110111001101010110100001111100110010011011110000000110100100----------------------------------", -- 222
+    "0100011101001110101100110101110111000111010111011001101000110011000111010100101011100100101110101010101110011110000000110000100111110001000111010001010111100001110110011000000001110001000100100110011000101110100110010100110---------------------------------", -- 223
+    "00111001110011001101101001001111101010001110000011001111000010011100010111001111111001110101101001011000100101101110100100010011111111111101110011001011001111010100001100101010000000001011011100001101000001100010111000100000--------------------------------", -- 224
+    "101100111000100011010000100110000000101100100011101100001001010010000010110101011110101010001000111101111000111011001110101110100100100000110011010010000100111100011000010110001110101111101111011011111010001111000101111001000-------------------------------", -- 225
+    "0001010011111101110001110110111001000111100001000000110101000100110000101011100110100110000110011110011000111101111011000010010001001010101000101010111000010110000011001011010101000001011101110001000000110001101111000000001111------------------------------", -- 226
+    "01011101011111111110100111110011110100100111010000111001111100001011011000110110010110101111011011110001110101110100000101101111000111110011001000000101101010010000101101000110001010001111101101111110111000000100010100110001001-----------------------------", -- 227
+    "000010011000001011110100011010001000011111110110010001100001001110101000011101001100111101011001101001100000011001100110101001100111100100101101010000001110001001011010011011001000111110011110000100011000111000110101110101000110----------------------------", -- 228
+    "0001000001010110110011111011001000111101101110111011110110101000100011000100000100010011101101110001100000011011001110100110110010001011100000110001110101011110010100100110010010101000110011111010101101100100111110011001101011110---------------------------", -- 229
+    "11111110010011000110110010010011010001110100011111100110010100101101011011101100011101111010011011001101100100010000001111011001111001101011100011000100100110000000100000010001011111100110100101000100110000111001010110000101010111--------------------------", -- 230
+    "000001101000100010110101000101010101110011011001101010000010110011101000011111100010000110111000111101100100111010101101110010101000110000001111101010011010100001101000111101001101011011111101010101111100001111001110000110101010010-------------------------", -- 231
+    "1001011111101101000111000001110101011011100001100111001011000110000100000000110111011001110000111110000001101000110001010111000010010101011001011110110110011001111100110010011010000010101001111110001101100011000110110010101100011100------------------------", -- 232
+    "11100001101010111101001000010011001110001100011110011011010000100111001110110110111010110010111001110100101001001000101110101001011011010101111100010100001001110100110000000001110011100110110001100101110011011111000101001011111010100-----------------------", -- 233
+    "000100111110010100011011101001100000101100101000010010110000010000001001011000001011000000011000010010001010001101010100100101101101100110011111011011110101001101100010000111001001011110001100101001001100010100011100010100111110010110----------------------", -- 234
+    "1001001111111100001110001010010110101101100111101011111001010011001010101100010110110011110000111010000101011001101001101000111001010111011000011001011011110100110000011111100111100001010100011000101100011111010000110110010110001100001---------------------", -- 235
+    "10000001011000010011101011100011111111110111111101100010101111110001110111100000101010100010000101100000010101100110101100000110110011011010111000110000110101011000010010110011101111110001100101100111010101100111111011000011100111001100--------------------", -- 236
+    "000000001010001110111000110100000001101101100011011100000011000111011111110101100010100010001011111111111100100110100111110110000000100101010000111001001010011010100010001100010110111111100011010000000001100000110001000110101110101000110-------------------", -- 237
+    "1111011000000010100011011011101000100001000000000110101111111110100110010101101001010010011100100000101100010111110100110111101101011110001111100011010111101110000010111000010001011100101001000011000001100100011101110111000011101011010110------------------", -- 238
+    "00011110011100010110010110101111001010000101011111110010001110010100110010001111000111110011010111110000010111000010011000100010001101110100110011011011111110010101000100001010001000000010011010111101001111100001111011010011111100111101110-----------------", -- 239
+    "101101110100111110111001011001011010000100101110100101000110000111100000011100011001100110001001101000010101101101011011010010000110100111111011100100101100111010100111101010000110001100100110011100100100010000110000000100010011011111101000----------------", -- 240
+    "1010011011110110001011101100011001000000001010011010111110000110101011010001101101001001000010111110011101101101001100011011110100010010110000111000100100011011101111011100000010100000100011101011001011101111000001000100101000100110011001011---------------", -- 241
+    "10111000101100001010001011000010010100011100001001101110110101001010000010101001111010111010000101010111011101010010010011101100110100010100100111010101100000101100100100101100111000000100000010100011100000111000101100011111010011111110001101--------------", -- 242
+    "011001100010111101111000110001100010000011111100101100110100011010100001100101001101110000000001110001010001011001011111011000011010010100100011101101111001010011100001001011000000011000111010100001011000001111110011001011000001011000111101111-------------", -- 243
+    "0101100010001101101000000010100110111110111010010100101000101011000101011000001111110110011111011111001110011110010001101011100101000110101110010010001110101011000001101101001010010110000100111100010000111110110001010101010010110011010001110010------------", -- 244
+    "11001101000010110001101101011110101000001010100110100010010111010101011100111110111100000010010011000110111100010000000001000010011110010101011110100101101111011100101011010111100100010101101000010011001011001101111001010111100111010100000111111-----------", -- 245
+    "001011101110100110001011110100000010100100000010100010110100100010001010100010001110011001011100111010110001110010011001001100110000101101010101000000111100110100110001001110001011011110101101100000111100101100011010110000100010011101001100100100----------", -- 246
+    "0000001111110001011111111011110000111100100001101101001100000101001000101010010111000110011011010000110001101010110101001011001001111100100001100011000011001001110010100100110011110000100010011101010100111101011010101010100110001111101001011111110---------", -- 247
+    "11010000010011100000100100110110111011100110000101110010001111101101101101110101011100000011000101110100011001111001111101000000100110111000001110000100111000011010101010010100011110011011010000101010011110000100101100111001111110111011110001111100--------", -- 248
+    "101101111110100110001001010110111111001111110001010111111110101101000110100001111101001110101110000011011100011000100000100010010011001010110000110101111011001001100011111001011111001110111010010100000000001110001101000011111000000000010011000011100-------", -- 249
+    "1100010010101010111001000001110101110111011000111111100011110000011001100010110011110101110100011111001101010100101110011010111001111011100100001100111111101100000000000000011110001001001110101111000111101111101100000101110100000011111111101010100100------", -- 250
+    "11010100111111101101100011101001111010010001100001101110101011001110111111000111000101010111011101110001011101011001110010000101101010101001100010011110110110010011100010101100100000101000100001000010111100010111100001110011011111101000011101011010110-----", -- 251
+    "010111110011000000010000010000000011001101100100100010100110101011000001110101100111011111000101000000100001000111000011010010100111010011000110111101100101010111100000101111110000010000100110110100010110101001100111110110101100000100010010111000001111----", -- 252
+    "0010001011010110111111010110000111111100100111110000000000001101001010010111110010010011010110101010000010011110110000110101100001101011101110011111101110110011011010110110011111111111000110000001100000010111110101011100011100000101101001000101000011000---", -- 253
+    "10111111110110000001111010011010000111000111011000010000110000000111011101010000110110110010111100110110000011100000111011000110111100100000010100011101010110011000001011110000100111001011010111110111101000100110111000011001100001100100010011000110000001--", -- 254
+    "001100010100010110100011111110101000110101000110001100010100101000011101010000001111001101110101011111011100111110110000101101001011010100111011100010100011110110001011111010000100011110100101101110101101111110000100001010110110101100000001000011110010111-", -- 255
+    "0001011000010000101010100000000000110011010111111010010000011011101010101101111101111000001100111100100001001101010111011101110100100100100000110111001110100100101000010101100111111001110011101000100010011011000001011000110111010011011111011111101011011001"  -- 256
   );
 
 
@@ -83,7 +83,7 @@
 --#  will work correctly.
 --#
 --#  A table of coefficients for maximal length polynomials covering 2 to
---#  100-bit LFSRs is provided in LFSR_COEFF_TABLE. You can use these to
+--#  256-bit LFSRs is provided in LFSR_COEFF_TABLE. You can use these to
 --#  generate a tap_map signal with the lfsr_taps() function. You can build a
 --#  tap_map for any arbitrary set of coefficients with the to_tap_map()
 --#  function. Since tap_map is a signal it is possible to switch coefficient
@@ -99,6 +99,18 @@
 --#  XNORs. The FULL_CYCLE generic activates the full cycle option described
 --#  above.
 --#
+--#  Without Full_cycle the LFSRs are affine over GF(2) so K steps can be
+--#  combined into a single transition matrix. galois_lfsr_matrix() and
+--#  fibonacci_lfsr_matrix() derive the matrix for any number of steps using
+--#  O(log K) matrix squarings and leap_lfsr() applies it to a state. The
+--#  jump_galois_lfsr() and jump_fibonacci_lfsr() functions combine the two to
+--#  advance a state by an arbitrary number of steps. This is useful for
+--#  seeding parallel generators at evenly spaced points in the sequence. The
+--#  STEPS_PER_CLOCK generic on the components advances the LFSR by multiple
+--#  steps on each clock edge. For the Fibonacci LFSR the rightmost
+--#  STEPS_PER_CLOCK bits of the state are then the next bits of the sequence
+--#  as long as STEPS_PER_CLOCK does not exceed the state size.
+--#
 --# EXAMPLE USAGE:
 --#    signal state, statec : std_ulogic_vector(1 to 8);
 --#
@@ -122,6 +134,14 @@
 --#        State   => statec
 --#      );
 --#
+--#  Advance multiple steps at once:
+--#    constant LEAP_8 : bit_vector := galois_lfsr_matrix(TAP_MAP, 8);
+--#    ...
+--#    state <= leap_lfsr(state, LEAP_8); -- Same as 8 calls to next_galois_lfsr()
+--#    ...
+--#    -- Start a second generator one million steps ahead of the first
+--#    lane_1 := jump_galois_lfsr(lane_0, TAP_MAP, 1_000_000);
+--#
 --#  Generate taps for any arbitrary polynomial:
 --#    -- G(x) = x**11 + x**9 + x**8 + x**7 + x**2 + 1  (CRC-11)
 --#    signal crc_state : std_ulogic_vector(1 to 11);
@@ -187,12 +207,68 @@ package lfsr_ops is
     constant Kind : lfsr_kind := normal; constant Full_cycle : boolean := false )
     return std_ulogic_vector;
 
+  --## Transition matrix for multiple steps of a Galois LFSR. The matrix
+  --#  covers the state and a constant '1' input so that the inverted kind
+  --#  can be represented. The Full_cycle option is not linear and is not
+  --#  supported.
+  --# Args:
+  --#  Tap_map: Coefficient vector
+  --#  Steps: Number of steps to advance
+  --#  Kind: Normal or inverted
+  --# Returns:
+  --#  Flattened (n+1)x(n+1) matrix for use with leap_lfsr().
+  function galois_lfsr_matrix( Tap_map : std_ulogic_vector; Steps : natural := 1;
+    constant Kind : lfsr_kind := normal ) return bit_vector;
+
+  --## Transition matrix for multiple steps of a Fibonacci LFSR. The
+  --#  Full_cycle option is not linear and is not supported.
+  --# Args:
+  --#  Tap_map: Coefficient vector
+  --#  Steps: Number of steps to advance
+  --#  Kind: Normal or inverted
+  --# Returns:
+  --#  Flattened (n+1)x(n+1) matrix for use with leap_lfsr().
+  function fibonacci_lfsr_matrix( Tap_map : std_ulogic_vector; Steps : natural := 1;
+    constant Kind : lfsr_kind := normal ) return bit_vector;
+
+  --## Advance an LFSR by the number of steps encoded in a transition matrix.
+  --# Args:
+  --#  State: Current state of the LFSR
+  --#  Matrix: Transition matrix from galois_lfsr_matrix() or fibonacci_lfsr_matrix()
+  --# Returns:
+  --#  New state for the LFSR.
+  function leap_lfsr( State : std_ulogic_vector; Matrix : bit_vector )
+    return std_ulogic_vector;
+
+  --## Advance a Galois LFSR by an arbitrary number of steps.
+  --# Args:
+  --#  State: Current state of the LFSR
+  --#  Tap_map: Coefficient vector
+  --#  Steps: Number of steps to advance
+  --#  Kind: Normal or inverted
+  --# Returns:
+  --#  New state for the LFSR.
+  function jump_galois_lfsr( State : std_ulogic_vector; Tap_map : std_ulogic_vector;
+    Steps : natural; constant Kind : lfsr_kind := normal ) return std_ulogic_vector;
+
+  --## Advance a Fibonacci LFSR by an arbitrary number of steps.
+  --# Args:
+  --#  State: Current state of the LFSR
+  --#  Tap_map: Coefficient vector
+  --#  Steps: Number of steps to advance
+  --#  Kind: Normal or inverted
+  --# Returns:
+  --#  New state for the LFSR.
+  function jump_fibonacci_lfsr( State : std_ulogic_vector; Tap_map : std_ulogic_vector;
+    Steps : natural; constant Kind : lfsr_kind := normal ) return std_ulogic_vector;
+
   --## Galois LFSR. With Maximal length coefficients it will cycle through
   --#  (2**n)-1 states when FULL_CYCLE = false, 2**n when true.
   component galois_lfsr is
     generic (
       INIT_ZERO  : boolean := false;         --# Initialize register to zeroes when true
       FULL_CYCLE : boolean := false;         --# Implement a full 2**n cycle
+      STEPS_PER_CLOCK : positive := 1;       --# Number of steps to advance on each clock
       RESET_ACTIVE_LEVEL : std_ulogic := '1' --# Asynch. reset control level
     );
     port (
@@ -215,6 +291,7 @@ package lfsr_ops is
     generic (
       INIT_ZERO  : boolean := false;         --# Initialize register to zeroes when true
       FULL_CYCLE : boolean := false;         --# Implement a full 2**n cycle
+      STEPS_PER_CLOCK : positive := 1;       --# Number of steps to advance on each clock
       RESET_ACTIVE_LEVEL : std_ulogic := '1' --# Asynch. reset control level
     );
     port (
@@ -259,6 +336,7 @@ entity galois_lfsr is
   generic (
     INIT_ZERO  : boolean := false;
     FULL_CYCLE : boolean := false;
+    STEPS_PER_CLOCK : positive := 1;
     RESET_ACTIVE_LEVEL : std_ulogic := '1'
   );
   port (
@@ -274,12 +352,24 @@ end entity;
 architecture rtl of galois_lfsr is
   signal sr : std_ulogic_vector(1 to State'length);
 
+  -- Multi-step transition matrix. The full cycle logic isn't linear so
+  -- that case is handled by unrolling the single step function.
+  constant USE_MATRIX : boolean := STEPS_PER_CLOCK > 1 and not FULL_CYCLE;
+  signal step_matrix : bit_vector(0 to (State'length+1)**2 - 1);
+
 begin
   assert Tap_map'length = State'length-1
     report "Tap_map must be one bit shorter than the state register"
     severity failure;
 
+  -- Only recomputed when the Tap_map changes
+  mg: if USE_MATRIX generate
+    -- INIT_ZERO selects the inverted kind
+    step_matrix <= galois_lfsr_matrix(Tap_map, STEPS_PER_CLOCK, lfsr_kind'val(boolean'pos(INIT_ZERO)));
+  end generate;
+
   reg: process(Clock, Reset)
+    variable next_sr : std_ulogic_vector(sr'range);
   begin
     if Reset = RESET_ACTIVE_LEVEL then
       if INIT_ZERO then
@@ -289,10 +379,18 @@ begin
       end if;
     elsif rising_edge(Clock) then
       if Enable = '1' then
-        if INIT_ZERO then
-          sr <= next_galois_lfsr(sr, Tap_map, inverted, FULL_CYCLE);
+        if USE_MATRIX then
+          sr <= leap_lfsr(sr, step_matrix);
         else
-          sr <= next_galois_lfsr(sr, Tap_map, normal, FULL_CYCLE);
+          next_sr := sr;
+          for i in 1 to STEPS_PER_CLOCK loop
+            if INIT_ZERO then
+              next_sr := next_galois_lfsr(next_sr, Tap_map, inverted, FULL_CYCLE);
+            else
+              next_sr := next_galois_lfsr(next_sr, Tap_map, normal, FULL_CYCLE);
+            end if;
+          end loop;
+          sr <= next_sr;
         end if;
 
       end if;
@@ -324,6 +422,7 @@ entity fibonacci_lfsr is
   generic (
     INIT_ZERO  : boolean := false;
     FULL_CYCLE : boolean := false;
+    STEPS_PER_CLOCK : positive := 1;
     RESET_ACTIVE_LEVEL : std_ulogic := '1'
   );
   port (
@@ -341,12 +440,24 @@ end entity;
 architecture rtl of fibonacci_lfsr is
   signal sr : std_ulogic_vector(1 to State'length);
 
+  -- Multi-step transition matrix. The full cycle logic isn't linear so
+  -- that case is handled by unrolling the single step function.
+  constant USE_MATRIX : boolean := STEPS_PER_CLOCK > 1 and not FULL_CYCLE;
+  signal step_matrix : bit_vector(0 to (State'length+1)**2 - 1);
+
 begin
   assert Tap_map'length = State'length-1
     report "Tap_map must be one bit shorter than the state register"
     severity failure;
 
+  -- Only recomputed when the Tap_map changes
+  mg: if USE_MATRIX generate
+    -- INIT_ZERO selects the inverted kind
+    step_matrix <= fibonacci_lfsr_matrix(Tap_map, STEPS_PER_CLOCK, lfsr_kind'val(boolean'pos(INIT_ZERO)));
+  end generate;
+
   reg: process(Clock, Reset)
+    variable next_sr : std_ulogic_vector(sr'range);
   begin
     if Reset = RESET_ACTIVE_LEVEL then
       if INIT_ZERO then
@@ -356,10 +467,18 @@ begin
       end if;
     elsif rising_edge(Clock) then
       if Enable = '1' then
-        if INIT_ZERO then
-          sr <= next_fibonacci_lfsr(sr, Tap_map, inverted, FULL_CYCLE);
+        if USE_MATRIX then
+          sr <= leap_lfsr(sr, step_matrix);
         else
-          sr <= next_fibonacci_lfsr(sr, Tap_map, normal, FULL_CYCLE);
+          next_sr := sr;
+          for i in 1 to STEPS_PER_CLOCK loop
+            if INIT_ZERO then
+              next_sr := next_fibonacci_lfsr(next_sr, Tap_map, inverted, FULL_CYCLE);
+            else
+              next_sr := next_fibonacci_lfsr(next_sr, Tap_map, normal, FULL_CYCLE);
+            end if;
+          end loop;
+          sr <= next_sr;
         end if;
 
       end if;
@@ -395,6 +514,94 @@ package body lfsr_ops is
     return result;
   end function;
 
+  -- Matrix for a single step of an LFSR. Row i selects the inputs XORed
+  -- into bit i of the new state. Column n represents a constant '1' that
+  -- supplies the XNOR inversions of the inverted kind.
+  function lfsr_step_matrix( Tap_map : std_ulogic_vector; Galois : boolean;
+    constant Kind : lfsr_kind ) return bit_vector is
+
+    constant N : positive := Tap_map'length + 1;
+    constant M : positive := N + 1;
+
+    variable offset, unit, col : std_ulogic_vector(1 to N);
+    variable matrix : bit_vector(0 to M*M-1) := (others => '0');
+  begin
+    -- The columns of an affine map are the images of the unit vectors
+    -- minus the image of zero.
+    unit := (others => '0');
+    if Galois then
+      offset := next_galois_lfsr(unit, Tap_map, Kind);
+    else
+      offset := next_fibonacci_lfsr(unit, Tap_map, Kind);
+    end if;
+
+    for j in 1 to N loop
+      unit := (others => '0');
+      unit(j) := '1';
+      if Galois then
+        col := next_galois_lfsr(unit, Tap_map, Kind) xor offset;
+      else
+        col := next_fibonacci_lfsr(unit, Tap_map, Kind) xor offset;
+      end if;
+
+      for i in 1 to N loop
+        matrix((i-1)*M + j-1) := to_bit(col(i));
+      end loop;
+    end loop;
+
+    for i in 1 to N loop
+      matrix((i-1)*M + N) := to_bit(offset(i));
+    end loop;
+    matrix(N*M + N) := '1';
+
+    return matrix;
+  end function;
+
+  -- Multiply two flattened MxM matrices over GF(2)
+  function mat_mult( A, B : bit_vector; M : positive ) return bit_vector is
+    alias am : bit_vector(0 to A'length-1) is A;
+    alias bm : bit_vector(0 to B'length-1) is B;
+    variable result : bit_vector(0 to M*M-1) := (others => '0');
+  begin
+    for r in 0 to M-1 loop
+      for k in 0 to M-1 loop
+        if am(r*M + k) = '1' then
+          result(r*M to r*M + M-1) := result(r*M to r*M + M-1) xor bm(k*M to k*M + M-1);
+        end if;
+      end loop;
+    end loop;
+
+    return result;
+  end function;
+
+  -- Raise a single step matrix to a power by repeated squaring
+  function lfsr_matrix( Tap_map : std_ulogic_vector; Steps : natural; Galois : boolean;
+    constant Kind : lfsr_kind ) return bit_vector is
+
+    constant M : positive := Tap_map'length + 2;
+    variable base : bit_vector(0 to M*M-1) := lfsr_step_matrix(Tap_map, Galois, Kind);
+    variable result : bit_vector(0 to M*M-1) := (others => '0');
+    variable n : natural := Steps;
+  begin
+    for i in 0 to M-1 loop -- Identity
+      result(i*M + i) := '1';
+    end loop;
+
+    -- Fixed bound on the loop keeps this usable in synthesis
+    for b in 0 to 30 loop
+      exit when n = 0;
+      if n mod 2 = 1 then
+        result := mat_mult(result, base, M);
+      end if;
+      n := n / 2;
+      if n > 0 then
+        base := mat_mult(base, base, M);
+      end if;
+    end loop;
+
+    return result;
+  end function;
+
 
 -- PUBLIC functions:
 -- =================
@@ -508,6 +715,70 @@ package body lfsr_ops is
   end function;
 
 
+  --## Transition matrix for multiple steps of a Galois LFSR
+  function galois_lfsr_matrix( Tap_map : std_ulogic_vector; Steps : natural := 1;
+    constant Kind : lfsr_kind := normal ) return bit_vector is
+  begin
+    return lfsr_matrix(Tap_map, Steps, true, Kind);
+  end function;
+
+
+  --## Transition matrix for multiple steps of a Fibonacci LFSR
+  function fibonacci_lfsr_matrix( Tap_map : std_ulogic_vector; Steps : natural := 1;
+    constant Kind : lfsr_kind := normal ) return bit_vector is
+  begin
+    return lfsr_matrix(Tap_map, Steps, false, Kind);
+  end function;
+
+
+  --## Advance an LFSR by the number of steps encoded in a transition matrix
+  function leap_lfsr( State : std_ulogic_vector; Matrix : bit_vector )
+    return std_ulogic_vector is
+
+    constant N : positive := State'length;
+    constant M : positive := N + 1;
+
+    alias mx : bit_vector(0 to Matrix'length-1) is Matrix;
+    variable inputs : std_ulogic_vector(0 to N);
+    variable result : std_ulogic_vector(1 to N);
+    variable b : std_ulogic;
+  begin
+    assert Matrix'length = M*M
+      report "Matrix size does not match the state register"
+      severity failure;
+
+    inputs := State & '1';
+
+    for i in 1 to N loop
+      b := '0';
+      for j in 0 to N loop
+        if mx((i-1)*M + j) = '1' then
+          b := b xor inputs(j);
+        end if;
+      end loop;
+      result(i) := b;
+    end loop;
+
+    return result;
+  end function;
+
+
+  --## Advance a Galois LFSR by an arbitrary number of steps
+  function jump_galois_lfsr( State : std_ulogic_vector; Tap_map : std_ulogic_vector;
+    Steps : natural; constant Kind : lfsr_kind := normal ) return std_ulogic_vector is
+  begin
+    return leap_lfsr(State, galois_lfsr_matrix(Tap_map, Steps, Kind));
+  end function;
+
+
+  --## Advance a Fibonacci LFSR by an arbitrary number of steps
+  function jump_fibonacci_lfsr( State : std_ulogic_vector; Tap_map : std_ulogic_vector;
+    Steps : natural; constant Kind : lfsr_kind := normal ) return std_ulogic_vector is
+  begin
+    return leap_lfsr(State, fibonacci_lfsr_matrix(Tap_map, Steps, Kind));
+  end function;
+
+
   --## Convert a coefficient list to an expanded vector with a '1' in the place
   --#  of each coefficient.
   function to_tap_map( C : lfsr_coefficients; Map_length : positive;
@@ -547,9 +818,13 @@ package body lfsr_ops is
   -- simplify the sharing between the Galois and Fibonacci implementations. The
   -- 0's that appear in the following list are dummy placeholders needed to pad
   -- out arrays with only one or two taps.
+  --
+  -- The entries above 100 were generated with scripts/maxlen_tables.py. They
+  -- are the primitive trinomials, or pentanomials when no trinomial exists,
+  -- with the smallest coefficients.
   type coefficient_list is array(natural range <>) of lfsr_coefficients(1 to 3);
 
-  constant LFSR_COEFF_TABLE : coefficient_list(2 to 100) := (
+  constant LFSR_COEFF_TABLE : coefficient_list(2 to 256) := (
     (1,0,0),   -- 2
     (1,0,0),   -- 3
     (1,0,0),   -- 4
@@ -648,7 +923,163 @@ package body lfsr_ops is
     (6,0,0),   -- 97
     (11,0,0),  -- 98
     (47,45,2), -- 99
-    (37,0,0)   -- 100
+    (37,0,0),  -- 100
+    (7,6,1),   -- 101
+    (6,5,3),   -- 102
+    (9,0,0),   -- 103
+    (11,10,1), -- 104
+    (16,0,0),  -- 105
+    (15,0,0),  -- 106
+    (9,7,4),   -- 107
+    (31,0,0),  -- 108
+    (5,4,2),   -- 109
+    (6,4,1),   -- 110
+    (10,0,0),  -- 111
+    (11,6,4),  -- 112
+    (9,0,0),   -- 113
+    (11,2,1),  -- 114
+    (8,7,5),   -- 115
+    (6,5,2),   -- 116
+    (5,2,1),   -- 117
+    (33,0,0),  -- 118
+    (8,0,0),   -- 119
+    (9,6,2),   -- 120
+    (18,0,0),  -- 121
+    (6,2,1),   -- 122
+    (2,0,0),   -- 123
+    (37,0,0),  -- 124
+    (7,6,5),   -- 125
+    (7,4,2),   -- 126
+    (1,0,0),   -- 127
+    (7,2,1),   -- 128
+    (5,0,0),   -- 129
+    (3,0,0),   -- 130
+    (8,3,2),   -- 131
+    (29,0,0),  -- 132
+    (9,8,2),   -- 133
+    (57,0,0),  -- 134
+    (11,0,0),  -- 135
+    (8,3,2),   -- 136
+    (21,0,0),  -- 137
+    (8,7,1),   -- 138
+    (8,5,3),   -- 139
+    (29,0,0),  -- 140
+    (13,6,1),  -- 141
+    (21,0,0),  -- 142
+    (5,3,2),   -- 143
+    (7,4,2),   -- 144
+    (52,0,0),  -- 145
+    (5,3,2),   -- 146
+    (11,4,2),  -- 147
+    (27,0,0),  -- 148
+    (10,9,7),  -- 149
+    (53,0,0),  -- 150
+    (3,0,0),   -- 151
+    (6,3,2),   -- 152
+    (1,0,0),   -- 153
+    (9,5,1),   -- 154
+    (7,5,4),   -- 155
+    (9,5,3),   -- 156
+    (6,5,2),   -- 157
+    (8,6,5),   -- 158
+    (31,0,0),  -- 159
+    (5,3,2),   -- 160
+    (18,0,0),  -- 161
+    (8,7,4),   -- 162
+    (7,6,3),   -- 163
+    (12,6,5),  -- 164
+    (9,8,3),   -- 165
+    (10,3,2),  -- 166
+    (6,0,0),   -- 167
+    (16,9,6),  -- 168
+    (34,0,0),  -- 169
+    (23,0,0),  -- 170
+    (6,5,2),   -- 171
+    (7,0,0),   -- 172
+    (8,5,2),   -- 173
+    (13,0,0),  -- 174
+    (6,0,0),   -- 175
+    (12,11,9), -- 176
+    (8,0,0),   -- 177
+    (87,0,0),  -- 178
+    (4,2,1),   -- 179
+    (12,10,7), -- 180
+    (7,6,1),   -- 181
+    (8,6,1),   -- 182
+    (56,0,0),  -- 183
+    (9,8,7),   -- 184
+    (24,0,0),  -- 185
+    (9,8,6),   -- 186
+    (7,6,5),   -- 187
+    (6,5,2),   -- 188
+    (6,5,2),   -- 189
+    (13,6,2),  -- 190
+    (9,0,0),   -- 191
+    (15,11,5), -- 192
+    (15,0,0),  -- 193
+    (87,0,0),  -- 194
+    (8,3,2),   -- 195
+    (11,9,2),  -- 196
+    (9,4,2),   -- 197
+    (65,0,0),  -- 198
+    (34,0,0),  -- 199
+    (5,3,2),   -- 200
+    (14,0,0),  -- 201
+    (55,0,0),  -- 202
+    (8,7,1),   -- 203
+    (10,4,3),  -- 204
+    (9,5,2),   -- 205
+    (10,9,5),  -- 206
+    (43,0,0),  -- 207
+    (9,3,1),   -- 208
+    (6,0,0),   -- 209
+    (12,4,3),  -- 210
+    (11,10,8), -- 211
+    (105,0,0), -- 212
+    (6,5,2),   -- 213
+    (5,3,1),   -- 214
+    (23,0,0),  -- 215
+    (7,3,1),   -- 216
+    (45,0,0),  -- 217
+    (11,0,0),  -- 218
+    (8,4,1),   -- 219
+    (12,10,9), -- 220
+    (8,6,2),   -- 221
+    (8,5,2),   -- 222
+    (33,0,0),  -- 223
+    (12,7,2),  -- 224
+    (32,0,0),  -- 225
+    (10,7,3),  -- 226
+    (10,9,4),  -- 227
+    (12,11,2), -- 228
+    (10,4,1),  -- 229
+    (8,7,6),   -- 230
+    (26,0,0),  -- 231
+    (11,9,4),  -- 232
+    (74,0,0),  -- 233
+    (31,0,0),  -- 234
+    (9,6,1),   -- 235
+    (5,0,0),   -- 236
+    (7,4,1),   -- 237
+    (5,2,1),   -- 238
+    (36,0,0),  -- 239
+    (8,5,3),   -- 240
+    (70,0,0),  -- 241
+    (11,6,1),  -- 242
+    (8,5,1),   -- 243
+    (9,4,1),   -- 244
+    (6,4,1),   -- 245
+    (11,2,1),  -- 246
+    (82,0,0),  -- 247
+    (15,14,10),-- 248
+    (86,0,0),  -- 249
+    (103,0,0), -- 250
+    (7,4,2),   -- 251
+    (67,0,0),  -- 252
+    (7,3,2),   -- 253
+    (7,2,1),   -- 254
+    (52,0,0),  -- 255
+    (10,5,2)   -- 256
   );
 
   --## Lookup a predefined tap coefficients from the table
@@ -61,6 +61,15 @@
 --#  and error checker and also between an encoder and decoder that don't
 --#  operate simultaneously. Refer to hamming_edac.vhdl and secded_codec.vhdl
 --#  for examples of this approach.
+--#
+--#  The table driven functions from hamming_edac have SECDED equivalents that
+--#  take the same parity check matrix and syndrome table:
+--#    constant MATRIX : bit_vector := hamming_matrix(word'length);
+--#    constant SYN_TABLE : syndrome_table := hamming_syndrome_table(word'length);
+--#    ...
+--#    secded_word <= secded_encode(word, MATRIX);
+--#    corrected_word <= secded_decode(secded_word, MATRIX, SYN_TABLE);
+--#    errors := secded_has_errors(secded_word, MATRIX);
 --------------------------------------------------------------------
 
 library ieee;
@@ -162,6 +171,40 @@ package secded_edac is
   function secded_has_errors( Encoded_data : ecc_vector; Syndrome : unsigned )
     return secded_errors;
 
+  --%% Table driven encode and decode functions
+
+  --## Encode the supplied data into an ecc_vector using a parity check
+  --#  matrix from hamming_matrix().
+  --# Args:
+  --#   Data: Raw data
+  --#   Matrix: Matrix from hamming_matrix()
+  --# Returns:
+  --#   Encoded data with parity.
+  function secded_encode( Data : std_ulogic_vector; Matrix : bit_vector )
+    return ecc_vector;
+
+  --## Decode an ecc_vector into the plain data bits, potentially correcting
+  --#  a single-bit error if a bit has flipped. This version uses a parity
+  --#  check matrix and syndrome table.
+  --# Args:
+  --#   Encoded_data: Encoded (uninterleaved) message
+  --#   Matrix: Matrix from hamming_matrix()
+  --#   Table: Table from hamming_syndrome_table()
+  --# Returns:
+  --#   Decoded data.
+  function secded_decode( Encoded_data : ecc_vector; Matrix : bit_vector;
+    Table : syndrome_table ) return std_ulogic_vector;
+
+  --## Test for a single-bit and double-bit errors in an ecc_vector using a
+  --#  parity check matrix.
+  --# Args:
+  --#   Encoded_data: Encoded (uninterleaved) message
+  --#   Matrix: Matrix from hamming_matrix()
+  --# Returns:
+  --#   true if message has a single or double-bit error.
+  function secded_has_errors( Encoded_data : ecc_vector; Matrix : bit_vector )
+    return secded_errors;
+
 end package;
 
 library extras;
@@ -264,5 +307,32 @@ package body secded_edac is
     return errors;
   end function;
 
+  --## Encode the supplied data into an ecc_vector using a parity check
+  --#  matrix from hamming_matrix().
+  function secded_encode( Data : std_ulogic_vector; Matrix : bit_vector )
+    return ecc_vector is
+  begin
+    return secded_encode(Data, hamming_parity(Data, Matrix));
+  end function;
+
+  --## Decode an ecc_vector into the plain data bits, potentially correcting
+  --#  a single-bit error if a bit has flipped. This version uses a parity
+  --#  check matrix and syndrome table.
+  function secded_decode( Encoded_data : ecc_vector; Matrix : bit_vector;
+    Table : syndrome_table ) return std_ulogic_vector is
+  begin
+    return hamming_decode(Encoded_data(Encoded_data'high downto Encoded_data'low+1),
+      Matrix, Table);
+  end function;
+
+  --## Test for a single-bit and double-bit errors in an ecc_vector using a
+  --#  parity check matrix.
+  function secded_has_errors( Encoded_data : ecc_vector; Matrix : bit_vector )
+    return secded_errors is
+  begin
+    return secded_has_errors(Encoded_data,
+      hamming_syndrome(Encoded_data(Encoded_data'high downto Encoded_data'low+1), Matrix));
+  end function;
+
 end package body;
 
@@ -395,29 +395,103 @@ package body strings_fixed is
   end procedure;
 
 
+  -- Pattern search uses the Boyer-Moore-Horspool algorithm. The mapping is
+  -- applied to source characters only as they are examined.
+
+  --# Distance to shift the pattern for each character at its far end.
+  type skip_table is array(character) of natural;
+
+  --## Build the shift table for a pattern
+  function skip_table_of( pat : string; going : direction ) return skip_table is
+    variable skip : skip_table := (others => pat'length);
+  begin
+    case going is
+      when forward => -- Distance from the last character
+        for i in 1 to pat'length-1 loop
+          skip(pat(i)) := pat'length - i;
+        end loop;
+
+      when backward => -- Distance from the first character
+        for i in pat'length downto 2 loop
+          skip(pat(i)) := i - 1;
+        end loop;
+    end case;
+
+    return skip;
+  end function;
+
+  --## Find the offset of the first match of pat in src at or after start
+  function find_forward( src : string; pat : string; skip : skip_table;
+    mapping : character_mapping; start : natural ) return integer is
+
+    variable i : integer := start; -- Offset of pat within src
+    variable j : natural;
+    variable c : character;
+  begin
+    while i <= src'length - pat'length loop
+      c := mapping(src(i + pat'length));
+      if c = pat(pat'length) then
+        j := pat'length - 1;
+        while j > 0 and mapping(src(i + j)) = pat(j) loop
+          j := j - 1;
+        end loop;
+
+        if j = 0 then
+          return i;
+        end if;
+      end if;
+
+      i := i + skip(c);
+    end loop;
+
+    return -1;
+  end function;
+
+
   --## Find the index of the first occurance of pattern in source from the
   --#  beginning or end
   function index( source : string; pattern : string; going : direction := forward;
     mapping : character_mapping := identity )
     return natural is
 
-    constant src : string(1 to source'length) := translate(source, mapping);
+    alias src : string(1 to source'length) is source;
     alias pat : string(1 to pattern'length) is pattern;
 
+    constant SKIP : skip_table := skip_table_of(pat, going);
+    variable i : integer;
+    variable j : natural;
+    variable c : character;
   begin
+    if pat'length = 0 then
+      case going is
+        when forward  => return source'left;
+        when backward => return source'left + src'length;
+      end case;
+    end if;
+
     case going is
       when forward =>
-        for i in 1 to src'length - pat'length + 1 loop
-          if src(i to i+pat'length-1) = pat then
-            return source'left-1 + i;
-          end if;
-        end loop;
+        i := find_forward(src, pat, SKIP, mapping, 0);
+        if i >= 0 then
+          return source'left + i;
+        end if;
 
       when backward =>
-        for i in src'length - pat'length + 1 downto 1 loop
-          if src(i to i+pat'length-1) = pat then
-            return source'left-1 + i;
+        i := src'length - pat'length; -- Offset of pat within src
+        while i >= 0 loop
+          c := mapping(src(i + 1));
+          if c = pat(1) then
+            j := 2;
+            while j <= pat'length and mapping(src(i + j)) = pat(j) loop
+              j := j + 1;
+            end loop;
+
+            if j > pat'length then
+              return source'left + i;
+            end if;
           end if;
+
+          i := i - SKIP(c);
         end loop;
     end case;
 
@@ -425,23 +499,33 @@ package body strings_fixed is
   end function;
 
 
+  --## Convert a membership test into the set of characters that pass it
+  function selected_set( set : character_set; test : membership ) return character_set is
+  begin
+    if test = inside then
+      return set;
+    else
+      return not set;
+    end if;
+  end function;
+
   --## Find the index of first occurance of a character from set in source
   function index( source : string; set : character_set; test : membership := inside;
     going : direction := forward ) return natural is
+
+    constant SEL : character_set := selected_set(set, test);
   begin
     case going is
       when forward =>
         for i in source'range loop
-          if (test = inside and is_in(source(i), set)) or
-             (test = outside and (not is_in(source(i), set))) then
+          if SEL(source(i)) then
             return i;
           end if;
         end loop;
 
       when backward =>
         for i in source'reverse_range loop
-          if (test = inside and is_in(source(i), set)) or
-             (test = outside and (not is_in(source(i), set))) then
+          if SEL(source(i)) then
             return i;
           end if;
         end loop;
@@ -477,19 +561,26 @@ package body strings_fixed is
   function count( source : string; pattern : string;
     mapping : character_mapping := identity ) return natural is
 
-    constant src : string(1 to source'length) := translate(source, mapping);
+    alias src : string(1 to source'length) is source;
     alias pat : string(1 to pattern'length) is pattern;
 
+    constant SKIP : skip_table := skip_table_of(pat, forward);
     variable c : natural := 0;
+    variable i : integer;
   begin
     assert pat'length > 0
       report "Zero length pattern"
       severity error;
 
-    for i in 1 to src'length - pat'length + 1 loop
-      if src(i to i+pat'length-1) = pat then
-        c := c + 1;
-      end if;
+    if pat'length = 0 then
+      return src'length + 1;
+    end if;
+
+    -- Overlapping matches are counted
+    i := find_forward(src, pat, SKIP, mapping, 0);
+    while i >= 0 loop
+      c := c + 1;
+      i := find_forward(src, pat, SKIP, mapping, i + 1);
     end loop;
 
     return c;
@@ -500,7 +591,7 @@ package body strings_fixed is
     variable c : natural := 0;
   begin
     for i in source'range loop
-      if is_in(source(i), set) then
+      if set(source(i)) then
         c := c + 1;
       end if;
     end loop;
@@ -513,17 +604,15 @@ package body strings_fixed is
   --#  selection for the character set.
   procedure find_token( source : in string; set : in character_set; test : in membership;
     first : out positive; last : out natural ) is
+
+    constant SEL : character_set := selected_set(set, test);
   begin
     for i in source'range loop
-      if (test = inside and is_in(source(i), set)) or
-        (test = outside and (not is_in(source(i), set))) then
-
+      if SEL(source(i)) then
         first := i;
 
         for j in i + 1 to source'right loop
-          if not ((test = inside and is_in(source(j), set)) or
-            (test = outside and (not is_in(source(j), set)))) then
-
+          if not SEL(source(j)) then
             last := j - 1;
             return;
           end if;
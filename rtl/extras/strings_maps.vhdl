@@ -36,6 +36,10 @@
 --# DESCRIPTION:
 --#  This package provides types and functions for manipulating character sets.
 --#  It is a clone of the Ada'95 package Ada.Strings.Maps.
+--#
+--#  A character_set is a bitmap with one flag per Latin-1 character so that
+--#  membership tests are a single array lookup. The set operators work on the
+--#  whole bitmap at once.
 --------------------------------------------------------------------
 
 package strings_maps is
@@ -262,7 +266,7 @@ package body strings_maps is
   --## Test if elements are a subset of set
   function is_subset( elements : character_set; set : character_set ) return boolean is
   begin
-    return elements = (elements and set);
+    return (elements and not set) = NULL_SET;
   end function;
 
 
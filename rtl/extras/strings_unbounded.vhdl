@@ -43,6 +43,12 @@
 --#  type access to string. Their contents are dynamically allocated. Because
 --#  operators cannot be provided, a new set of "copy" procedures are included
 --#  to simplify duplication of an existing unbounded string.
+--#
+--#  Each append to an unbounded_string reallocates it at its new size. The
+--#  string_builder type is provided for incrementally building long strings.
+--#  It keeps spare capacity that doubles when exhausted so that appends take
+--#  amortized constant time. Call finalize() to convert the result into an
+--#  unbounded_string that can be used with textio.
 --------------------------------------------------------------------
 
 library std;
@@ -164,6 +170,64 @@ package strings_unbounded is
   procedure eq( variable left : in unbounded_string; right : in string; result : out boolean );
 
 
+  -- String builder:
+  -- ===============
+
+  --## Growable string buffer with spare capacity.
+  type string_builder is record
+    data : unbounded_string; -- Allocated storage
+    len  : natural;          -- Number of characters in use
+  end record;
+
+  --## Create an empty string_builder with preallocated storage.
+  --# Args:
+  --#  source:   Builder to initialize
+  --#  capacity: Number of characters to allocate
+  procedure initialize( source : inout string_builder; capacity : in natural := 64 );
+
+  --## Free allocated memory for source.
+  --# Args:
+  --#  source: Builder to free
+  procedure free( source : inout string_builder );
+
+  --## Return the length of the string in a builder.
+  --# Args:
+  --#  source: Builder to get length from
+  --#  len:    Number of characters in use
+  procedure length( variable source : in string_builder; len : out natural );
+
+  --## Append unbounded_string new_item to source.
+  --# Args:
+  --#  source:   Builder to append onto
+  --#  new_item: String to append
+  procedure append( source : inout string_builder; variable new_item : in unbounded_string );
+
+  --## Append string new_item to source.
+  --# Args:
+  --#  source:   Builder to append onto
+  --#  new_item: String to append
+  procedure append( source : inout string_builder; new_item : in string );
+
+  --## Append character new_item to source.
+  --# Args:
+  --#  source:   Builder to append onto
+  --#  new_item: Character to append
+  procedure append( source : inout string_builder; new_item : in character );
+
+  --## Copy the contents of a builder to the string dest.
+  --# Args:
+  --#  source: Builder to copy from
+  --#  dest:   String to copy into. Must be the same length as source.
+  procedure to_string( variable source : in string_builder; dest : out string );
+
+  --## Move the contents of a builder into an unbounded_string. The builder
+  --#  is left empty.
+  --# Args:
+  --#  source: Builder to convert
+  --#  dest:   New string with the contents of source
+  procedure finalize( source : inout string_builder; dest : inout unbounded_string );
+
+
   -- Procedures derived from equivalents in strings_fixed:
   -- =====================================================
 
@@ -479,6 +543,115 @@ package body strings_unbounded is
   end procedure;
 
 
+  -- String builder:
+  -- ===============
+
+  --## Ensure there is storage for at least size characters in source
+  procedure reserve( source : inout string_builder; size : in natural ) is
+    variable capacity : natural;
+    variable sa : unbounded_string;
+  begin
+    if source.data = null then
+      capacity := 0;
+    else
+      capacity := source.data'length;
+    end if;
+
+    if size > capacity then -- Grow geometrically
+      capacity := 2 * capacity;
+      if capacity < size then
+        capacity := size;
+      end if;
+      if capacity < 16 then
+        capacity := 16;
+      end if;
+
+      sa := new string(1 to capacity);
+      if source.len > 0 then
+        sa(1 to source.len) := source.data(1 to source.len);
+      end if;
+      deallocate(source.data);
+      source.data := sa;
+    end if;
+  end procedure;
+
+  --## Create an empty string_builder with preallocated storage
+  procedure initialize( source : inout string_builder; capacity : in natural := 64 ) is
+  begin
+    deallocate(source.data);
+    source.data := new string(1 to capacity);
+    source.len := 0;
+  end procedure;
+
+  --## Free allocated memory for source
+  procedure free( source : inout string_builder ) is
+  begin
+    deallocate(source.data);
+    source.len := 0;
+  end procedure;
+
+  --## Return the length of the string in a builder
+  procedure length( variable source : in string_builder; len : out natural ) is
+  begin
+    len := source.len;
+  end procedure;
+
+  --## Append unbounded_string new_item to source
+  procedure append( source : inout string_builder; variable new_item : in unbounded_string ) is
+  begin
+    if new_item /= null then
+      append(source, new_item.all);
+    end if;
+  end procedure;
+
+  --## Append string new_item to source
+  procedure append( source : inout string_builder; new_item : in string ) is
+    variable size : natural;
+  begin
+    if new_item'length > 0 then
+      size := source.len + new_item'length;
+      reserve(source, size);
+      source.data(source.len+1 to size) := new_item;
+      source.len := size;
+    end if;
+  end procedure;
+
+  --## Append character new_item to source
+  procedure append( source : inout string_builder; new_item : in character ) is
+  begin
+    reserve(source, source.len + 1);
+    source.len := source.len + 1;
+    source.data(source.len) := new_item;
+  end procedure;
+
+  --## Copy the contents of a builder to the string dest
+  procedure to_string( variable source : in string_builder; dest : out string ) is
+  begin
+    if source.len = 0 then
+      dest := "";
+    else
+      dest := source.data(1 to source.len);
+    end if;
+  end procedure;
+
+  --## Move the contents of a builder into an unbounded_string
+  procedure finalize( source : inout string_builder; dest : inout unbounded_string ) is
+  begin
+    deallocate(dest);
+
+    if source.data /= null and source.len = source.data'length then -- Take the storage as is
+      dest := source.data;
+      source.data := null;
+    elsif source.len = 0 then
+      dest := new string'("");
+    else
+      dest := new string'(source.data(1 to source.len));
+    end if;
+
+    free(source);
+  end procedure;
+
+
   -- Procedures derived from equivalents in strings_fixed:
   -- =====================================================
 
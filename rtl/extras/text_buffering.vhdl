@@ -40,6 +40,11 @@
 --#  the resulting data structure can be incorporated into records passable
 --#  to procedures without having to maintain a separate file handle.
 --#
+--#  The lines are also tracked in an index array that doubles in size as it
+--#  fills. This lets setline() jump to any line in constant time rather than
+--#  walking the list from the head. The number of lines is available with
+--#  line_count().
+--#
 --# EXAMPLE USAGE:
 --#    variable buf    : text_buffer;
 --#    variable at_end : boolean;
@@ -79,6 +84,12 @@ package text_buffering is
     succ : buffer_line_acc;
   end record;
 
+  --# Array of line pointers for random access.
+  type buffer_line_array is array(positive range <>) of buffer_line_acc;
+
+  --# Pointer to a line index.
+  type buffer_line_array_acc is access buffer_line_array;
+
   --# Buffer of text lines.
   type text_buffer is record
     buf          : buffer_line_acc;
@@ -86,6 +97,7 @@ package text_buffering is
     cur_line     : buffer_line_acc;
     cur_line_num : natural;
     lines        : natural;
+    index        : buffer_line_array_acc;
   end record;
 
   --## Load a text file object into a buffer.
@@ -150,9 +162,15 @@ package text_buffering is
   --## Move to a specific line in the buffer.
   --# Args:
   --#  Buf: Buffer to seek into
-  --#  N:   Line number (zero based)
+  --#  N:   Line number (one based)
   procedure setline( Buf : inout text_buffer; N : in positive );
 
+  --## Get the number of lines in the buffer.
+  --# Args:
+  --#  Buf:   Buffer to query
+  --#  Count: Number of lines
+  procedure line_count( variable Buf : in text_buffer; Count : out natural );
+
   --## Check if the end of the buffer has been reached.
   --# Args:
   --#  Buf:    Buffer to test
@@ -170,6 +188,25 @@ use std.textio.all;
 
 package body text_buffering is
 
+  constant INIT_INDEX_SIZE : positive := 64;
+
+  --## Add the last line of a buffer to its index
+  procedure add_index( buf : inout text_buffer; node : in buffer_line_acc ) is
+    variable new_index : buffer_line_array_acc;
+  begin
+    if buf.index = null then
+      buf.index := new buffer_line_array(1 to INIT_INDEX_SIZE);
+    elsif buf.lines > buf.index.all'length then -- Grow the index
+      new_index := new buffer_line_array(1 to 2 * buf.index.all'length);
+      new_index(buf.index.all'range) := buf.index.all;
+      deallocate(buf.index);
+      buf.index := new_index;
+    end if;
+
+    buf.index(buf.lines) := node;
+  end procedure;
+
+
   --## Load a text file object into a buffer
   procedure load_buffer( file fh : text; buf : out text_buffer ) is
     variable tl : unbounded_string;
@@ -184,6 +221,7 @@ package body text_buffering is
     tb.cur_line_num := 1;
     tb.cur_line := tb.buf;
     tb.lines := 1;
+    add_index(tb, tb.buf);
 
     cur := tb.buf;
     while(not endfile(fh)) loop
@@ -194,6 +232,7 @@ package body text_buffering is
       cur.succ := succ;
       cur := succ;
       tb.lines := tb.lines + 1;
+      add_index(tb, cur);
     end loop;
 
     tb.buf_tail := cur;
@@ -225,6 +264,12 @@ package body text_buffering is
   begin
     load_buffer(fh, tb);
 
+    if buf.buf_tail = null then -- Buffer is empty
+      deallocate(buf.index);
+      buf := tb;
+      return;
+    end if;
+
     buf.buf_tail.succ := tb.buf;
 
     if buf.cur_line = null then -- Fix pointer
@@ -232,7 +277,12 @@ package body text_buffering is
     end if;
 
     buf.buf_tail := tb.buf_tail;
-    buf.lines := buf.lines + tb.lines;
+
+    for i in 1 to tb.lines loop
+      buf.lines := buf.lines + 1;
+      add_index(buf, tb.index(i));
+    end loop;
+    deallocate(tb.index);
 
   end procedure;
 
@@ -272,6 +322,8 @@ package body text_buffering is
       buf.cur_line_num := 1;
       buf.lines := 1;
     end if;
+
+    add_index(buf, buf.buf_tail);
   end procedure;
 
 
@@ -331,22 +383,21 @@ package body text_buffering is
 
   --## Move to a specific line in the buffer
   procedure setline( buf : inout text_buffer; n : in positive ) is
-    variable cur : buffer_line_acc;
-    variable lnum : natural := 0;
   begin
+    if n <= buf.lines then
+      buf.cur_line := buf.index(n);
+    else -- Past the end
+      buf.cur_line := null;
+    end if;
 
-    cur := buf.buf;
-    while cur /= null loop
-      lnum := lnum + 1;
+    buf.cur_line_num := n;
+  end procedure;
 
-      if lnum = n then
-        exit;
-      end if;
-      cur := cur.succ;
-    end loop;
 
-    buf.cur_line := cur;
-    buf.cur_line_num := n;
+  --## Get the number of lines in the buffer
+  procedure line_count( variable buf : in text_buffer; count : out natural ) is
+  begin
+    count := buf.lines;
   end procedure;
 
 
@@ -359,18 +410,18 @@ package body text_buffering is
 
   --## Deallocate the buffer contents
   procedure free( buf : inout text_buffer ) is
-    variable cur, succ : buffer_line_acc;
   begin
-    cur := buf.buf;
-    while cur /= null loop
-      succ := cur.succ;
-      deallocate(cur.s);
-      deallocate(cur);
-      cur := succ;
+    for i in 1 to buf.lines loop
+      deallocate(buf.index(i).s);
+      deallocate(buf.index(i));
     end loop;
+    deallocate(buf.index);
 
     buf.buf := null;
+    buf.buf_tail := null;
     buf.cur_line := null;
+    buf.cur_line_num := 0;
+    buf.lines := 0;
   end procedure;
 
 
@@ -52,6 +52,12 @@
 --#  The package provides a number of overloaded subprograms for generating
 --#  random numbers of various types.
 --#
+--#  An alternate xorshift PRNG can be selected with set_prng(). It produces
+--#  32 random bits per step using only shifts and XORs on bit_vectors. This
+--#  is faster than uniform when generating wide random vectors. The
+--#  default uniform_real PRNG continues to produce the same sequences as
+--#  before for a given seed.
+--#
 --# EXAMPLE USAGE:
 --#   seed(12345);    -- Initialize PRNG with a seed value
 --#   seed(123, 456); -- Alternate seed procedure
@@ -65,9 +71,22 @@
 --#   -- Generate a random integer within specified range
 --#   -- Number between 2 and 10 inclusive
 --#   variable : i : natural := randint(2, 10);
+--#
+--#   -- Switch to the faster xorshift PRNG
+--#   set_prng(xorshift);
+--#   seed(12345);
 --------------------------------------------------------------------
 
 package random is
+  --# PRNG algorithm used to generate random values.
+  type prng_kind is (uniform_real, xorshift);
+
+  --## Select the PRNG algorithm. Both algorithms are seeded by seed().
+  --# Args:
+  --#  Kind: uniform_real for ieee.math_real.uniform or xorshift for a
+  --#        128-bit xorshift generator
+  procedure set_prng(Kind : in prng_kind);
+
   --## Seed the PRNG with a number.
   --# Args:
   --#  S:  Seed value
@@ -138,9 +157,14 @@ use extras.timing_ops.all;
 
 package body random is
 
+  subtype word is bit_vector(31 downto 0);
+
   -- VHDL-20xx requires shared variables to be a protected type
   type rand_state is protected
+    procedure set_prng(kind : in prng_kind);
+    impure function get_prng return prng_kind;
     procedure seed(s1, s2 : in positive);
+    impure function next_word return word;
     impure function random return real;
   end protected;
 
@@ -148,15 +172,60 @@ package body random is
     variable seed1 : positive;
     variable seed2 : positive;
 
+    -- The xorshift generator is Marsaglia's xorshift128 with a 128-bit state
+    -- held in four 32-bit words. The state is never all zeros.
+    variable xs_x : word := X"075BCD15";
+    variable xs_y : word := X"159A55E5";
+    variable xs_z : word := X"1F123BB5";
+    variable xs_w : word := X"05491333";
+
+    variable prng_sel : prng_kind := uniform_real;
+
+    procedure set_prng(kind : in prng_kind) is
+    begin
+      prng_sel := kind;
+    end procedure;
+
+    impure function get_prng return prng_kind is
+    begin
+      return prng_sel;
+    end function;
+
+    impure function next_word return word is
+      variable t : word;
+    begin
+      t := xs_x xor (xs_x sll 11);
+      xs_x := xs_y;
+      xs_y := xs_z;
+      xs_z := xs_w;
+      xs_w := xs_w xor (xs_w srl 19) xor t xor (t srl 8);
+      return xs_w;
+    end function;
+
     procedure seed(s1, s2 : in positive) is
+      variable w : word;
     begin
       seed1 := s1;
       seed2 := s2;
+
+      xs_x := bit_vector(to_unsigned(s1, word'length));
+      xs_y := bit_vector(to_unsigned(s2, word'length));
+      xs_z := X"1F123BB5";
+      xs_w := X"05491333";
+      for i in 1 to 16 loop -- Mix the seeds into the whole state
+        w := next_word;
+      end loop;
     end procedure;
 
     impure function random return real is
       variable result : real;
+      variable w : word;
     begin
+      if prng_sel = xorshift then -- 31 random bits in the open interval (0.0, 1.0)
+        w := next_word;
+        return (real(to_integer(unsigned(w(30 downto 0)))) + 0.5) / 2.0**31;
+      end if;
+
       uniform(seed1, seed2, result);
       return result;
     end function;
@@ -166,6 +235,11 @@ package body random is
   shared variable prng : rand_state;
 
 
+  procedure set_prng(kind : in prng_kind) is
+  begin
+    prng.set_prng(kind);
+  end procedure;
+
 
   procedure seed(s : in positive) is
     variable s2 : positive;
@@ -201,7 +275,13 @@ package body random is
   end function;
 
   impure function random return natural is
+    variable w : word;
   begin
+    if prng.get_prng = xorshift then
+      w := prng.next_word;
+      return to_integer(unsigned(w(30 downto 0)));
+    end if;
+
     return natural(trunc(real(natural'high) * prng.random));
   end function;
 
@@ -223,7 +303,22 @@ package body random is
     constant remainder : natural := size - segments * seg_size;
 
     variable result : bit_vector(size-1 downto 0);
+    variable w : word;
+    variable hi : natural;
   begin
+    if prng.get_prng = xorshift then -- Fill directly from 32-bit words
+      for s in 0 to (size-1) / word'length loop
+        w := prng.next_word;
+        hi := s * word'length + word'length - 1;
+        if hi > size-1 then
+          hi := size-1;
+        end if;
+        result(hi downto s * word'length) := w(hi - s * word'length downto 0);
+      end loop;
+
+      return result;
+    end if;
+
     if segments > 0 then
       for s in 0 to segments-1 loop
         result((s+1) * seg_size - 1 downto s * seg_size) := bit_vector(to_unsigned(randint(0, 2**seg_size-1), seg_size));
@@ -24,6 +24,9 @@ begin
 		variable word, beword, r_word, r_beword : unsigned(15 downto 0);
 		variable sbyte, r_sbyte : signed(7 downto 0);
 
+		file stim, resp : octet_file;
+		variable vec : std_ulogic_vector(19 downto 0);
+
         function hex(n : unsigned) return string is
             -- Convert vector to hex string
             variable n4 : unsigned(0 to ((n'length + 3) / 4) * 4 - 1);
@@ -81,6 +84,16 @@ begin
 --		write(fh, big_endian, beword);
 --		write(fh, little_endian, byte);
 --		write(fh, little_endian, -sbyte);
+
+        -- Stream vectors generated by the test suite and return their complement
+        file_open(fstatus, stim, TEST_OUT_DIR & "/binary_stimulus.dat", read_mode);
+        file_open(fstatus, resp, TEST_OUT_DIR & "/binary_response.dat", write_mode);
+        while not endfile(stim) loop
+            read(stim, big_endian, vec);
+            write(resp, little_endian, not vec);
+        end loop;
+        file_close(stim);
+        file_close(resp);
 		
 		wait;
 	end process;
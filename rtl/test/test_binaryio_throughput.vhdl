@@ -0,0 +1,57 @@
+--# Copyright  2014 Kevin Thibedeau
+
+library ieee;
+use ieee.numeric_bit.all;
+
+library extras;
+use extras.binaryio.all;
+
+entity test_binaryio_throughput is
+  generic (
+    IN_FILE     : string;
+    OUT_FILE    : string;
+    WORD_SIZE   : positive;
+    BULK        : boolean;
+    BLOCK_WORDS : positive := 1024
+  );
+end entity;
+
+architecture tb of test_binaryio_throughput is
+begin
+
+  -- Copy a file of samples with either the single word or the block procedures
+  copy: process
+    file fin, fout : octet_file;
+    variable fstatus : file_open_status;
+
+    variable word : unsigned(WORD_SIZE-1 downto 0);
+    variable block_data : unsigned(BLOCK_WORDS*WORD_SIZE-1 downto 0);
+    variable count : natural;
+    variable total : natural := 0;
+  begin
+    file_open(fstatus, fin, IN_FILE, read_mode);
+    assert fstatus = open_ok report "Unable to open " & IN_FILE severity failure;
+    file_open(fstatus, fout, OUT_FILE, write_mode);
+
+    if BULK then
+      while not endfile(fin) loop
+        read(fin, little_endian, WORD_SIZE, block_data, count);
+        write(fout, little_endian, WORD_SIZE, block_data(count*WORD_SIZE-1 downto 0));
+        total := total + count;
+      end loop;
+    else
+      while not endfile(fin) loop
+        read(fin, little_endian, word);
+        write(fout, little_endian, word);
+        total := total + 1;
+      end loop;
+    end if;
+
+    file_close(fin);
+    file_close(fout);
+
+    report "Copied " & integer'image(total) & " words";
+    wait;
+  end process;
+
+end architecture;
@@ -0,0 +1,139 @@
+--# Copyright  2014 Kevin Thibedeau
+
+library ieee;
+use ieee.numeric_bit.all;
+
+library extras;
+use extras.crc_ops.all;
+use extras.binaryio.all;
+use extras.random.all;
+
+entity test_crc_table is
+  generic (
+    CATALOGUE_FILE : string;
+    TEST_SEED : positive := 1234
+  );
+end entity;
+
+architecture test of test_crc_table is
+  constant CHECK_STRING : string := "123456789";
+
+  function to_byte(c : character) return bit_vector is
+  begin
+    return bit_vector(to_unsigned(character'pos(c), 8));
+  end function;
+
+  function to_bits(s : string) return bit_vector is
+    variable result : bit_vector(s'length*8-1 downto 0);
+    alias sa : string(1 to s'length) is s;
+  begin
+    for i in sa'range loop
+      result(result'left - (i-1)*8 downto result'left - i*8 + 1) := to_byte(sa(i));
+    end loop;
+    return result;
+  end function;
+
+begin
+  test: process
+
+    -- Compute the check value of a catalogued CRC with the table and
+    -- serial functions
+    procedure check_catalogue(Width, Slices : positive; Poly, Xor_in, Xor_out, Check : unsigned;
+      Reflect_in, Reflect_out : boolean; Entry : natural) is
+
+      constant POLY_BV : bit_vector(Width-1 downto 0) := bit_vector(resize(Poly, Width));
+      constant XIN     : bit_vector(Width-1 downto 0) := bit_vector(resize(Xor_in, Width));
+      constant XOUT    : bit_vector(Width-1 downto 0) := bit_vector(resize(Xor_out, Width));
+      constant TABLE   : bit_vector := crc_table(POLY_BV, Slices);
+
+      variable crc_ref, crc_tbl : bit_vector(Width-1 downto 0);
+    begin
+      crc_ref := init_crc(XIN);
+      crc_tbl := init_crc(XIN);
+      for i in CHECK_STRING'range loop
+        crc_ref := next_crc(crc_ref, POLY_BV, Reflect_in, to_byte(CHECK_STRING(i)));
+        crc_tbl := next_crc_bytes(crc_tbl, TABLE, Reflect_in, to_byte(CHECK_STRING(i)));
+      end loop;
+
+      assert crc_tbl = crc_ref
+        report "Table mismatch for catalogue entry " & integer'image(Entry) severity failure;
+      assert end_crc(crc_tbl, Reflect_out, XOUT) = bit_vector(resize(Check, Width))
+        report "Check value mismatch for catalogue entry " & integer'image(Entry) severity failure;
+
+      if not Reflect_in then -- Whole string in one call
+        crc_tbl := next_crc_bytes(init_crc(XIN), TABLE, false, to_bits(CHECK_STRING));
+        assert crc_tbl = crc_ref
+          report "Block mismatch for catalogue entry " & integer'image(Entry) severity failure;
+      end if;
+    end procedure;
+
+    -- Compare the table and serial functions on random data
+    procedure check_random(Width, Slices : positive) is
+      constant MAX_BYTES : positive := 12;
+      constant POLY_BV : bit_vector(Width-1 downto 0) := random(Width);
+      constant TABLE   : bit_vector := crc_table(POLY_BV, Slices);
+
+      variable crc_ref, crc_tbl : bit_vector(Width-1 downto 0);
+      variable data : bit_vector(MAX_BYTES*8-1 downto 0);
+      variable nbytes : positive;
+      variable refin : boolean;
+    begin
+      for t in 1 to 20 loop
+        crc_ref := random(Width);
+        data    := random(data'length);
+        nbytes  := randint(1, MAX_BYTES);
+        refin   := random;
+
+        crc_tbl := next_crc_bytes(crc_ref, TABLE, refin, data(nbytes*8-1 downto 0));
+        crc_ref := next_crc(crc_ref, POLY_BV, refin, data(nbytes*8-1 downto 0));
+
+        assert crc_tbl = crc_ref
+          report "Random mismatch: width=" & integer'image(Width) & " slices=" & integer'image(Slices)
+          severity failure;
+      end loop;
+    end procedure;
+
+    type width_array is array(natural range <>) of positive;
+    constant WIDTHS : width_array := (3, 5, 8, 12, 16, 24, 32, 64);
+
+    file fh : octet_file;
+    variable fstatus : file_open_status;
+    variable width, refin, refout : unsigned(7 downto 0);
+    variable poly, xor_in, xor_out, check : unsigned(63 downto 0);
+    variable entry : natural := 0;
+  begin
+    report "Seed: " & integer'image(TEST_SEED);
+    seed(TEST_SEED);
+
+    -- Standard CRCs from the catalogue file
+    file_open(fstatus, fh, CATALOGUE_FILE, read_mode);
+    assert fstatus = open_ok report "Unable to open " & CATALOGUE_FILE severity failure;
+
+    while not endfile(fh) loop
+      read(fh, little_endian, width);
+      read(fh, little_endian, refin);
+      read(fh, little_endian, refout);
+      read(fh, little_endian, poly);
+      read(fh, little_endian, xor_in);
+      read(fh, little_endian, xor_out);
+      read(fh, little_endian, check);
+
+      for slices in 1 to 4 loop
+        check_catalogue(to_integer(width), slices, poly, xor_in, xor_out, check,
+          refin = 1, refout = 1, entry);
+      end loop;
+      entry := entry + 1;
+    end loop;
+    file_close(fh);
+    report "Checked " & integer'image(entry) & " catalogue entries";
+
+    -- Random polynomials including widths that aren't multiples of 8
+    for i in WIDTHS'range loop
+      for slices in 1 to 8 loop
+        check_random(WIDTHS(i), slices);
+      end loop;
+    end loop;
+
+    wait;
+  end process;
+end architecture;
@@ -0,0 +1,64 @@
+--# Copyright  2014 Kevin Thibedeau
+
+library ieee;
+use ieee.std_logic_1164.all;
+
+library extras;
+use extras.hamming_edac.all;
+use extras.random.all;
+
+entity test_edac_throughput is
+  generic (
+    DATA_SIZE : positive := 64;
+    USE_TABLE : boolean;
+    DECODES   : positive := 10000;
+    TEST_SEED : positive := 1234
+  );
+end entity;
+
+architecture tb of test_edac_throughput is
+begin
+
+  -- Repeatedly decode a set of words with single-bit errors using either the
+  -- interleaved or the table driven functions
+  decode: process
+    subtype word is std_ulogic_vector(DATA_SIZE-1 downto 0);
+    constant WORD_ECC : ecc_range := hamming_indices(DATA_SIZE);
+    subtype ecc_word is ecc_vector(WORD_ECC.left downto WORD_ECC.right);
+
+    constant POOL_SIZE : positive := 256;
+    type word_array is array(0 to POOL_SIZE-1) of word;
+    type ecc_word_array is array(0 to POOL_SIZE-1) of ecc_word;
+
+    constant MATRIX : bit_vector := hamming_matrix(DATA_SIZE);
+    constant SYN_TABLE : syndrome_table := hamming_syndrome_table(DATA_SIZE);
+
+    variable data : word_array;
+    variable encoded : ecc_word_array;
+    variable corrected : word;
+    variable flipped_bit : integer;
+  begin
+    seed(TEST_SEED);
+
+    for i in data'range loop
+      data(i) := to_stdulogicvector(random(DATA_SIZE));
+      encoded(i) := hamming_encode(data(i));
+      flipped_bit := randint(ecc_word'low, ecc_word'high);
+      encoded(i)(flipped_bit) := not encoded(i)(flipped_bit);
+    end loop;
+
+    for i in 0 to DECODES-1 loop
+      if USE_TABLE then
+        corrected := hamming_decode(encoded(i mod POOL_SIZE), MATRIX, SYN_TABLE);
+      else
+        corrected := hamming_decode(encoded(i mod POOL_SIZE));
+      end if;
+
+      assert corrected = data(i mod POOL_SIZE) report "Mismatch decoded data" severity failure;
+    end loop;
+
+    report "Decoded " & integer'image(DECODES) & " words";
+    wait;
+  end process;
+
+end architecture;
@@ -34,12 +34,16 @@ begin
 
       variable message  : std_ulogic_vector(hamming_word'length downto 1);
       variable syndrome : unsigned(-hamming_word'low downto 1);
+
+      constant MATRIX : bit_vector := hamming_matrix(word'length);
+      constant SYN_TABLE : syndrome_table := hamming_syndrome_table(word'length);
     begin
 
       for i in 1 to 50 loop
         data := std_ulogic_vector(to_stdlogicvector(random(word'length)));
 
         hamming_word := hamming_encode(data);
+        assert hamming_encode(data, MATRIX) = hamming_word report "Matrix encode mismatch" severity failure;
 
         inject_error := random;
         if inject_error then -- Flip a bit
@@ -62,6 +66,11 @@ begin
         assert error_detected = inject_error report "Interleave, undetected error" severity failure;
         assert corrected_data = data report "Interleave, mismatch decoded data" severity failure;
 
+        -- Check table driven decode
+        assert hamming_syndrome(hamming_word, MATRIX) = syndrome report "Matrix syndrome mismatch" severity failure;
+        corrected_data := hamming_decode(hamming_word, MATRIX, SYN_TABLE);
+        assert corrected_data = data report "Table, mismatch decoded data" severity failure;
+
       end loop;
 
       wait;
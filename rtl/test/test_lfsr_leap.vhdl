@@ -0,0 +1,157 @@
+--# Copyright  2014 Kevin Thibedeau
+
+library ieee;
+use ieee.std_logic_1164.all;
+
+library extras;
+use extras.lfsr_ops.all;
+use extras.timing_ops.all;
+
+entity test_lfsr_leap is
+  generic (
+    WIDTH : positive := 8;
+    STEPS : positive := 4;
+    KIND : lfsr_kind := normal;
+    FULL_CYCLE : boolean := false
+  );
+end entity;
+
+architecture test of test_lfsr_leap is
+  signal clock, reset : std_ulogic;
+  signal sim_done : boolean := false;
+  constant CLOCK_FREQ : frequency := 100 MHz;
+
+  constant TAP_MAP : std_ulogic_vector(1 to WIDTH-1) := lfsr_taps(WIDTH);
+  constant INIT_ZERO : boolean := KIND = inverted;
+
+  signal gstate, fstate : std_ulogic_vector(1 to WIDTH);
+begin
+
+  stim: process
+    constant PERIOD : natural := 2**WIDTH - 1;
+
+    -- Cascade single steps as a reference
+    function galois_steps(State : std_ulogic_vector; N : natural;
+      Full_cycle : boolean) return std_ulogic_vector is
+      variable s : std_ulogic_vector(State'range) := State;
+    begin
+      for i in 1 to N loop
+        s := next_galois_lfsr(s, TAP_MAP, KIND, Full_cycle);
+      end loop;
+      return s;
+    end function;
+
+    function fibonacci_steps(State : std_ulogic_vector; N : natural;
+      Full_cycle : boolean) return std_ulogic_vector is
+      variable s : std_ulogic_vector(State'range) := State;
+    begin
+      for i in 1 to N loop
+        s := next_fibonacci_lfsr(s, TAP_MAP, KIND, Full_cycle);
+      end loop;
+      return s;
+    end function;
+
+    constant GMATRIX : bit_vector := galois_lfsr_matrix(TAP_MAP, STEPS, KIND);
+    constant FMATRIX : bit_vector := fibonacci_lfsr_matrix(TAP_MAP, STEPS, KIND);
+
+    variable gref, fref, gleap, fleap, s0 : std_ulogic_vector(1 to WIDTH);
+  begin
+    if INIT_ZERO then
+      s0 := (others => '0');
+    else
+      s0 := (others => '1');
+    end if;
+
+    if not FULL_CYCLE then
+      -- Leap matrix matches cascaded steps
+      gref := s0; fref := s0;
+      gleap := s0; fleap := s0;
+      for i in 1 to 50 loop
+        gref  := galois_steps(gref, STEPS, false);
+        gleap := leap_lfsr(gleap, GMATRIX);
+        assert gleap = gref
+          report "Galois leap mismatch at " & integer'image(i) severity failure;
+
+        fref  := fibonacci_steps(fref, STEPS, false);
+        fleap := leap_lfsr(fleap, FMATRIX);
+        assert fleap = fref
+          report "Fibonacci leap mismatch at " & integer'image(i) severity failure;
+      end loop;
+
+      -- Jumps compose and wrap around after a full period
+      gref := galois_steps(s0, 3*STEPS + 1, false);
+      assert jump_galois_lfsr(s0, TAP_MAP, 3*STEPS + 1, KIND) = gref
+        report "Galois jump mismatch" severity failure;
+      assert jump_galois_lfsr(jump_galois_lfsr(s0, TAP_MAP, 1000, KIND), TAP_MAP, 2345, KIND) =
+        jump_galois_lfsr(s0, TAP_MAP, 3345, KIND)
+        report "Galois jumps don't compose" severity failure;
+      assert jump_galois_lfsr(s0, TAP_MAP, PERIOD, KIND) = s0
+        report "Galois jump doesn't wrap after full period" severity failure;
+      assert jump_galois_lfsr(s0, TAP_MAP, 0, KIND) = s0
+        report "Galois jump of zero changed state" severity failure;
+
+      fref := fibonacci_steps(s0, 3*STEPS + 1, false);
+      assert jump_fibonacci_lfsr(s0, TAP_MAP, 3*STEPS + 1, KIND) = fref
+        report "Fibonacci jump mismatch" severity failure;
+      assert jump_fibonacci_lfsr(jump_fibonacci_lfsr(s0, TAP_MAP, 1000, KIND), TAP_MAP, 2345, KIND) =
+        jump_fibonacci_lfsr(s0, TAP_MAP, 3345, KIND)
+        report "Fibonacci jumps don't compose" severity failure;
+      assert jump_fibonacci_lfsr(s0, TAP_MAP, PERIOD, KIND) = s0
+        report "Fibonacci jump doesn't wrap after full period" severity failure;
+    end if;
+
+    -- Entities advance STEPS on each clock
+    reset <= '1';
+    wait until rising_edge(clock);
+    reset <= '0';
+    wait until falling_edge(clock);
+
+    gref := s0; fref := s0;
+    for i in 1 to 50 loop
+      assert gstate = gref
+        report "Galois entity mismatch at " & integer'image(i) severity failure;
+      assert fstate = fref
+        report "Fibonacci entity mismatch at " & integer'image(i) severity failure;
+
+      gref := galois_steps(gref, STEPS, FULL_CYCLE);
+      fref := fibonacci_steps(fref, STEPS, FULL_CYCLE);
+      wait until falling_edge(clock);
+    end loop;
+
+    sim_done <= true;
+    wait;
+  end process;
+
+  gl: galois_lfsr
+    generic map (
+      INIT_ZERO  => INIT_ZERO,
+      FULL_CYCLE => FULL_CYCLE,
+      STEPS_PER_CLOCK => STEPS
+    ) port map (
+      Clock   => clock,
+      Reset   => reset,
+      Enable  => '1',
+      Tap_map => TAP_MAP,
+      State   => gstate
+    );
+
+  fl: fibonacci_lfsr
+    generic map (
+      INIT_ZERO  => INIT_ZERO,
+      FULL_CYCLE => FULL_CYCLE,
+      STEPS_PER_CLOCK => STEPS
+    ) port map (
+      Clock   => clock,
+      Reset   => reset,
+      Enable  => '1',
+      Tap_map => TAP_MAP,
+      State   => fstate
+    );
+
+  cgen: process
+  begin
+    clock_gen(clock, sim_done, CLOCK_FREQ);
+    wait;
+  end process;
+
+end architecture;
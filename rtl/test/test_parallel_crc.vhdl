@@ -0,0 +1,139 @@
+--# Copyright  2014 Kevin Thibedeau
+
+library ieee;
+use ieee.std_logic_1164.all;
+
+library extras;
+use extras.crc_ops.all;
+use extras.random.all;
+use extras.timing_ops.all;
+
+entity test_parallel_crc is
+  generic (
+    PIPELINE  : boolean := false;
+    TEST_SEED : positive := 1234
+  );
+end entity;
+
+architecture test of test_parallel_crc is
+  signal clock : std_ulogic;
+  signal sim_done : boolean := false;
+  constant CLOCK_FREQ : frequency := 100 MHz;
+
+  -- CRC-32
+  constant POLY    : bit_vector := X"04C11DB7";
+  constant XOR_IN  : bit_vector := X"FFFFFFFF";
+  constant XOR_OUT : bit_vector := X"FFFFFFFF";
+  constant REFLECT : boolean := true;
+
+  constant DATA_WIDTH : positive := 128;
+
+  signal initialize, enable : std_ulogic := '0';
+  signal data : std_ulogic_vector(DATA_WIDTH-1 downto 0);
+  signal checksum : std_ulogic_vector(POLY'range);
+begin
+
+  stim: process
+
+    -- Compare the matrix and serial functions on random data
+    procedure check_matrix(Width, Data_width : positive) is
+      constant POLY_BV : bit_vector(Width-1 downto 0) := random(Width);
+      constant MATRIX  : bit_vector := crc_matrix(POLY_BV, Data_width);
+
+      variable crc_ref, crc_par : bit_vector(Width-1 downto 0);
+      variable d : bit_vector(Data_width-1 downto 0);
+      variable refin : boolean;
+    begin
+      for t in 1 to 10 loop
+        crc_ref := random(Width);
+        d       := random(Data_width);
+        refin   := random;
+
+        crc_par := next_crc_parallel(crc_ref, MATRIX, refin, d);
+        crc_ref := next_crc(crc_ref, POLY_BV, refin, d);
+
+        assert crc_par = crc_ref
+          report "Matrix mismatch: width=" & integer'image(Width) & " data=" & integer'image(Data_width)
+          severity failure;
+      end loop;
+    end procedure;
+
+    type width_array is array(natural range <>) of positive;
+    constant CRC_WIDTHS  : width_array := (5, 8, 16, 32);
+    constant DATA_WIDTHS : width_array := (1, 7, 8, 64, 128, 512);
+
+    variable crc_v : bit_vector(POLY'range);
+    variable data_v : bit_vector(data'range);
+    variable en : boolean;
+  begin
+    report "Seed: " & integer'image(TEST_SEED);
+    seed(TEST_SEED);
+
+    for c in CRC_WIDTHS'range loop
+      for d in DATA_WIDTHS'range loop
+        check_matrix(CRC_WIDTHS(c), DATA_WIDTHS(d));
+      end loop;
+    end loop;
+
+    -- Feed random words to the entity with gaps in Enable
+    for trial in 1 to 5 loop
+      initialize <= '1';
+      wait until rising_edge(clock);
+      initialize <= '0';
+
+      crc_v := init_crc(XOR_IN);
+      for i in 1 to randint(1, 50) loop
+        data_v := random(data_v'length);
+        en := random;
+        data <= to_stdulogicvector(data_v);
+        if en then
+          enable <= '1';
+          crc_v := next_crc(crc_v, POLY, REFLECT, data_v);
+        else
+          enable <= '0';
+        end if;
+        wait until rising_edge(clock);
+      end loop;
+      enable <= '0';
+
+      -- Wait for the pipeline to drain
+      for i in 1 to 2 loop
+        wait until rising_edge(clock);
+      end loop;
+      wait until falling_edge(clock);
+
+      assert to_bitvector(checksum) = end_crc(crc_v, REFLECT, XOR_OUT)
+        report "Checksum mismatch in trial " & integer'image(trial) severity failure;
+    end loop;
+
+    sim_done <= true;
+    wait;
+  end process;
+
+  dut: parallel_crc
+    generic map (
+      POLY        => POLY,
+      XOR_IN      => XOR_IN,
+      XOR_OUT     => XOR_OUT,
+      REFLECT_IN  => REFLECT,
+      REFLECT_OUT => REFLECT,
+      PIPELINE    => PIPELINE
+    )
+    port map (
+      Clock => clock,
+      Reset => '0',
+
+      Initialize => initialize,
+
+      Enable   => enable,
+      Data     => data,
+      Checksum => checksum
+    );
+
+  cgen: process
+  begin
+    clock_gen(clock, sim_done, CLOCK_FREQ);
+    wait;
+  end process;
+
+end architecture;
@@ -13,6 +13,8 @@ begin
     variable r : real;
     variable i : integer;
     variable b : boolean;
+    variable n : natural;
+    variable r2 : real;
   begin
     seed(42, 12);
 
@@ -35,6 +37,30 @@ begin
       report "Randbool: " & boolean'image(b);
     end loop;
 
+    -- Known answers for the xorshift PRNG
+    set_prng(xorshift);
+    seed(42, 12);
+    assert random(32) = X"76F8529E" report "xorshift word mismatch" severity failure;
+    n := random;
+    assert n = 11025904 report "xorshift natural mismatch" severity failure;
+    assert random(64) = X"73376F845B52DBC2" report "xorshift vector mismatch" severity failure;
+
+    for j in 1 to 1000 loop
+      r := random;
+      assert r > 0.0 and r < 1.0 report "xorshift real out of range" severity failure;
+      i := randint(-3, 5);
+      assert i >= -3 and i <= 5 report "xorshift randint out of range" severity failure;
+    end loop;
+
+    -- The uniform PRNG is unaffected by the xorshift state
+    set_prng(uniform_real);
+    seed(42, 12);
+    r := random;
+    n := random;
+    seed(42, 12);
+    r2 := random;
+    assert r = r2 report "uniform_real not reproducible" severity failure;
+
     wait;
   end process;
 
@@ -0,0 +1,48 @@
+--# Copyright  2014 Kevin Thibedeau
+
+library extras;
+use extras.random.all;
+
+entity test_random_throughput is
+  generic (
+    SIZE         : positive := 256;
+    WORDS        : positive := 10000;
+    USE_XORSHIFT : boolean;
+    TEST_SEED    : positive := 1234
+  );
+end entity;
+
+architecture tb of test_random_throughput is
+begin
+
+  -- Generate wide random vectors with either PRNG
+  gen: process
+    variable bv : bit_vector(SIZE-1 downto 0);
+    variable ones : natural := 0;
+  begin
+    if USE_XORSHIFT then
+      set_prng(xorshift);
+    else
+      set_prng(uniform_real);
+    end if;
+    seed(TEST_SEED);
+
+    for i in 1 to WORDS loop
+      bv := random(SIZE);
+
+      for j in bv'range loop
+        if bv(j) = '1' then
+          ones := ones + 1;
+        end if;
+      end loop;
+    end loop;
+
+    -- Rough check that the bits are balanced
+    assert abs(real(ones) / real(SIZE * WORDS) - 0.5) < 0.01
+      report "Unbalanced random bits" severity failure;
+
+    report "Generated " & integer'image(WORDS) & " words";
+    wait;
+  end process;
+
+end architecture;
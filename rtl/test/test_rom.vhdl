@@ -1,13 +1,11 @@
 --# Copyright  2014 Kevin Thibedeau
 
-use std.textio.all;
-
 library ieee;
 use ieee.std_logic_1164.all;
-use ieee.std_logic_textio.all;
 
 library extras;
 use extras.memory.all;
+use extras.binaryio.all;
 use extras.timing_ops.all;
 
 entity test_rom is
@@ -37,8 +35,7 @@ begin
 
   stim: process
     variable rd_log : word_vec(1 to ROM_SIZE);
-    file rom_out : text open write_mode is OUT_ROM_FILE;
-    variable l : line;
+    file rom_out : octet_file open write_mode is OUT_ROM_FILE;
   begin
 
     re <= '0';
@@ -54,10 +51,9 @@ begin
       end if;
     end loop;
 
-    -- Write ROM data
+    -- Write ROM data as a vector file
     for i in rd_log'range loop
-      write(l, rd_log(i));
-      writeline(rom_out, l);
+      write(rom_out, little_endian, rd_log(i));
     end loop;
 
     sim_done <= true;
@@ -36,12 +36,16 @@ begin
 
       variable message  : std_ulogic_vector(secded_word'length-1 downto 1);
       variable syndrome : unsigned(-(secded_word'low+1) downto 1);
+
+      constant MATRIX : bit_vector := hamming_matrix(word'length);
+      constant SYN_TABLE : syndrome_table := hamming_syndrome_table(word'length);
     begin
 
       for i in 1 to 50 loop
         data := std_ulogic_vector(to_stdlogicvector(random(word'length)));
 
         secded_word := secded_encode(data);
+        assert secded_encode(data, MATRIX) = secded_word report "Matrix encode mismatch" severity failure;
 
         inject_error := random;
         if inject_error then -- Flip a bit
@@ -67,6 +71,13 @@ begin
           report "Interleave, undetected error" severity failure;
         assert corrected_data = data report "Interleave, mismatch decoded data" severity failure;
 
+        -- Check table driven decode
+        secded_error := secded_has_errors(secded_word, MATRIX);
+        assert secded_error(single_bit) = inject_error and secded_error(double_bit) = false
+          report "Table, undetected error" severity failure;
+        corrected_data := secded_decode(secded_word, MATRIX, SYN_TABLE);
+        assert corrected_data = data report "Table, mismatch decoded data" severity failure;
+
       end loop;
 
       wait;
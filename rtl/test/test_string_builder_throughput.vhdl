@@ -0,0 +1,50 @@
+--# Copyright  2014 Kevin Thibedeau
+
+library extras;
+use extras.strings_unbounded.all;
+
+entity test_string_builder_throughput is
+  generic (
+    CHARS       : positive := 1000000;
+    USE_BUILDER : boolean
+  );
+end entity;
+
+architecture tb of test_string_builder_throughput is
+begin
+
+  -- Build a string one character at a time using either a string_builder
+  -- or repeated appends to an unbounded_string
+  build: process
+    variable sb : string_builder;
+    variable sa : unbounded_string;
+    variable c : character;
+  begin
+    for i in 0 to CHARS-1 loop
+      c := character'val(character'pos('a') + i mod 26);
+
+      if USE_BUILDER then
+        append(sb, c);
+      else
+        append(sa, c);
+      end if;
+    end loop;
+
+    if USE_BUILDER then
+      finalize(sb, sa);
+    end if;
+
+    assert sa.all'length = CHARS report "Length mismatch" severity failure;
+
+    for i in 0 to CHARS-1 loop
+      assert sa(i+1) = character'val(character'pos('a') + i mod 26)
+        report "Content mismatch" severity failure;
+    end loop;
+
+    free(sa);
+
+    report "Appended " & integer'image(CHARS) & " characters";
+    wait;
+  end process;
+
+end architecture;
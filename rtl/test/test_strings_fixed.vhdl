@@ -45,6 +45,28 @@ begin
     i := index("ABCDAB", "XXX");
     assert i = 0 report "index 3: unexpected result" severity failure;
 
+    i := index("abcDAbxAB", "AB", mapping => UPPER_CASE_MAP);
+    assert i = 1 report "index 3a: unexpected result" severity failure;
+
+    i := index("abcDAbxAB", "AB", going => backward, mapping => UPPER_CASE_MAP);
+    assert i = 8 report "index 3b: unexpected result" severity failure;
+
+    i := index("the quick brown fox jumps over the lazy dog", "the", going => backward);
+    assert i = 32 report "index 3c: unexpected result" severity failure;
+
+    i := index("aaabaaab", "aab");
+    assert i = 2 report "index 3d: unexpected result" severity failure;
+
+    i := index("aaabaaab", "baa", going => backward);
+    assert i = 4 report "index 3e: unexpected result" severity failure;
+
+    i := index("AB", "ABC", going => backward);
+    assert i = 0 report "index 3f: unexpected result" severity failure;
+
+    t := "__xyzxyz__";
+    i := index(t(3 to 8), "zx");
+    assert i = 5 report "index 3g: unexpected result" severity failure;
+
     -- index (character set)
     i := index("ABCDB", to_set('B'));
     assert i = 2 report "index 4: unexpected result" severity failure;
@@ -81,6 +103,12 @@ begin
     i := count("ABCDAB", "ABCDABXXX");
     assert i = 0 report "count 4: unexpected result" severity failure;
 
+    i := count("aaaa", "aa");
+    assert i = 3 report "count 4a: unexpected result" severity failure;
+
+    i := count("abCAbcaBC", "ABC", mapping => UPPER_CASE_MAP);
+    assert i = 3 report "count 4b: unexpected result" severity failure;
+
     -- count (character set)
     i := count("ABCDAB", to_set('A'));
     assert i = 2 report "count 5: unexpected result" severity failure;
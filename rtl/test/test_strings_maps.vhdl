@@ -96,6 +96,9 @@ begin
       -- cs3 must be a subset of cs2
       assert is_subset(cs3, cs2) report "is_subset mismatch 2" severity failure;
 
+      -- cs can only be a subset of cs3 when it is empty
+      assert is_subset(cs, cs3) = (to_sequence(cs) = "") report "is_subset mismatch 3" severity failure;
+
     end loop;
 
 
@@ -19,6 +19,7 @@ begin
     variable n, first, last : natural;
     variable c : character;
     variable b : boolean;
+    variable sb : string_builder;
   begin
 
     s := "0123456789";
@@ -309,6 +310,36 @@ begin
     trim(sa, to_set("AB"), to_set(""));
     assert sa.all = "01234567" report "trim 10: unexpected result" severity failure;
 
+
+    -- String builder
+    finalize(sb, sa);
+    assert sa.all = "" report "finalize: empty builder" severity failure;
+
+    initialize(sb, 4);
+    append(sb, "012");
+    append(sb, '3');
+    sa2 := to_unbounded_string("456789");
+    append(sb, sa2);
+    length(sb, n);
+    assert n = 10 report "string_builder length error" severity failure;
+
+    to_string(sb, s);
+    assert s = "0123456789" report "string_builder to_string mismatch" severity failure;
+
+    for i in 1 to 100 loop
+      append(sb, character'val(character'pos('a') + i mod 26));
+    end loop;
+    finalize(sb, sa);
+    assert sa.all'length = 110 and sa(1 to 11) = "0123456789b" and sa(110) = 'w'
+      report "finalize mismatch" severity failure;
+
+    length(sb, n);
+    assert n = 0 report "finalize: builder not empty" severity failure;
+
+    append(sb, "xyz");
+    finalize(sb, sa);
+    assert sa.all = "xyz" report "finalize: reused builder mismatch" severity failure;
+
     wait;
   end process;
 end architecture;
@@ -18,6 +18,10 @@ begin
     constant fname : string := "test/test-output/test_text_buffering.txt";
     variable sa, sa2 : unbounded_string;
     variable at_end : boolean;
+    variable count : natural;
+    variable n : positive;
+
+    constant BIG_LINES : positive := 20000;
   begin
 
     sa := to_unbounded_string("Line 1");
@@ -56,12 +60,13 @@ begin
     endbuffer(tb2, at_end);
     assert at_end report "Not at end of tb2" severity failure;
 
+    line_count(tb, count);
     free(tb);
 
     -- Append more lines
     append_file(fname, tb2);
 
-    assert tb2.lines = tb.lines * 2
+    assert tb2.lines = count * 2
       report "Linecount mismatch in extended tb2" severity failure;
 
     nextline(tb2, sa);
@@ -75,8 +80,48 @@ begin
     assert sa.all = "Line 3"
       report "Bad setline" severity failure;
 
+    setline(tb2, 7);
+    endbuffer(tb2, at_end);
+    assert at_end report "setline past end not at end" severity failure;
+
+    free(tb2);
+
+    line_count(tb2, count);
+    assert count = 0 report "Lines remain after free" severity failure;
+
+    -- Append a file into an empty buffer
+    append_file(fname, tb2);
+    line_count(tb2, count);
+    assert count = 3 report "Bad append to empty buffer" severity failure;
     free(tb2);
 
+
+    -- Random access into a large buffer
+    for i in 1 to BIG_LINES loop
+      append("Line" & integer'image(i), tb);
+    end loop;
+
+    line_count(tb, count);
+    assert count = BIG_LINES report "Line count mismatch in large buffer" severity failure;
+
+    n := 1;
+    for i in 1 to 1000 loop
+      n := (n * 7919 + 17) mod BIG_LINES + 1;
+      setline(tb, n);
+      nextline(tb, sa);
+
+      assert sa.all = "Line" & integer'image(n)
+        report "Bad setline in large buffer: " & integer'image(n) severity failure;
+      free(sa);
+    end loop;
+
+    setline(tb, BIG_LINES);
+    nextline(tb, sa);
+    endbuffer(tb, at_end);
+    assert at_end report "Not at end of large buffer" severity failure;
+
+    free(tb);
+
     wait;
   end process;
 
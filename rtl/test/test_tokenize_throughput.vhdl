@@ -0,0 +1,48 @@
+--# Copyright  2014 Kevin Thibedeau
+
+library extras;
+use extras.strings.all;
+use extras.strings_fixed.all;
+use extras.strings_maps.all;
+use extras.strings_maps_constants.all;
+
+entity test_tokenize_throughput is
+  generic (
+    CHARS : positive := 1000000
+  );
+end entity;
+
+architecture tb of test_tokenize_throughput is
+begin
+
+  -- Split a large string into tokens with find_token()
+  tokenize: process
+    constant PATTERN : string := "abc123, ";
+    variable text : string(1 to CHARS);
+    variable pos, first, last, tokens : natural;
+  begin
+    for i in text'range loop
+      text(i) := PATTERN((i-1) mod PATTERN'length + 1);
+    end loop;
+
+    pos := 1;
+    tokens := 0;
+    while pos <= CHARS loop
+      find_token(text(pos to CHARS), ALPHANUMERIC_SET, inside, first, last);
+      exit when last = 0;
+
+      assert text(first to last) = PATTERN(1 to last-first+1) report "Token mismatch" severity failure;
+      tokens := tokens + 1;
+
+      pos := index(text(last+1 to CHARS), SPECIAL_SET, outside);
+      exit when pos = 0;
+    end loop;
+
+    assert tokens = (CHARS + PATTERN'length - 1) / PATTERN'length
+      report "Token count mismatch" severity failure;
+
+    report "Found " & integer'image(tokens) & " tokens";
+    wait;
+  end process;
+
+end architecture;
@@ -0,0 +1,522 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Maximal length LFSR and LCAR table generator
+
+   Searches for primitive polynomials and rule 90/150 cellular automata
+   with primitive characteristic polynomials and prints them in the format
+   of the LFSR_COEFF_TABLE in lfsr_ops.vhdl and the LCAR_RULE_TABLE in
+   lcar_ops.vhdl. Existing tables can be checked with --check.
+
+   A polynomial of degree n is primitive when it is irreducible and x has
+   order 2**n-1 modulo the polynomial. The order test needs the prime
+   factors of 2**n-1. These are found with trial division, Pollard's rho,
+   and ECM on the cyclotomic factors of 2**n-1. Factors that take too long
+   to find can be supplied from a file with --factors. Factorizations found
+   by the tool can be saved with --save-factors to skip the work on later
+   runs. The factors for sizes up to 256 are in scripts/mersenne_factors.txt.
+
+   Polynomials are represented as integers with bit i holding the
+   coefficient of x**i.
+'''
+
+# Copyright © 2014 Kevin Thibedeau
+
+# This file is part of VHDL-extras.
+
+from __future__ import print_function, division
+
+import sys
+import io
+import re
+import time
+import random
+import argparse
+import multiprocessing
+
+
+class FactorError(Exception):
+    '''A factor of 2**n-1 couldn't be found within the effort limit'''
+    pass
+
+
+#### GF(2) polynomial arithmetic ####
+
+def poly_sqr(a):
+    '''Square a polynomial. Squaring spreads the coefficients apart.'''
+    return int('0'.join(bin(a)[2:]), 2)
+
+def poly_mod(a, p):
+    '''Remainder of a divided by p'''
+    dp = p.bit_length()
+    da = a.bit_length()
+    while da >= dp:
+        a ^= p << (da - dp)
+        da = a.bit_length()
+    return a
+
+def poly_gcd(a, b):
+    while b:
+        a, b = b, poly_mod(a, b)
+    return a
+
+def poly_powx(e, p):
+    '''x**e modulo p'''
+    n = p.bit_length() - 1
+    r = 1
+    for bit in bin(e)[2:]:
+        r = poly_mod(poly_sqr(r), p)
+        if bit == '1':
+            r <<= 1
+            if r >> n:
+                r ^= p
+    return r
+
+def is_irreducible(p):
+    '''Ben-Or irreducibility test'''
+    n = p.bit_length() - 1
+    if n < 1 or not p & 1:
+        return n == 1
+
+    u = 2 # x
+    for _ in range(n // 2):
+        u = poly_mod(poly_sqr(u), p) # x**(2**i)
+        if poly_gcd(p, u ^ 2) != 1:
+            return False
+    return True
+
+def is_primitive(p, factors):
+    '''Test for a primitive polynomial
+
+    factors is the set of prime factors of 2**n-1.
+    '''
+    if not is_irreducible(p):
+        return False
+
+    # An irreducible polynomial has x**(2**n-1) == 1. The order is the full
+    # period when it isn't reduced by any of the prime factors.
+    m = 2**(p.bit_length() - 1) - 1
+    return all(poly_powx(m // q, p) != 1 for q in factors if q != m)
+
+
+#### Factoring 2**n-1 ####
+
+def _igcd(a, b):
+    while b:
+        a, b = b, a % b
+    return a
+
+def _modinv(a, n):
+    r0, r1, s0, s1 = n, a % n, 0, 1
+    while r1:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        s0, s1 = s1, s0 - q * s1
+    return s0 % n
+
+def primes_upto(n):
+    sieve = bytearray([1]) * (n + 1)
+    sieve[0:2] = b'\x00\x00'
+    for i in range(2, int(n**0.5) + 1):
+        if sieve[i]:
+            sieve[i*i::i] = bytearray(len(sieve[i*i::i]))
+    return [i for i, s in enumerate(sieve) if s]
+
+_SMALL_PRIMES = primes_upto(20000)
+
+def is_probable_prime(n):
+    '''Miller-Rabin test with fixed bases'''
+    if n < 2:
+        return False
+    for p in _SMALL_PRIMES[:12]:
+        if n % p == 0:
+            return n == p
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for a in _SMALL_PRIMES[:12]:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def pollard_rho(n, limit, rnd):
+    '''Brent's variant of Pollard's rho. Returns None after limit iterations.'''
+    y, c, m = rnd.randrange(1, n), rnd.randrange(1, n), 128
+    g = r = q = 1
+    steps = 0
+    while g == 1:
+        x = y
+        for _ in range(r):
+            y = (y*y + c) % n
+        k = 0
+        while k < r and g == 1:
+            ys = y
+            for _ in range(min(m, r - k)):
+                y = (y*y + c) % n
+                q = q * abs(x - y) % n
+            g = _igcd(q, n)
+            k += m
+        steps += r
+        r *= 2
+        if steps > limit:
+            return None
+
+    if g == n: # Backtrack over the last batch
+        g = 1
+        while g == 1:
+            ys = (ys*ys + c) % n
+            g = _igcd(abs(x - ys), n)
+    return g if g != n else None
+
+def ecm_curve(n, b1, b2, rnd):
+    '''Run one curve of Lenstra's ECM
+
+    Uses Montgomery curves with Suyama's parameterization. Stage 2 is a
+    baby step giant step continuation up to b2. Returns a factor or None.
+    '''
+    sigma = rnd.randrange(6, n - 1)
+    u = (sigma*sigma - 5) % n
+    v = 4*sigma % n
+    x, z = pow(u, 3, n), pow(v, 3, n)
+    den = 16 * pow(u, 3, n) * v % n
+    g = _igcd(den, n)
+    if g != 1:
+        return g if g != n else None
+    a24 = pow(v - u, 3, n) * (3*u + v) * _modinv(den, n) % n
+
+    def dbl(p):
+        s = (p[0] + p[1])**2 % n
+        d = (p[0] - p[1])**2 % n
+        t = s - d
+        return (s * d % n, t * (d + a24*t) % n)
+
+    def add(p, q, diff):
+        a = (p[0] - p[1]) * (q[0] + q[1])
+        b = (p[0] + p[1]) * (q[0] - q[1])
+        return (diff[1] * (a + b)**2 % n, diff[0] * (a - b)**2 % n)
+
+    def mul(k, p):
+        r0, r1 = p, dbl(p)
+        for bit in bin(k)[3:]:
+            if bit == '1':
+                r0, r1 = add(r0, r1, p), dbl(r1)
+            else:
+                r0, r1 = dbl(r0), add(r0, r1, p)
+        return r0
+
+    # Stage 1
+    k = 1
+    for p in primes_upto(b1):
+        pe = p
+        while pe * p <= b1:
+            pe *= p
+        k *= pe
+    q = mul(k, (x, z))
+    g = _igcd(q[1], n)
+    if g != 1:
+        return g if g != n else None
+
+    # Stage 2
+    D = 210
+    q2 = dbl(q)
+    baby = {1: q, 3: add(q2, q, q)}
+    for j in range(5, D // 2, 2):
+        baby[j] = add(baby[j-2], q2, baby[j-4])
+    baby = [baby[j] for j in sorted(baby) if _igcd(j, D) == 1]
+
+    dq = mul(D, q)
+    m = max(2, b1 // D)
+    r, rp = mul(m*D, q), mul((m-1)*D, q)
+    acc = 1
+    while m*D < b2:
+        for s in baby:
+            acc = acc * (r[0]*s[1] - s[0]*r[1]) % n
+        r, rp = add(r, dq, rp), r
+        m += 1
+
+    g = _igcd(acc, n)
+    return g if g not in (1, n) else None
+
+def _split(n, effort):
+    '''Find a nontrivial factor of a composite n'''
+    rnd = random.Random(n)
+    f = pollard_rho(n, 200000, rnd)
+    if f:
+        return f
+
+    deadline = time.time() + effort
+    b1 = 2000
+    while time.time() < deadline:
+        f = ecm_curve(n, b1, 100*b1, rnd)
+        if f:
+            return f
+        b1 = min(int(b1 * 1.05), 250000)
+
+    raise FactorError('No factor found for {}-digit composite {}'.format(len(str(n)), n))
+
+def _mobius(n):
+    r, p = 1, 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            r = -r
+        p += 1
+    return -r if n > 1 else r
+
+def cyclotomic_2(d):
+    '''Value of the cyclotomic polynomial Phi_d(x) at x=2'''
+    num = den = 1
+    for e in range(1, d + 1):
+        if d % e == 0:
+            mu = _mobius(d // e)
+            if mu == 1:
+                num *= 2**e - 1
+            elif mu == -1:
+                den *= 2**e - 1
+    return num // den
+
+def mersenne_factors(n, known=(), effort=60.0):
+    '''Set of the prime factors of 2**n-1
+
+    2**n-1 is the product of Phi_d(2) for the divisors d of n so the
+    smaller cyclotomic values are factored separately. Primes in known are
+    divided out first. Raises FactorError when a composite can't be split
+    within effort seconds.
+    '''
+    known = [p for p in known if is_probable_prime(p)]
+    factors = set()
+    pending = []
+    for d in range(1, n + 1):
+        if n % d != 0:
+            continue
+        c = cyclotomic_2(d)
+        for p in known:
+            while c % p == 0 and c > p:
+                factors.add(p)
+                c //= p
+        for p in _SMALL_PRIMES:
+            if p >= c:
+                break
+            while c % p == 0 and c > p:
+                factors.add(p)
+                c //= p
+        pending.append(c)
+
+    while pending:
+        c = pending.pop()
+        if c == 1:
+            continue
+        if is_probable_prime(c):
+            factors.add(c)
+            continue
+        f = _split(c, effort)
+        pending.extend((f, c // f))
+
+    return factors
+
+
+#### Table searches ####
+
+def lcar_char_poly(rule):
+    '''Characteristic polynomial of a rule 90/150 LCAR with null boundaries
+
+    rule is a string of '0' for rule 90 and '1' for rule 150 cells. The
+    transition matrix is tridiagonal so its determinant follows the
+    continuant recurrence.
+    '''
+    prev, cur = 0, 1
+    for r in rule:
+        prev, cur = cur, (cur << 1) ^ (cur if r == '1' else 0) ^ prev
+    return cur
+
+def lfsr_poly(coeffs, n):
+    '''LFSR polynomial for a coefficient list in LFSR_COEFF_TABLE format'''
+    p = (1 << n) | 1
+    for c in coeffs:
+        if c != 0:
+            p |= 1 << c
+    return p
+
+def search_lfsr(n, factors):
+    '''Find a minimum weight primitive polynomial
+
+    Trinomials are tried first and then pentanomials. The taps with the
+    smallest exponents are preferred. Returns a coefficient tuple in the
+    format of LFSR_COEFF_TABLE.
+    '''
+    if n == 2:
+        return (1, 0, 0)
+
+    for a in range(1, n):
+        if is_primitive(lfsr_poly((a,), n), factors):
+            return (a, 0, 0)
+
+    for a in range(3, n):
+        for b in range(2, a):
+            for c in range(1, b):
+                if is_primitive(lfsr_poly((a, b, c), n), factors):
+                    return (a, b, c)
+
+    raise ValueError('No primitive polynomial found for {}'.format(n))
+
+def search_lcar(n, factors, seed=1):
+    '''Find a rule 90/150 LCAR with a primitive characteristic polynomial
+
+    Candidate rules are drawn from a PRNG seeded from the size so the
+    results are repeatable.
+    '''
+    rnd = random.Random(n * 1000 + seed)
+    while True:
+        rule = ''.join(rnd.choice('01') for _ in range(n))
+        if is_primitive(lcar_char_poly(rule), factors):
+            return rule
+
+
+#### Table formatting and parsing ####
+
+def format_lfsr_entry(n, coeffs, last=False):
+    text = '({}),'.format(','.join(str(c) for c in coeffs))
+    if last:
+        text = text[:-1] + ' '
+    return '    {:<11}-- {}'.format(text, n)
+
+def format_lcar_entry(n, rule, entry_size, last=False):
+    return '    "{}"{} -- {}'.format(rule.ljust(entry_size, '-'), ' ' if last else ',', n)
+
+def parse_lfsr_table(text):
+    '''Extract the LFSR_COEFF_TABLE entries from lfsr_ops.vhdl'''
+    return [(int(n), tuple(int(c) for c in coeffs.split(','))) for coeffs, n in \
+        re.findall(r'^\s*\(([\d,\s]+)\),?\s*--\s*(\d+)\s*$', text, re.M)]
+
+def parse_lcar_table(text):
+    '''Extract the LCAR_RULE_TABLE entries from lcar_ops.vhdl'''
+    return [(int(n), rule.rstrip('-')) for rule, n in \
+        re.findall(r'^\s*"([01-]+)",?\s*--\s*(\d+)\s*$', text, re.M)]
+
+
+#### Factor files ####
+
+def read_factors(fname):
+    '''Read known prime factors of 2**n-1
+
+    Each line has n followed by a colon and the factors separated by
+    whitespace. Lines starting with # are ignored.
+    '''
+    known = {}
+    with open(fname) as fh:
+        for line in fh:
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            n, factors = line.split(':', 1)
+            known[int(n)] = [int(f) for f in factors.split()]
+    return known
+
+def write_factors(fname, found):
+    with open(fname, 'w') as fh:
+        print('# Prime factors of 2**n-1', file=fh)
+        for n in sorted(found):
+            print('{}: {}'.format(n, ' '.join(str(f) for f in sorted(found[n]))), file=fh)
+
+def verify_factors(n, factors):
+    '''Check that a factorization of 2**n-1 is complete and prime'''
+    m = 2**n - 1
+    for f in factors:
+        if not is_probable_prime(f):
+            return False
+        while m % f == 0:
+            m //= f
+    return m == 1
+
+
+#### Worker ####
+
+def _run_width(job):
+    '''Search or check a single width in a pool process'''
+    table, n, known, effort, entry = job
+    try:
+        factors = mersenne_factors(n, known, effort)
+    except FactorError as e:
+        return n, None, None, str(e)
+
+    if entry is not None: # Check an existing entry
+        p = lfsr_poly(entry, n) if table == 'lfsr' else lcar_char_poly(entry)
+        return n, factors, entry, None if is_primitive(p, factors) else 'not maximal length'
+
+    if table == 'lfsr':
+        return n, factors, search_lfsr(n, factors), None
+    return n, factors, search_lcar(n, factors), None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Maximal length LFSR and LCAR table generator')
+    parser.add_argument('table', choices=('lfsr', 'lcar'), help='Table to generate')
+    parser.add_argument('--min', type=int, default=2, help='Smallest size')
+    parser.add_argument('--max', type=int, default=256, help='Largest size')
+    parser.add_argument('--entry-size', type=int, help='Padded size of LCAR entries')
+    parser.add_argument('--check', metavar='VHDL_FILE', help='Check the table in an existing file')
+    parser.add_argument('--factors', metavar='FILE', help='Known prime factors of 2**n-1')
+    parser.add_argument('--save-factors', metavar='FILE', help='Save the factorizations used')
+    parser.add_argument('--effort', type=float, default=60.0,
+        help='Seconds spent on ECM for each composite')
+    parser.add_argument('-j', '--jobs', type=int, help='Number of worker processes')
+    args = parser.parse_args()
+
+    known = read_factors(args.factors) if args.factors else {}
+
+    if args.check:
+        with io.open(args.check, encoding='latin-1') as fh: # VHDL sources are Latin-1
+            text = fh.read()
+        entries = parse_lfsr_table(text) if args.table == 'lfsr' else parse_lcar_table(text)
+        entries = [(n, e) for n, e in entries if args.min <= n <= args.max]
+    else:
+        entries = [(n, None) for n in range(args.min, args.max + 1)]
+
+    jobs = [(args.table, n, known.get(n, ()), args.effort, e) for n, e in entries]
+    entry_size = args.entry_size or args.max
+
+    found = dict(known)
+    failed = 0
+    pool = multiprocessing.Pool(args.jobs)
+    try:
+        for i, (n, factors, entry, err) in enumerate(pool.imap(_run_width, jobs)):
+            if factors is not None:
+                found[n] = factors
+            if err:
+                failed += 1
+                print('-- ERROR: {}: {}'.format(n, err), file=sys.stderr)
+                continue
+            if args.check:
+                continue
+            last = i == len(jobs) - 1
+            if args.table == 'lfsr':
+                print(format_lfsr_entry(n, entry, last))
+            else:
+                print(format_lcar_entry(n, entry, entry_size, last))
+            sys.stdout.flush()
+    finally:
+        pool.close()
+        pool.join()
+
+    if args.save_factors:
+        write_factors(args.save_factors, found)
+
+    if args.check:
+        print('{} entries checked, {} failed'.format(len(jobs), failed), file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,234 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''VHDL build driver
+
+   Compiles VHDL files with vcom in dependency order. Independent files
+   are compiled in parallel. Each file is
+   tracked in a cache keyed on a hash of its token stream and the
+   interface signatures of the files it depends on. Edits that only
+   touch comments or whitespace don't cause a recompile. Edits confined
+   to architectures and package bodies only recompile those units and
+   leave dependent files alone.
+'''
+
+# Copyright © 2014 Kevin Thibedeau
+
+from __future__ import print_function, division
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+import multiprocessing
+import subprocess as subp
+from multiprocessing.pool import ThreadPool
+
+import vdep
+from color import error, note
+
+
+def file_library(fname):
+    '''Library a file is compiled into, taken from its directory name'''
+    return os.path.basename(os.path.dirname(os.path.abspath(fname)))
+
+def file_standard(fname):
+    '''VHDL standard for a file
+
+    Libraries with a "_<std>" suffix on their name use that standard.
+    Everything else is VHDL-93.
+    '''
+    lib = file_library(fname)
+    if '_' in lib:
+        return lib.rsplit('_', 1)[1]
+    return '93'
+
+
+class CompileCache(object):
+    '''Record of the state of each file when it was last compiled'''
+    def __init__(self, cache_file):
+        self.cache_file = cache_file
+        try:
+            with open(cache_file, 'r') as fh:
+                self.entries = json.load(fh)
+        except (IOError, ValueError):
+            self.entries = {}
+
+    def get(self, fname):
+        return self.entries.get(fname)
+
+    def update(self, fname, entry):
+        self.entries[fname] = entry
+
+    def remove(self, fname):
+        self.entries.pop(fname, None)
+
+    def save(self):
+        tmp_file = self.cache_file + '.tmp'
+        with open(tmp_file, 'w') as fh:
+            json.dump(self.entries, fh, indent=1, sort_keys=True)
+
+        if os.path.exists(self.cache_file):
+            os.remove(self.cache_file)
+        os.rename(tmp_file, self.cache_file)
+
+
+# Compile modes
+FULL = 'full'
+IMPLEMENTATION = 'implementation'
+
+def plan_compile(dep_infos, cache, lib_dir, force=False):
+    '''Decide which files need to be compiled
+
+    dep_infos must be sorted in dependency order with hashes computed.
+    The signature of a file combines its interface hash with the
+    signatures of its dependencies. It changes whenever the file's
+    primary units need to be recompiled which in turn makes the
+    dependent files obsolete.
+
+    Returns a list of (FileInfo, mode, cache entry) for the files to
+    compile.
+    '''
+    sigs = {}
+    jobs = []
+    for fi in dep_infos:
+        dep_sigs = dict((d, sigs[d]) for d in fi.depends)
+        h = hashlib.sha1(fi.iface_hash.encode('utf-8'))
+        for d in sorted(dep_sigs):
+            h.update(dep_sigs[d].encode('utf-8'))
+        sigs[fi.name] = h.hexdigest()
+
+        entry = {'tokens': fi.token_hash, 'iface': fi.iface_hash, 'sig': sigs[fi.name], \
+            'deps': dep_sigs}
+
+        prev = cache.get(fi.name)
+        lib_exists = os.path.exists(os.path.join(lib_dir, file_library(fi.name)))
+
+        if force or prev is None or not lib_exists:
+            mode = FULL
+        elif prev['iface'] != fi.iface_hash or prev['deps'] != dep_sigs:
+            mode = FULL
+        elif prev['tokens'] != fi.token_hash:
+            mode = IMPLEMENTATION
+        else:
+            continue # Up to date
+
+        jobs.append((fi, mode, entry))
+
+    return jobs
+
+
+def vcom_command(fname, mode, vcom_flags):
+    cmd = ['vcom'] + vcom_flags + ['-' + file_standard(fname), '-work', file_library(fname)]
+    if mode == IMPLEMENTATION:
+        cmd.extend(['-just', 'ab']) # Only architectures and package bodies
+    cmd.append(fname)
+    return cmd
+
+
+def compile_file(job):
+    '''Run vcom on a file
+
+    Returns a tuple with the job, a success flag, and the output of vcom.
+    '''
+    fi, mode, entry, vcom_flags, dry_run = job
+    cmd = vcom_command(fi.name, mode, vcom_flags)
+    if dry_run:
+        return job, True, ''
+
+    p = subp.Popen(cmd, stdout=subp.PIPE, stderr=subp.STDOUT)
+    out = p.communicate()[0]
+    return job, p.returncode == 0, out
+
+
+def build(files, build_dir='build', vcom_flags=None, force=False, dry_run=False, jobs=None):
+    '''Compile a set of VHDL files
+
+    Files are compiled level by level from the dependency graph. All of
+    the files in a level are independent of each other and are compiled
+    concurrently with up to jobs vcom processes.
+
+    Returns True if all compilations succeeded.
+    '''
+    jobs = jobs if jobs is not None else multiprocessing.cpu_count()
+    vcom_flags = vcom_flags if vcom_flags is not None else []
+    lib_dir = os.path.join(build_dir, 'lib')
+    cache = CompileCache(os.path.join(build_dir, 'compile_cache.json'))
+
+    dep_infos = vdep.parse_files(files, os.path.join(build_dir, 'vdep_index.json'))[0]
+
+    vdep.find_dependencies(dep_infos)
+    try:
+        dep_infos = vdep.sort_dependencies(dep_infos)
+    except vdep.DependencyCycleError as e:
+        print(error('ERROR: ' + str(e)))
+        return False
+
+    planned = dict((fi.name, (fi, mode, entry)) for fi, mode, entry in \
+        plan_compile(dep_infos, cache, lib_dir, force))
+
+    failed = set()
+    tpool = ThreadPool(max(1, jobs)) # Each thread waits on a vcom process
+    try:
+        for level in vdep.level_dependencies(dep_infos):
+            level_jobs = []
+            for fi in level:
+                if fi.name not in planned:
+                    continue
+
+                if fi.depends & failed:
+                    print(error('** Skipping: {} (failed dependency)'.format(fi.name)))
+                    failed.add(fi.name)
+                    cache.remove(fi.name)
+                    continue
+
+                fi, mode, entry = planned[fi.name]
+                level_jobs.append((fi, mode, entry, vcom_flags, dry_run))
+
+            for job, ok, out in tpool.imap_unordered(compile_file, level_jobs):
+                fi, mode, entry = job[:3]
+                status = '** Compiling:' if mode == FULL else '** Compiling (bodies only):'
+                print(status, 'std={} lib={}'.format(file_standard(fi.name), \
+                    file_library(fi.name)), fi.name)
+                if out:
+                    print(out, end='')
+                sys.stdout.flush()
+
+                if ok:
+                    cache.update(fi.name, entry)
+                else:
+                    failed.add(fi.name)
+                    cache.remove(fi.name)
+
+            if not dry_run:
+                cache.save()
+    finally:
+        tpool.close()
+        tpool.join()
+
+    compiled = len(planned) - len(failed)
+    print(note('{} compiled, {} up to date'.format(compiled, len(dep_infos) - len(planned))))
+    if failed:
+        print(error('{} failed'.format(len(failed))))
+
+    return not failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Incremental VHDL build driver')
+    parser.add_argument('files', nargs='+', help='VHDL source files')
+    parser.add_argument('--build-dir', default='build', help='Build directory')
+    parser.add_argument('--vcom-flags', default='', help='Additional vcom flags')
+    parser.add_argument('-f', '--force', action='store_true', help='Compile all files')
+    parser.add_argument('-n', '--dry-run', action='store_true', help='Only show what would be compiled')
+    parser.add_argument('-j', '--jobs', type=int, help='Number of concurrent vcom processes')
+    args = parser.parse_args()
+
+    ok = build(args.files, args.build_dir, args.vcom_flags.split(), args.force, args.dry_run, \
+        args.jobs)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
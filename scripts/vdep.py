@@ -11,6 +11,12 @@ from __future__ import print_function, division
 import os
 import sys
 import re
+import hashlib
+import json
+import argparse
+import heapq
+import random
+import time
 from color import error
 
 class FileInfo(object):
@@ -19,60 +25,310 @@ class FileInfo(object):
         self.lib = os.path.split(os.path.dirname(fname))[1]
 
         self.packages = []
+        self.units = []
         self.pkg_body_defs = []
         self.uses = []
         self.depends = set()
 
-    use_re = re.compile('^ *use +(.+);')
-    pkg_re = re.compile('^ *package +(.+) +is')
-    generic_pkg_re = re.compile('^ *package.*is +new +(.+)')
+        self.token_hash = None
+        self.iface_hash = None
+        self.size = 0
 
     def parse(self):
-        uses = []
-        pkg_defs = []
-        pkg_body_defs = []
-
+        '''Find the design units defined and referenced by the file
+
+        The file is read once and tokenized so that clauses split across
+        lines and code in comments are handled correctly. The token hash
+        changes with any edit other than to comments and whitespace. The
+        interface hash only covers the primary units (entities, package
+        declarations, contexts, and configurations) that other files can
+        depend on.
+        '''
         try:
             with open(self.name, 'r') as fh:
-                for line in fh:
-                    # Find use statements
-                    m = self.use_re.match(line)
-                    if m:
-                        # FIX: VHDL may allow use statements without a library: use pkg.foo;
-                        #print('# use:', m.group(1).split('.')[:2])
-                        #m.group(1).split('.')[:2]
-                        uses.append(m.group(1).split('.')[:2])
-
-                    # Find generic package instances
-                    m = self.generic_pkg_re.match(line)
-                    if m:
-                        uses.append(m.group(1).split('.')[:2])
-
-                    m = self.pkg_re.match(line)
-                    if m:
-                        fields = m.group(1).split()
-                        if fields[0].lower() == 'body':
-                            pkg_body_defs.append(fields[1])
-                        else:
-                            #print('## pkg:', fields[0])
-                            pkg_defs.append(self.lib + '.' + fields[0])
+                text = fh.read()
         except IOError:
-            pass
+            text = ''
+        self.size = len(text)
+        tokens = tokenize(text)
 
-        self.uses = uses
+        uses = []
+        units = []
+        pkg_defs = []
+        pkg_body_defs = []
+        iface = []
+        for kind, name, unit_tokens in design_units(tokens):
+            if kind in PRIMARY_UNITS:
+                units.append(self.lib + '.' + name)
+                if kind == 'package':
+                    pkg_defs.append(self.lib + '.' + name)
+                iface.extend(unit_tokens)
+            elif kind == 'package body':
+                pkg_body_defs.append(name)
+
+            for u in unit_references(unit_tokens):
+                if u[0] == 'work':
+                    u = [self.lib, u[1]]
+                if u not in uses:
+                    uses.append(u)
+
+        # Units defined in this file aren't external dependencies
+        self.uses = [u for u in uses if '.'.join(u) not in units]
+        self.units = units
         self.packages = pkg_defs
         self.pkg_body_defs = pkg_body_defs
+        self.token_hash = hash_tokens(tokens)
+        self.iface_hash = hash_tokens(iface)
+
+    # Parse results saved in a DependencyIndex
+    _index_fields = ('packages', 'units', 'pkg_body_defs', 'uses', 'token_hash', 'iface_hash', 'size')
+
+    def to_dict(self):
+        return dict((k, getattr(self, k)) for k in self._index_fields)
+
+    @classmethod
+    def from_dict(cls, fname, entry):
+        fi = cls(fname)
+        for k in cls._index_fields:
+            setattr(fi, k, entry[k])
+        return fi
 
 
+class DependencyIndex(object):
+    '''On-disk record of parsed files
+
+    Each entry holds the parse results for a file along with the
+    modification time and size it had when parsed. Files are only
+    parsed again when either of these change.
+    '''
+    def __init__(self, index_file):
+        self.index_file = index_file
+        try:
+            with open(index_file, 'r') as fh:
+                self.entries = json.load(fh)
+        except (IOError, ValueError):
+            self.entries = {}
+        self.modified = False
+        self.parsed = 0
+
+    def file_info(self, fname):
+        '''Get a FileInfo for fname, parsing it only if it has changed'''
+        try:
+            st = os.stat(fname)
+            stamp = [st.st_mtime, st.st_size]
+        except OSError:
+            stamp = None
+
+        entry = self.entries.get(fname)
+        if entry is not None and stamp is not None and entry['stamp'] == stamp:
+            return FileInfo.from_dict(fname, entry)
+
+        fi = FileInfo(fname)
+        fi.parse()
+        self.parsed += 1
+        if stamp is not None:
+            entry = fi.to_dict()
+            entry['stamp'] = stamp
+            self.entries[fname] = entry
+            self.modified = True
+        return fi
+
+    def prune(self, fnames):
+        '''Remove entries for files not in fnames'''
+        keep = set(fnames)
+        for f in list(self.entries):
+            if f not in keep:
+                del self.entries[f]
+                self.modified = True
+
+    def save(self):
+        if not self.modified:
+            return
+
+        index_dir = os.path.dirname(self.index_file)
+        if index_dir and not os.path.isdir(index_dir):
+            os.makedirs(index_dir)
+
+        tmp_file = self.index_file + '.tmp'
+        with open(tmp_file, 'w') as fh:
+            json.dump(self.entries, fh, indent=1, sort_keys=True)
+
+        if os.path.exists(self.index_file):
+            os.remove(self.index_file)
+        os.rename(tmp_file, self.index_file)
+        self.modified = False
+
+
+def parse_files(files, index_file=None):
+    '''Parse a list of files into FileInfo objects
+
+    When index_file is given only files that changed since the last call
+    are parsed. Returns a tuple with the FileInfo list and the number of
+    files that were parsed.
+    '''
+    if index_file is None:
+        dep_infos = []
+        for f in files:
+            fi = FileInfo(f)
+            fi.parse()
+            dep_infos.append(fi)
+        return dep_infos, len(dep_infos)
+
+    index = DependencyIndex(index_file)
+    dep_infos = [index.file_info(f) for f in files]
+    index.prune(files)
+    index.save()
+    return dep_infos, index.parsed
+
+
+_token_re = re.compile(r'''
+      \s+|--[^\n]*|/\*.*?\*/                     # Whitespace and comments
+    | (
+      [0-9]*[usUS]?[boxdBOXD]"[^"\n]*"          # Bit string
+    | "(?:[^"\n]|"")*"                          # String
+    | \\(?:[^\\\n]|\\\\)*\\                     # Extended identifier
+    | [a-zA-Z][a-zA-Z0-9_]*                     # Identifier
+    | [0-9][0-9_]*(?:\.[0-9_]+)?(?:\#[0-9a-fA-F_.]+\#)?(?:[eE][+-]?[0-9_]+)?
+    | (?<![a-zA-Z0-9_)\]\\])'.'                 # Character literal (not after a name)
+    | =>|\*\*|:=|/=|>=|<=|<>|<<|>>|\?\?|\?/=|\?<=|\?>=|\?=|\?<|\?>
+    | \S
+    )''', re.X | re.S)
+
+def tokenize(text):
+    '''Split VHDL source into a list of tokens
+
+    Comments and whitespace are dropped. Identifiers and reserved words
+    are converted to lower case. The whole text is scanned by a single
+    regex so the per-token work stays in the regex engine. Whitespace and
+    comments are matched as whole alternatives that capture nothing so
+    they are never split into tokens. A tick following a name or closing
+    bracket is an attribute or qualified expression rather than the start
+    of a character literal.
+    '''
+    return [t.lower() if t[0].isalpha() and t[-1] != '"' else t \
+        for t in _token_re.findall(text) if t]
+
+
+def _selected_name(tokens, i):
+    '''Get the library and unit from a selected name starting at tokens[i]'''
+    if i + 2 < len(tokens) and tokens[i+1] == '.':
+        return [tokens[i], tokens[i+2]]
+    return None
+
+def unit_references(tokens):
+    '''Find references to other design units in a unit's tokens
+
+    Covers use clauses, context references, entity and configuration
+    instantiation and binding, generic package and subprogram instances,
+    and the primary unit of architectures and package bodies. Names in
+    the current library are returned with the library "work".
+    Returns a list of [library, unit] pairs.
+    '''
+    refs = []
+    n = len(tokens)
+    prev = None
+    for i, tok in enumerate(tokens):
+        if tok == 'use' or (tok == 'context' and prev in (None, ';') and \
+                i + 2 < n and tokens[i+2] != 'is'):
+            # A list of selected names up to the ";"
+            j = i + 1
+            if j < n and tokens[j] in ('entity', 'configuration', 'open'):
+                pass # Binding indication handled below
+            else:
+                while j < n:
+                    ref = _selected_name(tokens, j)
+                    if ref:
+                        refs.append(ref)
+                    while j < n and tokens[j] not in (',', ';'):
+                        j += 1
+                    if j >= n or tokens[j] == ';':
+                        break
+                    j += 1
+
+        elif tok in ('entity', 'configuration') and prev in (':', 'use'):
+            ref = _selected_name(tokens, i+1)
+            if ref:
+                refs.append(ref)
+
+        elif tok == 'new' and prev == 'is':
+            ref = _selected_name(tokens, i+1)
+            if ref:
+                refs.append(ref)
+
+        elif tok == 'of' and i >= 2 and tokens[i-2] in ('architecture', 'configuration') and i+1 < n:
+            refs.append(['work', tokens[i+1]])
+
+        elif tok == 'body' and prev == 'package' and i+2 < n and tokens[i+2] == 'is':
+            refs.append(['work', tokens[i+1]])
+
+        prev = tok
+
+    return refs
+
+
+PRIMARY_UNITS = ('entity', 'package', 'context', 'configuration')
+
+def design_units(tokens):
+    '''Split a token stream into design units
+
+    Returns a list of (kind, name, tokens) tuples. The tokens of each
+    unit include its context clause. The kind of secondary units is
+    'architecture' or 'package body'.
+    '''
+    # Find the first token of each unit
+    starts = []
+    for i, tok in enumerate(tokens):
+        if i > 0 and tokens[i-1] != ';':
+            continue
+
+        nxt = tokens[i+1:i+4]
+        if tok in ('entity', 'context') and len(nxt) >= 2 and nxt[1] == 'is':
+            starts.append((i, tok, nxt[0]))
+        elif tok == 'package' and len(nxt) >= 2:
+            if nxt[0] == 'body' and len(nxt) >= 3 and nxt[2] == 'is':
+                starts.append((i, 'package body', nxt[1]))
+            elif nxt[1] == 'is':
+                starts.append((i, 'package', nxt[0]))
+        elif tok in ('architecture', 'configuration') and len(nxt) >= 2 and nxt[1] == 'of':
+            starts.append((i, tok, nxt[0]))
+
+    # Move each start back over the preceding library, use, and context clauses
+    bounds = []
+    for i, kind, name in starts:
+        start = i
+        while start > 0:
+            stmt = start - 1
+            while stmt > 0 and tokens[stmt-1] != ';':
+                stmt -= 1
+            if tokens[stmt] not in ('library', 'use', 'context'):
+                break
+            start = stmt
+        bounds.append((start, kind, name))
+
+    units = []
+    for j, (start, kind, name) in enumerate(bounds):
+        if j == 0:
+            start = 0
+        end = bounds[j+1][0] if j+1 < len(bounds) else len(tokens)
+        units.append((kind, name, tokens[start:end]))
+
+    return units
+
+
+def hash_tokens(tokens):
+    data = ''.join(t + '\0' for t in tokens)
+    if not isinstance(data, bytes):
+        data = data.encode('utf-8')
+    return hashlib.sha1(data).hexdigest()
 
 
 def find_dependencies(dep_infos):
-    all_packages = {}
+    all_units = {}
     std_libs = ['std', 'ieee']
 
     for fi in dep_infos:
-        for p in fi.packages:
-            all_packages[p] = fi.name
+        for p in fi.units:
+            all_units[p] = fi.name
 
     for fi in dep_infos:
         for u in fi.uses:
@@ -80,8 +336,8 @@ def find_dependencies(dep_infos):
                 continue
 
             lib_name = u[0] + '.' + u[1]
-            if lib_name in all_packages:
-                dep_name = all_packages[lib_name]
+            if lib_name in all_units:
+                dep_name = all_units[lib_name]
                 if dep_name != fi.name:
                     fi.depends.add(dep_name)
             else:
@@ -89,28 +345,140 @@ def find_dependencies(dep_infos):
                     '.'.join(u), fi.name)), file=sys.stderr)
 
 
+class DependencyCycleError(Exception):
+    pass
+
+
+def _find_cycle(names, by_name):
+    '''Find a dependency cycle among a set of files that couldn't be sorted
+
+    The depth first search keeps an explicit stack so that long dependency
+    chains don't exceed the recursion limit.
+    '''
+    names = set(names)
+    done = set()
+
+    def edges(n):
+        return iter(sorted(d for d in by_name[n].depends if d in names))
+
+    for start in sorted(names):
+        if start in done:
+            continue
+
+        path = [start]
+        on_path = set(path)
+        stack = [(start, edges(start))]
+        while stack:
+            n, deps = stack[-1]
+            for d in deps:
+                if d in done:
+                    continue
+                if d in on_path:
+                    return path[path.index(d):] + [d]
+                path.append(d)
+                on_path.add(d)
+                stack.append((d, edges(d)))
+                break
+            else: # All dependencies visited
+                stack.pop()
+                path.pop()
+                on_path.discard(n)
+                done.add(n)
+    return []
+
+
 def sort_dependencies(dep_infos):
-    targets = set()
-    new_infos = []
+    '''Sort files so that each one follows the files it depends on
+
+    This is Kahn's algorithm run in O(files + dependencies) time. Files
+    that become ready at the same time are taken in order of their names
+    so the result doesn't depend on the order of the input. Dependencies
+    on files not in dep_infos are ignored.
+
+    Raises DependencyCycleError if the dependencies have a cycle.
+    '''
+    by_name = dict((fi.name, fi) for fi in dep_infos)
+    indegree = dict((fi.name, 0) for fi in dep_infos)
+    dependents = dict((fi.name, []) for fi in dep_infos)
+
+    for fi in dep_infos:
+        for d in fi.depends:
+            if d in by_name:
+                indegree[fi.name] += 1
+                dependents[d].append(fi.name)
+
     # put all leaf nodes first
+    ready = [n for n, count in indegree.items() if count == 0]
+    heapq.heapify(ready)
+
+    new_infos = []
+    while ready:
+        n = heapq.heappop(ready)
+        new_infos.append(by_name[n])
+        for dn in dependents[n]:
+            indegree[dn] -= 1
+            if indegree[dn] == 0:
+                heapq.heappush(ready, dn)
+
+    if len(new_infos) < len(dep_infos):
+        unsorted = [n for n, count in indegree.items() if count > 0]
+        cycle = _find_cycle(unsorted, by_name)
+        raise DependencyCycleError('Dependency cycle: ' + ' -> '.join(cycle))
+
+    return new_infos
+
+
+def level_dependencies(dep_infos):
+    '''Group files into levels that can be compiled concurrently
+
+    dep_infos must be sorted in dependency order. Files in each level
+    only depend on files in earlier levels. Returns a list of levels with
+    each level a list of FileInfo objects.
+    '''
+    file_levels = {}
+    levels = []
     for fi in dep_infos:
-        if not fi.depends:
-            targets.add(fi.name)
-            new_infos.append(fi)
+        lvl = max([file_levels[d] + 1 for d in fi.depends if d in file_levels] or [0])
+        file_levels[fi.name] = lvl
+        if lvl == len(levels):
+            levels.append([])
+        levels[lvl].append(fi)
 
-    #print('### targets', targets)
+    return levels
 
-    while len(targets) < len(dep_infos):
-        for fi in dep_infos:
-            if fi.name in targets:
-                continue
 
-            satisfied = all([d in targets for d in fi.depends])
-            if satisfied:
-                targets.add(fi.name)
-                new_infos.append(fi)
+def synthetic_graph(num_files, max_depends=5, seed=1):
+    '''Generate a random acyclic set of files for benchmarking'''
+    rng = random.Random(seed)
+    dep_infos = []
+    for i in range(num_files):
+        fi = FileInfo('lib{}/file{:06d}.vhdl'.format(i % 4, i))
+        if i > 0:
+            for _ in range(rng.randint(0, max_depends)):
+                # Favor recent files to make long dependency chains
+                j = max(0, i - 1 - int(rng.expovariate(1.0 / 20)))
+                fi.depends.add(dep_infos[j].name)
+        dep_infos.append(fi)
 
-    return new_infos
+    rng.shuffle(dep_infos)
+    return dep_infos
+
+
+def benchmark(num_files):
+    dep_infos = synthetic_graph(num_files)
+    num_deps = sum(len(fi.depends) for fi in dep_infos)
+
+    t_start = time.time()
+    sorted_infos = sort_dependencies(dep_infos)
+    t_sort = time.time() - t_start
+
+    t_start = time.time()
+    levels = level_dependencies(sorted_infos)
+    t_level = time.time() - t_start
+
+    print('{} files, {} dependencies, {} levels'.format(num_files, num_deps, len(levels)))
+    print('  sort:  {:.3f} ms'.format(t_sort * 1000))
+    print('  level: {:.3f} ms'.format(t_level * 1000))
 
 
 def find_source(path):
@@ -122,26 +490,80 @@ def find_source(path):
 
     return sources
 
-#files = find_source('src/extras')
-
 
-files = sys.argv[1:]
-
-dep_infos = []
-for f in files:
-    fi = FileInfo(f)
-    fi.parse()
-    dep_infos.append(fi)
+def main():
+    parser = argparse.ArgumentParser(description='VHDL dependency tool')
+    parser.add_argument('files', nargs='*', help='VHDL source files')
+    parser.add_argument('--levels', action='store_true', \
+        help='List files in levels of independent compilations')
+    parser.add_argument('--benchmark', type=int, metavar='N', \
+        help='Time sorting a synthetic graph of N files')
+    parser.add_argument('--stats', action='store_true', \
+        help='Report the time taken to scan the files')
+    parser.add_argument('--index', metavar='FILE', \
+        help='Keep parse results in FILE and only parse changed files')
+    parser.add_argument('-o', '--output', metavar='FILE', \
+        help='Write rules to FILE. It is left untouched if the rules are unchanged')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+
+    #files = find_source('src/extras')
+    files = args.files
+
+    t_start = time.time()
+    dep_infos, parsed = parse_files(files, args.index)
+    t_scan = time.time() - t_start
+
+    if args.stats:
+        mbytes = sum(fi.size for fi in dep_infos) / 1.0e6
+        print('{} files ({} parsed), {:.3f} MB, {} units scanned in {:.3f} s ({:.1f} MB/s)'.format( \
+            len(dep_infos), parsed, mbytes, sum(len(fi.units) for fi in dep_infos), t_scan, \
+            mbytes / t_scan if t_scan > 0 else 0.0), file=sys.stderr)
+
+    find_dependencies(dep_infos)
+    try:
+        dep_infos = sort_dependencies(dep_infos)
+    except DependencyCycleError as e:
+        print(error('ERROR: ' + str(e)), file=sys.stderr)
+        sys.exit(1)
+
+    if args.levels:
+        for i, level in enumerate(level_dependencies(dep_infos)):
+            print('{}: {}'.format(i, ' '.join(fi.name for fi in level)))
+        return
+
+    rules = []
+    for fi in dep_infos:
+        target = os.path.basename(os.path.splitext(fi.name)[0]) + '.tag'
+        dep_tags = sorted(os.path.basename(os.path.splitext(d)[0]) + '.tag' for d in fi.depends)
+        rules.append('{}: {}\n'.format(target, ' '.join(dep_tags)))
+    rules = ''.join(rules)
 
+    if args.output:
+        write_if_changed(args.output, rules)
+    else:
+        sys.stdout.write(rules)
 
-find_dependencies(dep_infos)
-dep_infos = sort_dependencies(dep_infos)
 
-for fi in dep_infos:
-    target = os.path.basename(os.path.splitext(fi.name)[0]) + '.tag'
-    dep_tags = [os.path.basename(os.path.splitext(d)[0]) + '.tag' for d in fi.depends]
-    print('{}: {}'.format(target, ' '.join(dep_tags)))
+def write_if_changed(fname, text):
+    '''Write text to a file unless it already has the same contents
 
+    Returns True if the file was written.
+    '''
+    try:
+        with open(fname, 'r') as fh:
+            if fh.read() == text:
+                return False
+    except IOError:
+        pass
 
+    with open(fname, 'w') as fh:
+        fh.write(text)
+    return True
 
 
+if __name__ == '__main__':
+    main()
@@ -1,56 +1,281 @@
 from __future__ import print_function, division
 
 import os
+import re
+import gzip
+import signal
 import time
 import subprocess as subp
 import threading
+import multiprocessing
+import collections
+import functools
 from threading import Thread
+from multiprocessing.pool import ThreadPool
 import Queue as queue
 import scripts.color as color
 
 
-def enqueue_pipe(pipe, queue):
+class PipeReader(object):
+  '''Collect output from a pipe in a background thread
+
+  The thread blocks on the pipe and hands each chunk of data to readers
+  waiting on a condition variable. Nothing runs while the simulator is
+  silent and partial lines such as prompts are visible as soon as they
+  are written.
+  '''
+  def __init__(self, pipe):
+    self.pipe = pipe
+    self.chunks = collections.deque()
+    self.closed = False
+    self.cond = threading.Condition()
+
+    self.thread = Thread(target=self._read_pipe)
+    self.thread.daemon = True
+    self.thread.start()
+
+  def _read_pipe(self):
+    fd = self.pipe.fileno()
+    try:
+      while True:
+        data = os.read(fd, 65536)
+        if not data:
+          break
+
+        with self.cond:
+          self.chunks.append(data)
+          self.cond.notify_all()
+    except (OSError, ValueError):
+      pass
+    finally:
+      with self.cond:
+        self.closed = True
+        self.cond.notify_all()
+
+      self.pipe.close()
+
+  def read_until(self, marker, sink=None):
+    '''Block until marker appears in the output
+
+    Returns a tuple with the output up to the end of the marker and a flag
+    that is False when the pipe closed before the marker was seen. Output
+    following the marker is kept for the next read. Only the newest
+    chunk and the last len(marker)-1 characters before it are searched
+    on each wakeup. When a sink function is given the output is passed
+    to it as it arrives and isn't returned.
+    '''
+    parts = []
+    emit = sink if sink is not None else parts.append
+    tail = ''
+    keep = len(marker) - 1
+
+    while True:
+      with self.cond:
+        while not self.chunks and not self.closed:
+          self.cond.wait()
+
+        chunks = list(self.chunks)
+        self.chunks.clear()
+        closed = self.closed
+
+      # The sink is called without holding the lock so that the reader
+      # thread isn't held up by slow consumers
+      for i, chunk in enumerate(chunks):
+        window = tail + chunk
+        pos = window.find(marker)
+        if pos >= 0:
+          end = pos + len(marker) - len(tail)
+          emit(chunk[:end])
+
+          rest = chunks[i+1:]
+          if end < len(chunk):
+            rest.insert(0, chunk[end:])
+          if rest:
+            with self.cond:
+              self.chunks.extendleft(reversed(rest))
+          return ''.join(parts), True
+
+        emit(chunk)
+        tail = window[-keep:] if keep > 0 else ''
+
+      if closed:
+        return ''.join(parts), False
+
+  def read_available(self):
+    '''Return all output collected so far without blocking'''
+    with self.cond:
+      out = ''.join(self.chunks)
+      self.chunks.clear()
+    return out
+
+
+try:
+  _CLK_TCK = os.sysconf('SC_CLK_TCK')
+except (AttributeError, ValueError, OSError):
+  _CLK_TCK = None
+
+def process_cpu_time(pid):
+  '''CPU time used by a process and its children in seconds
+
+  Children are included because vsim runs the simulation kernel in a
+  separate process. Returns None where /proc isn't available.
+  '''
+  if _CLK_TCK is None:
+    return None
+
+  try:
+    with open('/proc/{}/stat'.format(pid), 'r') as fh:
+      # Skip past the command name which can contain spaces
+      fields = fh.read().rsplit(')', 1)[1].split()
+  except (IOError, IndexError):
+    return None
+
+  cpu = (int(fields[11]) + int(fields[12])) / _CLK_TCK # utime + stime
+
   try:
-    for ln in iter(pipe.readline, b''):
-      queue.put(ln)
-  except:
-    pass
+    with open('/proc/{}/task/{}/children'.format(pid, pid), 'r') as fh:
+      children = fh.read().split()
+  except IOError:
+    children = []
+
+  for c in children:
+    cpu += process_cpu_time(c) or 0.0
+
+  return cpu
+
 
-  pipe.close()
+CommandStats = collections.namedtuple('CommandStats', 'wall cpu out_bytes')
 
 
-def get_output(outq):
-  out = ''
+def log_settings():
+  '''Log rotation settings taken from the environment
+
+  VHDL_LOG_MAX_BYTES sets the size a log can reach before it is rotated
+  and VHDL_LOG_COMPRESS=1 enables gzip compression. Returns a tuple of
+  (max_bytes, compress).
+  '''
   try:
-    while True: # Add output from the queue until it is empty
-      out += outq.get_nowait()
-  except queue.Empty:
-    return out
+    max_bytes = max(0, int(os.environ.get('VHDL_LOG_MAX_BYTES', '0')))
+  except ValueError:
+    max_bytes = 0
+  compress = os.environ.get('VHDL_LOG_COMPRESS', '0') not in ('', '0')
+  return max_bytes, compress
+
+
+class LogWriter(object):
+  '''Log file that is rotated when it grows too large
+
+  With compress set the log is gzip compressed and has ".gz" added to
+  its name. Once max_bytes of text have been written the log is renamed
+  with a ".1" suffix, older logs are shifted up, and a new log is
+  started. Only the newest `backups` old logs are kept. A max_bytes of 0
+  disables rotation.
+  '''
+  def __init__(self, path, max_bytes=0, backups=3, compress=False):
+    self.base_path = path
+    self.ext = '.gz' if compress else ''
+    self.path = path + self.ext
+    self.max_bytes = max_bytes
+    self.backups = backups
+    self.compress = compress
+    self.size = 0
+    self.fh = self._open()
+
+  def _open(self):
+    return gzip.open(self.path, 'wb') if self.compress else open(self.path, 'w')
+
+  def _backup_path(self, n):
+    return '{}.{}{}'.format(self.base_path, n, self.ext)
+
+  def write(self, text):
+    self.fh.write(text)
+    self.size += len(text)
+    if self.max_bytes and self.size >= self.max_bytes:
+      self.rotate()
+
+  def rotate(self):
+    self.fh.close()
+    for n in range(self.backups, 0, -1):
+      src = self._backup_path(n-1) if n > 1 else self.path
+      if os.path.exists(src):
+        dest = self._backup_path(n)
+        if os.path.exists(dest):
+          os.remove(dest)
+        os.rename(src, dest)
+
+    self.fh = self._open()
+    self.size = 0
+
+  def flush(self):
+    self.fh.flush()
+
+  def close(self):
+    self.fh.close()
+
+
+FAILURE_SIGNATURES = ('# Stopped at', '# FATAL ERROR', '# Error loading', '# ** Failure:', '# ** Fatal:')
+
+class FailureDetector(object):
+  '''Scan simulator output for signs of failure as it arrives
+
+  Text must be fed in whole lines. The optional on_failure function is
+  called when the first failure is seen.
+  '''
+  def __init__(self, on_failure=None):
+    self.failed = False
+    self.on_failure = on_failure
+
+  def feed(self, text):
+    if not self.failed:
+      text = '\n' + text
+      self.failed = any('\n' + sig in text for sig in FAILURE_SIGNATURES)
+      if self.failed and self.on_failure is not None:
+        self.on_failure()
 
 
 class Modelsim(object):
-  def __init__(self, log_file='vsim.log'):
+  '''A Modelsim console session
+
+  The transcript is written to log_file from the console output as it
+  arrives rather than by vsim itself. This keeps the sentinel commands
+  out of it and allows it to be rotated and compressed as set by
+  log_max_bytes and log_compress.
+  '''
+  def __init__(self, log_file='vsim.log', vsim_cmd=None, log_max_bytes=0, log_compress=False):
     self.log_file = log_file
+    self.vsim_cmd = vsim_cmd if vsim_cmd is not None else ['vsim']
+    self.out_dir = os.path.dirname(log_file)
+    self.log_max_bytes = log_max_bytes
+    self.log_compress = log_compress
     self.p = None
-    self.outq = None
-    self.errq = None
+    self.stdout = None
+    self.stderr = None
+    self.transcript = None
+    self.last_stats = None
+    self._partial = ''
 
     self._setup_vsim_process()
 
   def _setup_vsim_process(self):
     print('\n' + color.success('*** Starting Modelsim ***'))
+    if self.transcript is not None:
+      self.transcript.close()
+    self.transcript = LogWriter(self.log_file, self.log_max_bytes, compress=self.log_compress)
+    self._partial = ''
+
     env = { 'MGC_WD': os.getcwd(), 'PATH': os.environ['PATH'] }
-    self.p = subp.Popen(['vsim',  '-c', '-l', self.log_file], env=env, stdin=subp.PIPE, stderr=subp.PIPE, stdout=subp.PIPE)
 
-    self.outq = queue.Queue()
-    self.errq = queue.Queue()
+    # Put the simulator in its own process group so that breaks and kills
+    # reach the simulation kernel as well
+    if hasattr(os, 'setsid'):
+      group = {'preexec_fn': os.setsid}
+    else:
+      group = {'creationflags': subp.CREATE_NEW_PROCESS_GROUP}
+
+    self.p = subp.Popen(self.vsim_cmd + ['-c', '-l', os.devnull], env=env, stdin=subp.PIPE, stderr=subp.PIPE, stdout=subp.PIPE, **group)
 
-    out_thread = Thread(target=enqueue_pipe, args=(self.p.stdout, self.outq))
-    err_thread = Thread(target=enqueue_pipe, args=(self.p.stderr, self.errq))
-    out_thread.daemon = True
-    err_thread.daemon = True
-    out_thread.start()
-    err_thread.start()
+    self.stdout = PipeReader(self.p.stdout)
+    self.stderr = PipeReader(self.p.stderr)
 
     # Keep the process from dying on an elaboration error
     self.p.stdin.write('onElabError resume\n')
@@ -60,75 +285,615 @@ class Modelsim(object):
     self.p.stdin.flush()
 
     # Wait for Modelsim to start and process our commands
-    while True:
-      out = get_output(self.outq)
-      if 'sentinel' in out: break
+    startup = self._wait_for_sentinel(log=False)
+    self.transcript.write(''.join(ln for ln in startup.splitlines(True) if 'sentinel' not in ln))
 
 
   def restart(self):
-    del self.outq
-    del self.errq
+    self.stdout = None
+    self.stderr = None
     self._setup_vsim_process()
 
+  def _wait_for_sentinel(self, sink=None, log=True):
+    '''Call the sentinel proc and wait for it to be echoed after the prompt
+
+    Complete lines of output are written to the transcript and passed
+    to the sink function as they arrive. The partial line with the
+    prompt and the sentinel is dropped. Without a sink the output
+    preceeding the sentinel line is returned.
+    '''
+    parts = []
+    emit = sink if sink is not None else parts.append
+
+    def consume(chunk):
+      data = self._partial + chunk
+      nl = data.rfind('\n') + 1
+      self._partial = data[nl:]
+      if nl > 0:
+        lines = data[:nl]
+        if log:
+          self.transcript.write(lines)
+        emit(lines)
+
+    self.p.stdin.write('sentinel\n')
+    self.p.stdin.flush()
+
+    found = self.stdout.read_until('> sentinel', consume)[1]
+    if found:
+      self.stdout.read_until('\n') # Discard the rest of the sentinel line
+    else: # Output closed because the process is exiting
+      self.p.wait()
+
+    self._partial = ''
+    self.transcript.flush()
+
+    out = ''.join(parts)
+    return out[:-1] if out.endswith('\n') else out
+
 
-  def exec_tcl(self, cmd, verbose=False):
+  def exec_tcl(self, cmd, verbose=False, sink=None):
     '''Execute a TCL command in the Modelsim interpreter.
 
     We want to execute a command and wait until it is complete
     before proceeding. This can be done by waiting for the prompt
-    to appear but a complication arises because we use blocking I/O
-    (readline) to fill the queues. Python doesn't provide platform
-    independent non-blocking I/O so we cannot see when an incomplete
-    line with a prompt is output.
+    to appear but the prompt text is configurable and can't be
+    distinguished from command output.
 
     As a hack we call the dummy "sentinel" command after every
-    requested command. This ceates a complete line with a signature
-    we can look for. When sentinel shows up in the output stream we
-    know that the previous command finished.
+    requested command. This ceates a line with a signature we can
+    look for. When the prompt followed by the sentinel shows up in
+    the output stream we know that the previous command finished.
+    The output reader blocks until new data arrives so no CPU time
+    is spent while the simulator is busy.
+
+    When a sink function is given it is called with blocks of whole
+    lines as the output arrives and nothing is returned. This keeps
+    memory use flat for commands with a lot of output.
     '''
 
     #print('### PID:', self.p.pid)
 
-    self.p.stdin.write(cmd + '\n')
-    self.p.stdin.write('sentinel\n')
-    self.p.stdin.flush()
+    pid = self.p.pid
+    cpu_start = process_cpu_time(pid)
+    t_start = time.time()
 
-    out = []
-    while True:
-      if self.process_done(): break  # The process died
+    out_bytes = [0]
+    def count(text):
+      out_bytes[0] += len(text)
+      if sink is not None:
+        sink(text)
 
-      out.append(get_output(self.outq))
-      if '> sentinel' in out[-1]: break # Stop when we see the prompt with the sentinel
+    self.p.stdin.write(cmd + '\n')
+    result = self._wait_for_sentinel(count if sink is not None else None)
+    if sink is None:
+      out_bytes[0] = len(result)
+
+    wall = time.time() - t_start
+    cpu_end = process_cpu_time(pid)
+    cpu = cpu_end - cpu_start if cpu_start is not None and cpu_end is not None else None
+    self.last_stats = CommandStats(wall, cpu, out_bytes[0])
 
-    result = '\n'.join(''.join(out).split('\n')[:-2])
     if verbose: print(result)
     return result
 
   def process_done(self):
     return self.p.poll() is not None
 
+  def _signal(self, sig):
+    p = self.p
+    if p is None or p.poll() is not None:
+      return
+
+    try:
+      if hasattr(os, 'killpg'):
+        os.killpg(p.pid, sig)
+      elif sig == signal.SIGINT:
+        p.send_signal(signal.CTRL_BREAK_EVENT)
+      else:
+        p.kill()
+    except OSError: # Already exited
+      pass
+
+  def interrupt(self):
+    '''Send a break to stop the current simulation run
+
+    This has the same effect as hitting Ctrl-C in the console.
+    '''
+    self._signal(signal.SIGINT)
+
+  def kill(self):
+    '''Kill the simulator
+
+    A command waiting on the simulator returns once its output closes.
+    Use restart() to start a new session.
+    '''
+    self._signal(getattr(signal, 'SIGKILL', signal.SIGTERM))
+
 
   def quit(self):
     print('\n\n' + color.note('*** Stopping Modelsim ***'))
-    err = get_output(self.errq);
+    err = self.stderr.read_available()
     #print('### Threads:', threading.enumerate())
-    self.p.stdin.write('quit\n')
-    self.p.kill()
+    try:
+      self.p.stdin.write('quit\n')
+    except IOError: # Process already exited
+      pass
+    self.kill()
+    self.p.wait()
     self.p = None
 
+    # Let the readers see the pipes close
+    for reader in (self.stdout, self.stderr):
+      reader.thread.join(1.0)
+
     if len(err) > 0:
       print('#### Errors:\n', err)
 
-    # Strip sentinel commands from the log
-    with open(self.log_file, 'r') as fh:
-      fh.readline() # Toss out first line with sentinel proc definition
-      clean_log = [ln for ln in fh if not ln.startswith('sentinel')]
-
-    with open(self.log_file, 'w') as fh:
-      fh.writelines(clean_log)
+    self.transcript.close()
 
   def __del__(self):
     if self.p is not None:
       self.quit()
 
 
+
+
+# Results of a simulation run. The output is only the tail of a long run
+# but failed covers all of it.
+SimResult = collections.namedtuple('SimResult', \
+  'entity generics output process_died out_dir stats failed timed_out')
+
+# Timing of a simulation run. Times are in seconds and the CPU time is
+# None when it can't be measured.
+SimStats = collections.namedtuple('SimStats', 'wall elab cpu out_bytes')
+
+
+def default_pool_size():
+  '''Number of simulator sessions to use when none is specified
+
+  The VHDL_TEST_JOBS environment variable overrides the core count.
+  '''
+  try:
+    return max(1, int(os.environ['VHDL_TEST_JOBS']))
+  except (KeyError, ValueError):
+    return multiprocessing.cpu_count()
+
+
+def tcl_path(path):
+  '''Convert a path into a form that is safe to pass in a TCL command'''
+  return path.replace(os.sep, '/')
+
+
+def vsim_load_command(entity, generics, out_dir):
+  '''Build the TCL command to elaborate a simulation'''
+  vsim_args = ''
+  if generics:
+    vsim_args = ' '.join('-G{}={}'.format(k, v) for k, v in sorted(generics.items()))
+
+  wlf = tcl_path(os.path.join(out_dir, 'vsim.wlf'))
+  return 'vsim -wlf {} {} {}'.format(wlf, entity, vsim_args)
+
+def vsim_command(entity, generics, out_dir):
+  '''Build the TCL command to elaborate and run a simulation'''
+  return vsim_load_command(entity, generics, out_dir) + '; run -all'
+
+
+SWEEP_MARKER = '### SWEEP'
+_sweep_marker_re = re.compile(re.escape(SWEEP_MARKER) + r' (\d+) (BEGIN|ELAB|END)(?: (\d+))?')
+
+def sweep_marker(run, phase):
+  '''TCL command to echo a marker with a millisecond timestamp'''
+  return 'echo "{} {} {} [clock clicks -milliseconds]"'.format(SWEEP_MARKER, run, phase)
+
+def format_generics(generics):
+  if not generics:
+    return '(no generics)'
+  return ', '.join('{}={}'.format(k, v) for k, v in sorted(generics.items()))
+
+
+class RunOutput(object):
+  '''Output of one simulation run collected as it arrives
+
+  Failures are detected as the text is written. Only the last
+  keep_bytes of text are held in memory.
+  '''
+  def __init__(self, keep_bytes):
+    self.keep_bytes = keep_bytes
+    self.detector = FailureDetector()
+    self.blocks = collections.deque()
+    self.kept = 0
+    self.out_bytes = 0
+    self.started = False
+    self.phase = None
+    self.times = {}
+
+  def write(self, text):
+    self.out_bytes += len(text)
+    self.detector.feed(text)
+
+    self.blocks.append(text)
+    self.kept += len(text)
+    while self.kept - len(self.blocks[0]) >= self.keep_bytes:
+      self.kept -= len(self.blocks.popleft())
+
+  @property
+  def failed(self):
+    return self.detector.failed
+
+  @property
+  def text(self):
+    text = ''.join(self.blocks)[-self.keep_bytes:]
+    return text[:-1] if text.endswith('\n') else text
+
+
+_sweep_line_re = re.compile(r'^.*' + _sweep_marker_re.pattern + r'.*\n?', re.M)
+
+class SweepSplitter(object):
+  '''Split the output of a batch of runs at their echoed markers
+
+  Output is fed in blocks of whole lines and passed on to the RunOutput
+  of the current run along with the optional log. Output outside of
+  any run is collected in other. The optional monitor is told when each
+  run reaches a new phase.
+  '''
+  def __init__(self, runs, generics_list, log=None, keep_bytes=1 << 20, monitor=None):
+    self.runs = runs
+    self.generics_list = generics_list
+    self.log = log
+    self.monitor = monitor
+    self.cur = None
+    self.other = RunOutput(keep_bytes)
+
+  def _emit(self, text):
+    if not text:
+      return
+
+    if self.cur is None:
+      self.other.write(text)
+    else:
+      self.cur.write(text)
+      if self.log is not None:
+        self.log.write(text)
+
+  def feed(self, text):
+    if SWEEP_MARKER not in text:
+      self._emit(text)
+      return
+
+    pos = 0
+    for m in _sweep_line_re.finditer(text):
+      self._emit(text[pos:m.start()])
+      pos = m.end()
+
+      run, phase = int(m.group(1)), m.group(2)
+      if run >= len(self.runs):
+        continue
+
+      r = self.runs[run]
+      if m.group(3) is not None:
+        r.times[phase] = int(m.group(3))
+
+      if r.phase != phase:
+        r.phase = phase
+        if self.monitor is not None:
+          self.monitor.phase(r)
+
+      if phase == 'BEGIN':
+        if self.cur is not r:
+          self.cur = r
+          r.started = True
+          if self.log is not None:
+            self.log.write('### ' + format_generics(self.generics_list[run]) + '\n')
+      elif phase == 'END' and self.cur is not None:
+        self.cur = None
+        if self.log is not None:
+          self.log.write('\n')
+
+    self._emit(text[pos:])
+
+
+def _phase_time(times, start, end):
+  if start in times and end in times:
+    return (times[end] - times[start]) / 1000.0
+  return None
+
+
+class RunMonitor(object):
+  '''Watch over the runs of a batch on a session
+
+  When a failure is seen while a simulation is running it is given
+  break_delay seconds to stop on its own before a break is sent. This
+  avoids interrupting the next command when the simulator already stops
+  on failed assertions. A run that takes longer than timeout seconds
+  kills the session.
+  '''
+  def __init__(self, worker, timeout=None, break_delay=None):
+    self.worker = worker
+    self.timeout = timeout
+    self.break_delay = break_delay
+    self.lock = threading.Lock()
+    self.current = None
+    self.timed_out = None
+    self.timer = None
+
+  def _cancel(self):
+    if self.timer is not None:
+      self.timer.cancel()
+      self.timer = None
+
+  def _start_timer(self, delay, action, run):
+    self._cancel()
+    self.timer = threading.Timer(delay, action, (run,))
+    self.timer.daemon = True
+    self.timer.start()
+
+  def phase(self, run):
+    with self.lock:
+      if run.phase == 'BEGIN':
+        self.current = run
+        if self.timeout is not None:
+          self._start_timer(self.timeout, self._expired, run)
+      elif run.phase == 'END' and self.current is run:
+        self.current = None
+        self._cancel()
+
+  def failure(self, run):
+    with self.lock:
+      if self.break_delay is not None and self.current is run and run.phase == 'ELAB':
+        self._start_timer(self.break_delay, self._break, run)
+
+  def _break(self, run):
+    with self.lock:
+      if self.current is run and run.phase == 'ELAB':
+        self.worker.interrupt()
+        if self.timeout is not None: # Keep watching for a hung simulator
+          self._start_timer(self.timeout, self._expired, run)
+
+  def _expired(self, run):
+    with self.lock:
+      if self.current is run:
+        self.timed_out = run
+        self.worker.kill()
+
+  def stop(self):
+    with self.lock:
+      self.current = None
+      self._cancel()
+
+
+def default_timeout():
+  '''Per-run timeout from the VHDL_TEST_TIMEOUT environment variable'''
+  try:
+    timeout = float(os.environ['VHDL_TEST_TIMEOUT'])
+  except (KeyError, ValueError):
+    return None
+  return timeout if timeout > 0 else None
+
+
+class ModelsimPool(object):
+  '''A pool of persistent Modelsim sessions
+
+  Independent simulations are spread across up to size Modelsim
+  processes. Sessions are started on first demand and each one has its
+  own transcript and output directory under out_dir.
+
+  The output of each simulation is streamed to a log named after the
+  entity in the session's directory. Only the last keep_bytes of each
+  run's output are kept in memory. Logs are rotated and compressed as
+  set by log_settings().
+
+  Failures are detected as the output arrives. A simulation that keeps
+  running after a failure is stopped with a break after break_delay
+  seconds. Set break_delay to None to let runs finish. Runs taking
+  longer than timeout seconds kill their session which is then
+  restarted. The timeout defaults to the value of VHDL_TEST_TIMEOUT.
+  '''
+  def __init__(self, out_dir, size=None, vsim_cmd=None, keep_bytes=1 << 20, timeout=None, \
+      break_delay=1.0):
+    self.out_dir = out_dir
+    self.size = max(1, size if size is not None else default_pool_size())
+    self.vsim_cmd = vsim_cmd
+    self.keep_bytes = keep_bytes
+    self.timeout = timeout if timeout is not None else default_timeout()
+    self.break_delay = break_delay
+    self.log_max_bytes, self.log_compress = log_settings()
+
+    self.workers = []
+    self.started = 0
+    self.idle = queue.Queue()
+    self.lock = threading.Lock()
+
+  def _start_worker(self, worker_id):
+    worker_dir = os.path.join(self.out_dir, 'worker{}'.format(worker_id))
+    if not os.path.exists(worker_dir):
+      os.makedirs(worker_dir)
+
+    w = Modelsim(os.path.join(worker_dir, 'unittest.log'), self.vsim_cmd, self.log_max_bytes, \
+      self.log_compress)
+    with self.lock:
+      self.workers.append(w)
+    return w
+
+  def acquire(self):
+    '''Get an idle session, starting a new one if the pool isn't full'''
+    try:
+      return self.idle.get_nowait()
+    except queue.Empty:
+      pass
+
+    with self.lock:
+      start_new = self.started < self.size
+      if start_new:
+        worker_id = self.started
+        self.started += 1
+
+    if start_new:
+      try:
+        return self._start_worker(worker_id)
+      except:
+        with self.lock:
+          self.started -= 1
+        raise
+
+    return self.idle.get()
+
+  def release(self, worker):
+    self.idle.put(worker)
+
+  def run(self, entity, generics=None, timeout=None):
+    '''Elaborate and run a single simulation on the next free session'''
+    return self.run_batch(entity, [generics], timeout=timeout)[0]
+
+  def _open_log(self, worker, entity):
+    log_file = os.path.join(worker.out_dir, entity.split('.')[-1] + '.log')
+    return LogWriter(log_file, self.log_max_bytes, compress=self.log_compress)
+
+  def run_batch(self, entity, generics_list, logs=None, timeout=None):
+    '''Run a batch of simulations in one round trip on the next free session
+
+    All of the vsim commands are sent as a single script with echoed
+    markers around each run so that the output can be split apart. The
+    markers carry timestamps that give the wall time of elaboration and
+    of the whole run. The CPU time of the batch is divided among the
+    runs in proportion to their wall time.
+    Returns a list of SimResult for the runs that were started. If the
+    simulator died the last result has process_died set and the list
+    will be shorter than generics_list when runs remained.
+
+    logs is a dict of open entity logs for each session that is shared
+    by the batches of a sweep. When it isn't given the log is
+    rewritten for this batch. timeout overrides the pool's timeout for
+    each run.
+    '''
+    runs = [RunOutput(self.keep_bytes) for _ in generics_list]
+    own_logs = logs is None
+    if own_logs:
+      logs = {}
+
+    w = self.acquire()
+    try:
+      log = logs.get(w)
+      if log is None:
+        log = logs[w] = self._open_log(w, entity)
+
+      monitor = RunMonitor(w, timeout if timeout is not None else self.timeout, self.break_delay)
+      for r in runs:
+        r.detector.on_failure = functools.partial(monitor.failure, r)
+
+      splitter = SweepSplitter(runs, generics_list, log, self.keep_bytes, monitor)
+      script = []
+      for i, generics in enumerate(generics_list):
+        script.append(sweep_marker(i, 'BEGIN'))
+        script.append(vsim_load_command(entity, generics, w.out_dir))
+        script.append(sweep_marker(i, 'ELAB'))
+        script.append('run -all')
+        script.append(sweep_marker(i, 'END'))
+
+      try:
+        w.exec_tcl('\n'.join(script), sink=splitter.feed)
+      finally:
+        monitor.stop()
+      log.flush()
+      batch_stats = w.last_stats
+      process_died = w.process_done()
+      if process_died:
+        w.restart()
+    finally:
+      self.release(w)
+      if own_logs:
+        for log in logs.values():
+          log.close()
+
+    if not runs[0].started: # Nothing started
+      runs[0] = splitter.other
+      runs[0].started = True
+
+    walls = []
+    for r in runs:
+      if not r.started:
+        break
+      walls.append(_phase_time(r.times, 'BEGIN', 'END'))
+
+    if len(walls) == 1 or None in walls: # Fall back to the time of the whole batch
+      walls = [batch_stats.wall / len(walls)] * len(walls)
+
+    total_wall = sum(walls)
+    results = []
+    for i, (generics, r) in enumerate(zip(generics_list, runs[:len(walls)])):
+      cpu = None
+      if batch_stats.cpu is not None:
+        cpu = batch_stats.cpu * walls[i] / total_wall if total_wall > 0 else batch_stats.cpu / len(walls)
+      stats = SimStats(walls[i], _phase_time(r.times, 'BEGIN', 'ELAB'), cpu, r.out_bytes)
+      results.append(SimResult(entity, generics, r.text, False, w.out_dir, stats, r.failed, \
+        r is monitor.timed_out))
+
+    if process_died:
+      results[-1] = results[-1]._replace(process_died=True)
+
+    return results
+
+  def sweep(self, entity, generics_list, batch_size=None, callback=None, timeout=None):
+    '''Run a sweep of simulations of an entity
+
+    generics_list is a sequence of dicts with the generics for each run.
+    The runs are grouped into batches of batch_size that are each sent to
+    a session in one round trip. By default the runs are divided evenly
+    across the pool. The optional callback is called in the calling
+    thread with each SimResult as it completes. Results are returned in
+    the same order as generics_list. timeout overrides the pool's
+    timeout for each run.
+    '''
+    generics_list = list(generics_list)
+    results = [None] * len(generics_list)
+    if not generics_list:
+      return results
+
+    if batch_size is None:
+      batch_size = -(-len(generics_list) // self.size)
+    batch_size = max(1, batch_size)
+
+    batches = [list(range(i, min(i + batch_size, len(generics_list)))) \
+      for i in range(0, len(generics_list), batch_size)]
+
+    logs = {} # One log per session for the whole sweep
+    def run_batch(indices):
+      completed = []
+      while indices: # Resubmit any runs skipped after the simulator died
+        batch_results = self.run_batch(entity, [generics_list[i] for i in indices], logs, timeout)
+        completed.extend(zip(indices, batch_results))
+        indices = indices[len(batch_results):]
+      return completed
+
+    tpool = ThreadPool(min(self.size, len(batches)))
+    try:
+      for completed in tpool.imap_unordered(run_batch, batches):
+        for i, r in completed:
+          results[i] = r
+          if callback is not None:
+            callback(r)
+    finally:
+      tpool.close()
+      tpool.join()
+      for log in logs.values():
+        log.close()
+
+    return results
+
+  def map(self, entity, generics_list, callback=None, timeout=None):
+    '''Run independent simulations of an entity in parallel
+
+    This is a sweep with every run in its own batch.
+    '''
+    return self.sweep(entity, generics_list, 1, callback, timeout)
+
+  def quit(self):
+    with self.lock:
+      workers = self.workers
+      self.workers = []
+      self.started = 0
+
+    for w in workers:
+      if w.p is not None:
+        w.quit()
+
+    self.idle = queue.Queue()
@@ -0,0 +1,157 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''Vhdl-extras library
+   Stand-in for the Modelsim console used to exercise the test harness
+   without a simulator.
+
+   It accepts the same "vsim -c -l <log>" invocation and answers commands
+   read from stdin with a prompt and Modelsim style "#" prefixed output.
+   The simulated run is controlled by generics passed to the vsim command:
+
+     STUB_LINES=<n>   -- Report n notes during "run -all"
+     STUB_DELAY=<s>   -- "run -all" takes s seconds to complete
+     STUB_FAIL=true   -- "run -all" stops on a failed assertion
+     STUB_FAIL_AT=<n> -- Report a failed assertion after note n and keep running
+     STUB_CRASH=true  -- The process exits during "run -all"
+
+   A SIGINT stops "run -all" like a break in Modelsim.
+'''
+
+# Copyright © 2014 Kevin Thibedeau
+
+# This file is part of VHDL-extras.
+
+from __future__ import print_function, division
+
+import sys
+import time
+import signal
+
+
+class StubVsim(object):
+    def __init__(self, log_file=None):
+        self.log = open(log_file, 'w') if log_file else None
+        self.design = None
+        self.generics = {}
+        self.prompt_num = 1
+        self.break_hit = False
+        signal.signal(signal.SIGINT, self.on_break)
+
+    def on_break(self, signum, frame):
+        self.break_hit = True
+
+    def write(self, text):
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    def output(self, ln):
+        self.write('# ' + ln + '\n')
+        if self.log:
+            self.log.write('# ' + ln + '\n')
+            self.log.flush()
+
+    def cmd_vsim(self, args):
+        self.design = None
+        self.generics = {}
+        arg_iter = iter(args)
+        for a in arg_iter:
+            if a.startswith('-G'):
+                k, v = a[2:].split('=', 1)
+                self.generics[k] = v
+            elif a in ('-wlf', '-l', '-do'):
+                next(arg_iter, None)
+            elif not a.startswith('-'):
+                self.design = a
+
+        self.output('vsim ' + ' '.join(args))
+        if self.design is None or self.design.split('.')[-1].startswith('missing'):
+            self.output('** Error: (vsim-3170) Could not find \'{}\'.'.format(self.design))
+            self.output('Error loading design')
+            self.design = None
+            return
+
+        self.output('Loading ' + self.design)
+
+    def cmd_run(self, args):
+        if self.design is None:
+            self.output('** Error: (vsim-3601) No design loaded')
+            return
+
+        self.break_hit = False
+        fail_at = int(self.generics.get('STUB_FAIL_AT', -1))
+        for i in range(int(self.generics.get('STUB_LINES', 0))):
+            self.output('** Note: {} report {}'.format(self.design, i))
+            if i == fail_at:
+                self.output('** Failure: Stub assertion failed')
+
+        t_end = time.time() + float(self.generics.get('STUB_DELAY', 0))
+        while time.time() < t_end and not self.break_hit:
+            time.sleep(min(0.01, max(0, t_end - time.time())))
+
+        if self.break_hit:
+            self.output('Break key hit')
+            self.output('Simulation stop requested.')
+            return
+
+        if self.generics.get('STUB_CRASH', 'false') == 'true':
+            sys.exit(1)
+
+        if self.generics.get('STUB_FAIL', 'false') == 'true':
+            self.output('** Failure: Stub assertion failed')
+            self.output('   Time: 10 ns  Iteration: 0  Process: /stub/check File: stub.vhdl')
+            self.output('Break in Process check at stub.vhdl line 1')
+            self.output('Stopped at stub.vhdl line 1')
+
+    def execute(self, line):
+        for cmd in line.split(';'):
+            fields = cmd.split()
+            if not fields:
+                continue
+
+            name, args = fields[0], fields[1:]
+            if name in ('proc', 'onElabError', 'sentinel'):
+                pass
+            elif name == 'vsim':
+                self.cmd_vsim(args)
+            elif name == 'run':
+                self.cmd_run(args)
+            elif name == 'echo':
+                text = ' '.join(args)
+                if not text.startswith('{'): # Substitute the one command used by the harness
+                    text = text.replace('[clock clicks -milliseconds]', str(int(time.time() * 1000)))
+                self.output(text.strip('{}"'))
+            elif name == 'quit':
+                if '-sim' in args:
+                    self.design = None
+                else:
+                    sys.exit(0)
+            else:
+                self.output('invalid command name "{}"'.format(name))
+
+    def run(self):
+        self.output('Stub vsim console')
+        while True:
+            self.write('VSIM {}> '.format(self.prompt_num))
+            line = sys.stdin.readline()
+            if not line:
+                break
+
+            self.write(line)
+            if self.log:
+                self.log.write(line)
+            self.prompt_num += 1
+            self.execute(line)
+
+
+def main():
+    log_file = None
+    args = sys.argv[1:]
+    if '-l' in args:
+        log_file = args[args.index('-l') + 1]
+
+    StubVsim(log_file).run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''VHDL-extras library
+   Benchmark timing history test
+'''
+
+# Copyright © 2014 Kevin Thibedeau
+
+# This file is part of VHDL-extras.
+
+
+from __future__ import print_function, division
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from test.test_support import BenchmarkHistory
+
+
+class TestBenchmarkHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.out_dir = tempfile.mkdtemp()
+        self.history_file = os.path.join(self.out_dir, 'history.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.out_dir)
+
+    def test_baseline(self):
+        history = BenchmarkHistory(self.history_file, window=3)
+        for t in [5.0, 1.0, 2.0, 3.0]:
+            history.append({'bench': t}, 4)
+        history.append({'bench': 10.0, 'other': 1.0}, 1)
+        history.save()
+
+        history = BenchmarkHistory(self.history_file, window=3)
+        self.assertEqual(history.baseline('bench', 4), 2.0) # Median of the last 3
+        self.assertEqual(history.baseline('bench', 1), 10.0)
+        self.assertIsNone(history.baseline('other', 4))
+
+    def test_compare(self):
+        history = BenchmarkHistory(self.history_file)
+        history.append({'a': 1.0, 'b': 1.0}, 4)
+
+        slower = history.compare({'a': 1.1, 'b': 1.5, 'new': 9.0}, 4, 0.2)
+        self.assertEqual(slower, [('b', 1.5, 1.0)])
+        self.assertEqual(history.compare({'b': 1.5}, 2, 0.2), []) # No baseline for 2 jobs
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,333 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''VHDL-extras library
+   Reference model self-test
+
+   The vectorized models are compared against direct transcriptions of the
+   VHDL functions.
+'''
+
+# Copyright © 2014 Kevin Thibedeau
+
+# This file is part of VHDL-extras.
+
+
+from __future__ import print_function, division
+
+import binascii
+import time
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if np is not None:
+    from golden import bcd_conversion, crc_ops, gray_code, hamming_edac, lfsr_ops, \
+        parity_ops, secded_edac
+    from golden.bits import U64, mask
+    from golden.crc_catalogue import CRC_CATALOGUE, CHECK_STRING
+
+
+def random_vectors(width, count, seed=1):
+    rng = np.random.RandomState(seed)
+    v = rng.randint(0, 1 << 32, size=count).astype(U64) << U64(32)
+    v |= rng.randint(0, 1 << 32, size=count).astype(U64)
+    return v & U64(mask(width))
+
+def bits_of(v, width):
+    '''Bits of v with the leftmost bit first'''
+    return [(v >> i) & 1 for i in range(width-1, -1, -1)]
+
+
+def vhdl_hamming_parity(msg):
+    '''Transcription of hamming_parity(). msg[0] is unused.'''
+    result = 0
+    result_ix = 0
+    for i in range(1, len(msg)):
+        if 2**hamming_edac.ceil_log2(i) == i:
+            count = i
+            parity_bit = 0
+            for d in range(i, len(msg)):
+                if count > 0:
+                    parity_bit ^= msg[d]
+                elif count == 1 - i:
+                    count = i + 1
+                count -= 1
+            result |= parity_bit << result_ix
+            result_ix += 1
+    return result
+
+def vhdl_hamming_encode(data, data_size):
+    '''Transcription of hamming_encode() using hamming_interleave()'''
+    msg_size = hamming_edac.hamming_message_size(data_size)
+    psize = hamming_edac.hamming_parity_size(msg_size)
+    msg = [0] * (msg_size + 1)
+    data_ix = 0
+    for i in range(1, msg_size+1):
+        if 2**hamming_edac.ceil_log2(i) != i:
+            msg[i] = (data >> data_ix) & 1
+            data_ix += 1
+    return (data << psize) | vhdl_hamming_parity(msg)
+
+def vhdl_to_bcd(binary, width):
+    digits = bcd_conversion.decimal_size(2**width - 1)
+    bcd = 0
+    for bit in bits_of(binary, width):
+        for d in range(digits):
+            if (bcd >> 4*d) & 0xF >= 5:
+                bcd += 3 << 4*d
+        bcd = ((bcd << 1) | bit) & mask(digits*4)
+    return bcd
+
+def vhdl_bcd_to_binary(bcd, width):
+    digits = width // 4
+    bits = bcd_conversion.bit_size(10**digits - 1)
+    binary = 0
+    for _ in range(bits):
+        binary = ((bcd & 1) << (bits-1)) | (binary >> 1)
+        bcd >>= 1
+        for d in range(digits):
+            if (bcd >> 4*d) & 0xF >= 8:
+                bcd -= 3 << 4*d
+    return binary
+
+def vhdl_galois(state, tap_map, width, kind, full_cycle):
+    sr = bits_of(state, width)
+    tm = bits_of(tap_map, width-1)
+    if not full_cycle:
+        fb = sr[-1]
+    else:
+        if kind == lfsr_ops.NORMAL:
+            extra = int(not any(sr[:-1]))
+        else:
+            extra = int(all(sr[:-1]))
+        fb = extra ^ sr[-1]
+    if kind == lfsr_ops.NORMAL:
+        rest = [s ^ (fb & t) for s, t in zip(sr[:-1], tm)]
+    else:
+        rest = [1 - (s ^ (fb | (1 - t))) for s, t in zip(sr[:-1], tm)]
+    r = 0
+    for b in [fb] + rest:
+        r = (r << 1) | b
+    return r
+
+def vhdl_fibonacci(state, tap_map, width, kind, full_cycle):
+    sr = bits_of(state, width)
+    tm = bits_of(tap_map, width-1)
+    if not full_cycle:
+        fb = sr[0]
+    else:
+        if kind == lfsr_ops.NORMAL:
+            extra = int(not any(sr[1:]))
+        else:
+            extra = int(all(sr[1:]))
+        fb = extra ^ sr[0]
+    for s, t in zip(sr[1:], tm):
+        fb ^= s & t
+    if kind == lfsr_ops.INVERTED:
+        fb ^= 1
+    r = 0
+    for b in sr[1:] + [fb]:
+        r = (r << 1) | b
+    return r
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TestGolden(unittest.TestCase):
+
+    def check_model(self, vector_fn, scalar_fn, width, count=500):
+        vecs = random_vectors(width, count, seed=width)
+        got = vector_fn(vecs)
+        for v, r in zip(vecs, got):
+            self.assertEqual(int(r), scalar_fn(int(v)), 'input {:#x}'.format(int(v)))
+
+    def crc_bytes(self, msg, width, poly, xor_in, xor_out, reflect):
+        crc = crc_ops.init_crc(xor_in)
+        for c in bytearray(msg):
+            crc = crc_ops.next_crc(crc, poly, reflect, c, width, 8)
+        return crc_ops.end_crc(crc, reflect, xor_out, width)
+
+    def test_crc_ops(self):
+        msg = b'123456789'
+        self.assertEqual(self.crc_bytes(msg, 8, 0x07, 0, 0, False), 0xF4)
+        self.assertEqual(self.crc_bytes(msg, 16, 0x1021, 0xFFFF, 0, False), 0x29B1)
+        self.assertEqual(self.crc_bytes(msg, 16, 0x8005, 0, 0, True), 0xBB3D)
+        self.assertEqual(self.crc_bytes(msg, 32, 0x04C11DB7, 0xFFFFFFFF, 0xFFFFFFFF, True),
+            0xCBF43926)
+
+        for width, poly, data_width in ((8, 0x07, 8), (16, 0x1021, 16), (32, 0x04C11DB7, 8),
+            (32, 0x04C11DB7, 64), (5, 0x05, 11)):
+            for reflect in (False, True):
+                crcs = random_vectors(width, 300, seed=width)
+                data = random_vectors(data_width, 300, seed=data_width+100)
+                got = crc_ops.next_crc(crcs, poly, reflect, data, width, data_width)
+                for c, d, r in zip(crcs, data, got):
+                    self.assertEqual(int(r), crc_ops.next_crc_serial(int(c), poly, reflect,
+                        int(d), width, data_width))
+
+    def test_crc_table(self):
+        for name, width, poly, init, refin, refout, xorout, check in CRC_CATALOGUE:
+            for slices in (1, 2, 4, 8):
+                table = crc_ops.crc_table(poly, width, slices)
+                crc = crc_ops.init_crc(init)
+                for c in bytearray(CHECK_STRING):
+                    crc = crc_ops.next_crc_bytes(crc, table, refin, c, width, 8)
+                self.assertEqual(crc_ops.end_crc(crc, refout, xorout, width), check,
+                    '{} slice-by-{}'.format(name, slices))
+
+        rng = np.random.RandomState(2)
+        for width in (3, 5, 8, 12, 16, 24, 32, 64):
+            for slices in (1, 3, 4, 8):
+                poly = int(random_vectors(width, 1, seed=width)[0])
+                table = crc_ops.crc_table(poly, width, slices)
+                for _ in range(20):
+                    nbytes = rng.randint(1, 13)
+                    data = int(binascii.hexlify(rng.bytes(nbytes)), 16)
+                    crc = int(random_vectors(width, 1, seed=rng.randint(1000))[0])
+                    reflect = bool(rng.randint(2))
+                    self.assertEqual(crc_ops.next_crc_bytes(crc, table, reflect, data, width, 8*nbytes),
+                        crc_ops.next_crc_serial(crc, poly, reflect, data, width, 8*nbytes))
+
+    def test_parity_ops(self):
+        for width in (1, 7, 32, 64):
+            self.check_model(lambda v: parity_ops.parity(parity_ops.EVEN, v),
+                lambda v: bin(v).count('1') % 2, width)
+            self.check_model(lambda v: parity_ops.parity(parity_ops.ODD, v),
+                lambda v: 1 - bin(v).count('1') % 2, width)
+
+    def test_gray_code(self):
+        def serial_to_binary(g, width):
+            b = 0
+            bit = 0
+            for gb in bits_of(g, width):
+                bit ^= gb
+                b = (b << 1) | bit
+            return b
+
+        for width in (1, 2, 5, 31, 64):
+            self.check_model(lambda v: gray_code.to_gray(v, width), lambda v: v ^ (v >> 1), width)
+            self.check_model(lambda v: gray_code.to_binary(v, width),
+                lambda v: serial_to_binary(v, width), width)
+
+    def test_bcd_conversion(self):
+        for width in (1, 4, 10, 27, 53):
+            self.check_model(lambda v: bcd_conversion.to_bcd(v, width),
+                lambda v: int(str(v), 16), width)
+            self.check_model(lambda v: bcd_conversion.to_bcd(v, width),
+                lambda v: vhdl_to_bcd(v, width), width)
+
+        # Random inputs include invalid digits
+        for width in (4, 8, 26, 36, 64):
+            self.check_model(lambda v: bcd_conversion.to_binary(v, width),
+                lambda v: vhdl_bcd_to_binary(v, width), width)
+
+        vals = random_vectors(40, 1000)
+        width = len(str(2**40-1)) * 4
+        self.assertTrue(np.array_equal(bcd_conversion.to_binary(bcd_conversion.to_bcd(vals, 40),
+            width), vals))
+
+    def test_hamming_edac(self):
+        for data_size in range(1, 58):
+            msg_size = hamming_edac.hamming_message_size(data_size)
+            self.assertEqual(hamming_edac.hamming_data_size(msg_size), data_size)
+            self.check_model(lambda v: hamming_edac.hamming_encode(v, data_size),
+                lambda v: vhdl_hamming_encode(v, data_size), data_size, count=50)
+
+        data_size = 32
+        data = random_vectors(data_size, 1000)
+        enc = hamming_edac.hamming_encode(data, data_size)
+        msg_size = hamming_edac.hamming_message_size(data_size)
+        self.assertFalse(hamming_edac.hamming_has_error(enc, data_size).any())
+        for bit in range(msg_size):
+            bad = enc ^ U64(1 << bit)
+            self.assertTrue(np.array_equal(hamming_edac.hamming_decode(bad, data_size), data))
+            self.assertTrue(hamming_edac.hamming_has_error(bad, data_size).all())
+            self.assertTrue(np.array_equal(hamming_edac.hamming_decode(bad, data_size),
+                [hamming_edac.hamming_decode_serial(int(e), data_size) for e in bad]))
+
+    def test_secded_edac(self):
+        data_size = 16
+        msg_size = secded_edac.secded_message_size(data_size)
+        self.assertEqual(secded_edac.secded_data_size(msg_size), data_size)
+        data = random_vectors(data_size, 500)
+        enc = secded_edac.secded_encode(data, data_size)
+        single, double = secded_edac.secded_has_errors(enc, data_size)
+        self.assertFalse(single.any() or double.any())
+
+        for i in range(msg_size):
+            bad = enc ^ U64(1 << i)
+            self.assertTrue(np.array_equal(secded_edac.secded_decode(bad, data_size), data))
+            single, double = secded_edac.secded_has_errors(bad, data_size)
+            self.assertTrue(single.all() and not double.any())
+            for j in range(i+1, msg_size):
+                single, double = secded_edac.secded_has_errors(bad ^ U64(1 << j), data_size)
+                self.assertTrue(double.all() and not single.any())
+
+    def test_lfsr_ops(self):
+        self.assertEqual(lfsr_ops.to_tap_map((9, 8, 7, 2), 10), 0b0100001110)
+        self.assertEqual(lfsr_ops.to_tap_map((9, 8, 7, 2), 10, reverse=True), 0b0111000010)
+
+        for width in (2, 3, 8, 17, 64):
+            tm = lfsr_ops.lfsr_taps(width)
+            for kind in (lfsr_ops.NORMAL, lfsr_ops.INVERTED):
+                for full_cycle in (False, True):
+                    self.check_model(lambda v: lfsr_ops.next_galois_lfsr(v, tm, width, kind,
+                        full_cycle), lambda v: vhdl_galois(v, tm, width, kind, full_cycle),
+                        width, count=100)
+                    self.check_model(lambda v: lfsr_ops.next_fibonacci_lfsr(v, tm, width, kind,
+                        full_cycle), lambda v: vhdl_fibonacci(v, tm, width, kind, full_cycle),
+                        width, count=100)
+
+        # Maximal length sequences with the predefined taps
+        for width in (3, 8, 12):
+            for fn in (lfsr_ops.next_galois_lfsr, lfsr_ops.next_fibonacci_lfsr):
+                for kind, start in ((lfsr_ops.NORMAL, mask(width)), (lfsr_ops.INVERTED, 0)):
+                    for full_cycle in (False, True):
+                        state = start
+                        seen = set()
+                        while state not in seen:
+                            seen.add(state)
+                            state = fn(state, lfsr_ops.lfsr_taps(width), width, kind, full_cycle)
+                        self.assertEqual(len(seen), 2**width - (0 if full_cycle else 1))
+
+    def test_lfsr_jump(self):
+        for width in (3, 8, 17, 64):
+            tm = lfsr_ops.lfsr_taps(width)
+            for fn, jump in ((lfsr_ops.next_galois_lfsr, lfsr_ops.jump_galois_lfsr),
+                             (lfsr_ops.next_fibonacci_lfsr, lfsr_ops.jump_fibonacci_lfsr)):
+                for kind in (lfsr_ops.NORMAL, lfsr_ops.INVERTED):
+                    state = random_vectors(width, 100)
+                    start = state
+                    for steps in range(1, 40):
+                        state = fn(state, tm, width, kind)
+                        self.assertTrue(np.array_equal(jump(start, tm, width, steps, kind), state))
+
+                    # Jumps compose and wrap after the full period
+                    self.assertTrue(np.array_equal(jump(jump(start, tm, width, 10**9, kind), tm,
+                        width, 12345, kind), jump(start, tm, width, 10**9 + 12345, kind)))
+                    if width < 64:
+                        matrix = lfsr_ops.lfsr_matrix(fn, tm, width, 2**width - 1, kind)
+                        self.assertTrue(np.array_equal(lfsr_ops.leap_lfsr(start, matrix, width), start))
+
+    def test_throughput(self):
+        count = 1 << 20
+        data = random_vectors(32, count)
+        models = (
+            ('next_crc', lambda: crc_ops.next_crc(data, 0x04C11DB7, True, data, 32, 32)),
+            ('hamming_decode', lambda: hamming_edac.hamming_decode(
+                hamming_edac.hamming_encode(data, 32), 32)),
+            ('to_bcd', lambda: bcd_conversion.to_bcd(data, 32))
+        )
+        for name, fn in models:
+            fn() # Build the tables
+            start = time.time()
+            fn()
+            rate = count / (time.time() - start)
+            self.assertGreater(rate, 1.0e6, '{} ran at {:.0f} vectors/s'.format(name, rate))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''VHDL-extras library
+   Maximal length table generator test
+
+   The primitive polynomial tests are compared against brute force period
+   measurements and the predefined LFSR and LCAR tables are checked.
+'''
+
+# Copyright © 2014 Kevin Thibedeau
+
+# This file is part of VHDL-extras.
+
+
+from __future__ import print_function, division
+
+import io
+import random
+import unittest
+
+from scripts import maxlen_tables as mt
+
+FACTOR_FILE = 'scripts/mersenne_factors.txt'
+
+
+def lfsr_period(poly, n):
+    '''Period of a Galois LFSR started from 1'''
+    state = 1
+    for i in range(1, 2**n + 1):
+        state <<= 1
+        if state >> n:
+            state ^= poly
+        if state == 1:
+            return i
+    return None
+
+def lcar_period(rule):
+    '''Period of a rule 90/150 LCAR started from all 1's'''
+    n = len(rule)
+    mask = 2**n - 1
+    rmask = int(rule, 2)
+    start = state = mask
+    for i in range(1, 2**n + 1):
+        state = ((state << 1) & mask) ^ (state >> 1) ^ (state & rmask)
+        if state == start:
+            return i
+    return None
+
+
+class TestMaxlenTables(unittest.TestCase):
+
+    def setUp(self):
+        self.known = mt.read_factors(FACTOR_FILE)
+
+    def test_factor_file(self):
+        for n, factors in self.known.items():
+            self.assertTrue(mt.verify_factors(n, factors), 'Bad factors for {}'.format(n))
+
+    def test_mersenne_factors(self):
+        for n in range(2, 65):
+            self.assertTrue(mt.verify_factors(n, mt.mersenne_factors(n)))
+        self.assertEqual(mt.mersenne_factors(11), set([23, 89]))
+
+    def test_primitive(self):
+        rnd = random.Random(1)
+        for n in range(2, 13):
+            factors = mt.mersenne_factors(n)
+            for _ in range(40):
+                poly = (1 << n) | rnd.getrandbits(n) | 1
+                self.assertEqual(mt.is_primitive(poly, factors), lfsr_period(poly, n) == 2**n-1)
+
+                rule = ''.join(rnd.choice('01') for _ in range(n))
+                self.assertEqual(mt.is_primitive(mt.lcar_char_poly(rule), factors),
+                    lcar_period(rule) == 2**n-1)
+
+    def test_search(self):
+        for n in (5, 16, 33):
+            factors = mt.mersenne_factors(n)
+            self.assertTrue(mt.is_primitive(mt.lfsr_poly(mt.search_lfsr(n, factors), n), factors))
+            self.assertTrue(mt.is_primitive(mt.lcar_char_poly(mt.search_lcar(n, factors)), factors))
+
+    def check_table(self, fname, parse, char_poly):
+        with io.open(fname, encoding='latin-1') as fh:
+            entries = parse(fh.read())
+        self.assertEqual([n for n, _ in entries], list(range(2, len(entries) + 2)))
+
+        for n, entry in entries:
+            factors = mt.mersenne_factors(n, self.known.get(n, ()))
+            self.assertTrue(mt.is_primitive(char_poly(entry, n), factors),
+                'Entry {} is not maximal length'.format(n))
+
+    def test_lfsr_table(self):
+        self.check_table('rtl/extras/lfsr_ops.vhdl', mt.parse_lfsr_table, mt.lfsr_poly)
+
+    def test_lcar_table(self):
+        self.check_table('rtl/extras/lcar_ops.vhdl', mt.parse_lcar_table,
+            lambda rule, n: mt.lcar_char_poly(rule))
+
+
+if __name__ == '__main__':
+    unittest.main()
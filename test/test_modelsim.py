@@ -0,0 +1,267 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''VHDL-extras library
+   Test harness self-test using a stand-in vsim console
+'''
+
+# Copyright © 2014 Kevin Thibedeau
+
+# This file is part of VHDL-extras.
+
+
+from __future__ import print_function, division
+
+import os
+import sys
+import gzip
+import json
+import time
+import shutil
+import tempfile
+import unittest
+
+import test.test_support as tsup
+from test.eng import eng_si
+from test.modelsim import Modelsim, ModelsimPool, LogWriter
+
+STUB_VSIM = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stub_vsim.py')]
+
+
+class TestModelsimPool(unittest.TestCase):
+
+    def setUp(self):
+        self.out_dir = tempfile.mkdtemp()
+        self.pool = None
+
+    def tearDown(self):
+        if self.pool is not None:
+            self.pool.quit()
+        shutil.rmtree(self.out_dir)
+
+    def test_exec_tcl(self):
+        vsim = Modelsim(os.path.join(self.out_dir, 'stub.log'), STUB_VSIM)
+        try:
+            out = vsim.exec_tcl('echo hello')
+        finally:
+            vsim.quit()
+
+        self.assertIn('# hello', out)
+        self.assertNotIn('sentinel', out)
+
+    @tsup.timedtest
+    def test_exec_tcl_latency(self):
+        vsim = Modelsim(os.path.join(self.out_dir, 'stub.log'), STUB_VSIM)
+        try:
+            vsim.exec_tcl('echo warmup')
+
+            iterations = 2000
+            self._t_start = time.time()
+            for i in xrange(iterations):
+                vsim.exec_tcl('echo {}'.format(i))
+            per_cmd = (time.time() - self._t_start) / iterations
+        finally:
+            vsim.quit()
+
+        self.assertLess(per_cmd, 1.0e-3, 'Command overhead too high: {}'.format(eng_si(per_cmd, 's')))
+        return (iterations, iterations, 'cmds')
+
+    def test_idle_wait(self):
+        vsim = Modelsim(os.path.join(self.out_dir, 'stub.log'), STUB_VSIM)
+        try:
+            cpu_start = os.times()[0]
+            vsim.exec_tcl('vsim test.stub -GSTUB_DELAY=1.0; run -all')
+            cpu_used = os.times()[0] - cpu_start
+        finally:
+            vsim.quit()
+
+        # Waiting on the simulator should not consume CPU time
+        self.assertLess(cpu_used, 0.1)
+
+    def test_run(self):
+        self.pool = ModelsimPool(self.out_dir, 2, STUB_VSIM)
+
+        r = self.pool.run('test.stub', {'STUB_LINES': 3})
+        self.assertTrue(tsup.command_success(r.output))
+        self.assertIn('test.stub report 2', r.output)
+
+        r = self.pool.run('test.stub', {'STUB_FAIL': 'true'})
+        self.assertFalse(tsup.command_success(r.output))
+
+        r = self.pool.run('test.missing_entity')
+        self.assertFalse(tsup.command_success(r.output))
+
+    def test_restart(self):
+        self.pool = ModelsimPool(self.out_dir, 1, STUB_VSIM)
+
+        r = self.pool.run('test.stub', {'STUB_CRASH': 'true'})
+        self.assertTrue(r.process_died)
+
+        # The session should be usable again after a restart
+        r = self.pool.run('test.stub')
+        self.assertFalse(r.process_died)
+        self.assertTrue(tsup.command_success(r.output))
+
+    def test_parallel_map(self):
+        workers = 4
+        delay = 0.5
+        self.pool = ModelsimPool(self.out_dir, workers, STUB_VSIM)
+        self.pool.map('test.stub', [{}] * workers) # Start all sessions
+
+        trials = [{'STUB_DELAY': delay, 'STUB_LINES': i} for i in range(2 * workers)]
+        t_start = time.time()
+        results = self.pool.map('test.stub', trials)
+        elapsed = time.time() - t_start
+
+        self.assertEqual([r.generics for r in results], trials)
+        for i, r in enumerate(results):
+            self.assertIn('report {}'.format(i-1) if i > 0 else 'Loading', r.output)
+
+        # Each session has its own output directory
+        self.assertEqual(len(set(r.out_dir for r in results)), workers)
+
+        serial_time = len(trials) * delay
+        self.assertLess(elapsed, serial_time / 2)
+
+    def test_sweep(self):
+        self.pool = ModelsimPool(self.out_dir, 2, STUB_VSIM)
+
+        trials = [{'STUB_LINES': i} for i in range(10)]
+        trials[3]['STUB_FAIL'] = 'true'
+        results = self.pool.sweep('test.stub', trials)
+
+        self.assertEqual([r.generics for r in results], trials)
+        for i, r in enumerate(results):
+            # Each run only has its own output
+            self.assertEqual(r.output.count('Loading test.stub'), 1)
+            self.assertEqual(r.output.count('** Note'), i)
+            self.assertNotIn('SWEEP', r.output)
+            self.assertEqual(tsup.command_success(r.output), i != 3)
+            self.assertEqual(r.failed, i == 3)
+
+        # The sweep is logged with a header for each run
+        with open(os.path.join(results[0].out_dir, 'stub.log')) as fh:
+            log = fh.read()
+        for i, r in enumerate(results):
+            if r.out_dir == results[0].out_dir:
+                self.assertIn('### {}\n'.format(tsup.format_generics(r.generics)), log)
+
+    def test_sweep_restart(self):
+        self.pool = ModelsimPool(self.out_dir, 1, STUB_VSIM)
+
+        trials = [{'STUB_LINES': 1} for i in range(6)]
+        trials[2]['STUB_CRASH'] = 'true'
+        results = self.pool.sweep('test.stub', trials)
+
+        # The runs following the crash are resubmitted to a new session
+        self.assertEqual([r.generics for r in results], trials)
+        self.assertEqual([r.process_died for r in results], [i == 2 for i in range(6)])
+        for r in results[3:]:
+            self.assertTrue(tsup.command_success(r.output))
+            self.assertIn('report 0', r.output)
+
+    def test_break_on_failure(self):
+        self.pool = ModelsimPool(self.out_dir, 1, STUB_VSIM, break_delay=0.2)
+
+        t_start = time.time()
+        r = self.pool.run('test.stub', {'STUB_LINES': 2, 'STUB_FAIL_AT': 0, 'STUB_DELAY': 5})
+        self.assertLess(time.time() - t_start, 2.0)
+        self.assertTrue(r.failed)
+        self.assertIn('Break key hit', r.output)
+        self.assertFalse(r.process_died)
+
+        # The break doesn't carry over to the next run
+        r = self.pool.run('test.stub', {'STUB_DELAY': 0.5})
+        self.assertFalse(r.failed)
+        self.assertNotIn('Break key hit', r.output)
+
+    def test_timeout(self):
+        self.pool = ModelsimPool(self.out_dir, 1, STUB_VSIM, timeout=0.5)
+
+        trials = [{'STUB_LINES': 1}, {'STUB_DELAY': 10}, {'STUB_LINES': 1}]
+        t_start = time.time()
+        results = self.pool.sweep('test.stub', trials)
+        self.assertLess(time.time() - t_start, 5.0)
+
+        self.assertEqual([r.timed_out for r in results], [False, True, False])
+        self.assertEqual([r.process_died for r in results], [False, True, False])
+        self.assertFalse(results[2].failed) # Completed on the restarted session
+
+        # Override of the pool's timeout
+        r = self.pool.run('test.stub', {'STUB_DELAY': 1.0}, timeout=5.0)
+        self.assertFalse(r.timed_out)
+
+    def test_streaming_output(self):
+        self.pool = ModelsimPool(self.out_dir, 1, STUB_VSIM, keep_bytes=200)
+
+        r = self.pool.run('test.stub', {'STUB_LINES': 5000, 'STUB_FAIL': 'true'})
+        self.assertTrue(r.failed)
+        self.assertLessEqual(len(r.output), 200) # Only the tail is kept
+        self.assertIn('# Stopped at', r.output)
+        self.assertGreater(r.stats.out_bytes, 100000)
+
+        # The full output is in the log
+        with open(os.path.join(r.out_dir, 'stub.log')) as fh:
+            log = fh.read()
+        self.assertIn('report 0\n', log)
+        self.assertIn('report 4999\n', log)
+
+        # Sentinels are filtered from the transcript as it is written
+        self.pool.quit()
+        self.pool = None
+        with open(os.path.join(r.out_dir, 'unittest.log')) as fh:
+            transcript = fh.read()
+        self.assertIn('report 4999', transcript)
+        self.assertNotIn('sentinel', transcript)
+
+    def test_log_rotation(self):
+        path = os.path.join(self.out_dir, 'rotate.log')
+        log = LogWriter(path, max_bytes=100, backups=2, compress=True)
+        for i in range(35):
+            log.write('line {:04d}\n'.format(i)) # 10 bytes per line
+        log.close()
+
+        self.assertEqual(sorted(os.listdir(self.out_dir)), \
+            ['rotate.log.1.gz', 'rotate.log.2.gz', 'rotate.log.gz'])
+
+        def read(name):
+            fh = gzip.open(os.path.join(self.out_dir, name))
+            try:
+                return fh.read()
+            finally:
+                fh.close()
+
+        self.assertEqual(read('rotate.log.gz'), ''.join('line {:04d}\n'.format(i) for i in range(30, 35)))
+        self.assertTrue(read('rotate.log.2.gz').startswith('line 0010'))
+
+    def test_stats(self):
+        self.pool = ModelsimPool(self.out_dir, 1, STUB_VSIM)
+
+        r = self.pool.run('test.stub', {'STUB_DELAY': 0.2, 'STUB_LINES': 2})
+        self.assertGreaterEqual(r.stats.wall, 0.2)
+        self.assertLess(r.stats.elab, 0.2)
+        self.assertEqual(r.stats.out_bytes, len(r.output) + 1) # Includes the final newline
+        if r.stats.cpu is not None:
+            self.assertLess(r.stats.cpu, 0.2) # The stub sleeps
+
+        # Each run in a batch is timed separately
+        trials = [{'STUB_DELAY': 0.3 if i == 1 else 0} for i in range(3)]
+        results = self.pool.sweep('test.stub', trials)
+        walls = [r.stats.wall for r in results]
+        self.assertGreaterEqual(walls[1], 0.3)
+        self.assertLess(walls[0] + walls[2], 0.3)
+
+        report = tsup.SimReport()
+        for r in results:
+            report.add('test_stats', r, True)
+        report.write(self.out_dir)
+        self.assertTrue(os.path.exists(os.path.join(self.out_dir, 'sim_report.csv')))
+        with open(os.path.join(self.out_dir, 'sim_report.json')) as fh:
+            self.assertEqual(len(json.load(fh)), 3)
+
+        summary = report.summary().split('\n')
+        self.assertIn('STUB_DELAY=0.3', summary[summary.index('Slowest trials:') + 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
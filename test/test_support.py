@@ -19,11 +19,18 @@ import unittest
 import random
 import time
 import gc
+import csv
+import json
+import atexit
+import threading
 import subprocess as subp
+from multiprocessing.pool import ThreadPool
 
 from eng import eng_si
 import scripts.color as color
-from modelsim import Modelsim
+from modelsim import Modelsim, ModelsimPool, FailureDetector, default_pool_size, format_generics
+
+TEST_OUT_DIR = os.path.join('test', 'test-output')
 
 
 def relativelyEqual(a, b, epsilon):
@@ -59,42 +66,216 @@ def XXmodelsim_success(log_file):
     return True
 
 def command_success(results):
-  for ln in results.split('\n'):
-    if ln.startswith('# Stopped at') or ln.startswith('# FATAL ERROR') or ln.startswith('# Error loading'):
-        return False
+  detector = FailureDetector()
+  detector.feed(results)
+  return not detector.failed
+
+
+class SimReport(object):
+    '''Record of the time taken by every simulation run'''
+    fields = ('test', 'entity', 'generics', 'passed', 'process_died', 'wall', 'elab', 'cpu', \
+        'out_bytes')
+
+    def __init__(self):
+        self.records = []
+        self.lock = threading.Lock()
+
+    def add(self, test, result, passed):
+        stats = result.stats
+        rec = {'test': test, 'entity': result.entity, 'generics': format_generics(result.generics), \
+            'passed': passed, 'process_died': result.process_died, 'wall': None, 'elab': None, \
+            'cpu': None, 'out_bytes': len(result.output)}
+        if stats is not None:
+            rec.update(stats._asdict())
+
+        with self.lock:
+            self.records.append(rec)
+
+    def write(self, out_dir, base_name='sim_report'):
+        '''Write the records as JSON and CSV files'''
+        with self.lock:
+            records = list(self.records)
+
+        with open(os.path.join(out_dir, base_name + '.json'), 'w') as fh:
+            json.dump(records, fh, indent=1, sort_keys=True)
+
+        with open(os.path.join(out_dir, base_name + '.csv'), 'wb') as fh:
+            writer = csv.DictWriter(fh, self.fields)
+            writer.writerow(dict((f, f) for f in self.fields))
+            writer.writerows(records)
+
+    def summary(self, count=5):
+        '''Describe the testbenches and trials that took the longest'''
+        with self.lock:
+            records = [r for r in self.records if r['wall'] is not None]
+
+        benches = {}
+        for r in records:
+            b = benches.setdefault(r['entity'], [0, 0.0, 0.0])
+            b[0] += 1
+            b[1] += r['wall']
+            b[2] += r['cpu'] or 0.0
+
+        def fmt_time(t):
+            return eng_si(t, 's') if t else '0 s'
+
+        lines = ['Slowest testbenches:']
+        for entity, (runs, wall, cpu) in sorted(benches.items(), key=lambda b: -b[1][1])[:count]:
+            lines.append('  {:<36} {:>4} runs  wall {:>9}  cpu {:>9}'.format(entity, runs, \
+                fmt_time(wall), fmt_time(cpu)))
+
+        lines.append('Slowest trials:')
+        for r in sorted(records, key=lambda r: -r['wall'])[:count]:
+            lines.append('  {:<36} wall {:>9}  {}'.format(r['entity'], fmt_time(r['wall']), \
+                r['generics']))
+
+        return '\n'.join(lines)
+
+sim_report = SimReport()
+
+
+def benchmark_mode():
+    '''True when the VHDL_BENCHMARK environment variable enables benchmarking'''
+    return os.environ.get('VHDL_BENCHMARK', '0') not in ('', '0')
+
+# Time per iteration of each test decorated with timedtest
+timed_results = {}
+
+
+class BenchmarkHistory(object):
+    '''Timings of past benchmark runs
+
+    Each run stores the time per iteration of every benchmark along with
+    the number of simulator sessions in use. The baseline for a benchmark
+    is the median of its last window times from runs that used the same
+    number of sessions.
+    '''
+    def __init__(self, history_file, window=5, max_runs=100):
+        self.history_file = history_file
+        self.window = window
+        self.max_runs = max_runs
+        try:
+            with open(history_file, 'r') as fh:
+                self.runs = json.load(fh)
+        except (IOError, ValueError):
+            self.runs = []
+
+    def baseline(self, name, jobs):
+        times = [r['timings'][name] for r in self.runs \
+            if r['jobs'] == jobs and name in r['timings']][-self.window:]
+        if not times:
+            return None
+
+        times.sort()
+        mid = len(times) // 2
+        return times[mid] if len(times) % 2 else (times[mid-1] + times[mid]) / 2
+
+    def compare(self, timings, jobs, threshold):
+        '''Find benchmarks that are slower than their baseline by more than threshold
+
+        Returns a list of (name, time, baseline) tuples.
+        '''
+        slower = []
+        for name, t in sorted(timings.items()):
+            base = self.baseline(name, jobs)
+            if base is not None and t > base * (1.0 + threshold):
+                slower.append((name, t, base))
+        return slower
+
+    def append(self, timings, jobs):
+        self.runs.append({'time': time.time(), 'jobs': jobs, 'timings': timings})
+        del self.runs[:-self.max_runs]
+
+    def save(self):
+        with open(self.history_file, 'w') as fh:
+            json.dump(self.runs, fh, indent=1, sort_keys=True)
+
+
+def benchmark_timings(report):
+    '''Collect the timings to track from a SimReport and the timed tests
+
+    Testbenches are measured by their mean wall time per simulation run
+    so that changing the number of trials doesn't look like a regression.
+    '''
+    with report.lock:
+        records = [r for r in report.records if r['wall'] is not None]
+
+    benches = {}
+    for r in records:
+        benches.setdefault(r['entity'], []).append(r['wall'])
+
+    timings = dict((entity, sum(walls) / len(walls)) for entity, walls in benches.items())
+    timings.update(timed_results)
+    return timings
+
+
+def check_benchmarks(timings, jobs):
+    '''Compare timings against the stored history and add them to it
 
-  return True
+    The history file is set by VHDL_BENCHMARK_HISTORY and the fraction a
+    benchmark can slow down before it is flagged by
+    VHDL_BENCHMARK_THRESHOLD. Returns the list of slower benchmarks.
+    '''
+    history_file = os.environ.get('VHDL_BENCHMARK_HISTORY', os.path.join('test', 'benchmark_history.json'))
+    threshold = float(os.environ.get('VHDL_BENCHMARK_THRESHOLD', '0.2'))
+
+    history = BenchmarkHistory(history_file)
+    slower = history.compare(timings, jobs, threshold)
+
+    print('\nBenchmarks: {} timings, {} slower than baseline by more than {:.0%}'.format( \
+        len(timings), len(slower), threshold))
+    for name, t, base in slower:
+        print(color.error('  SLOWER: {:<36} {:>9} vs {:>9} ({:+.0%})'.format(name, eng_si(t, 's'), \
+            eng_si(base, 's'), t / base - 1.0)))
+
+    history.append(timings, jobs)
+    history.save()
+    return slower
+
+
+def _write_sim_report():
+    if sim_report.records:
+        sim_report.write(TEST_OUT_DIR)
+        print('\n' + sim_report.summary())
+
+    if benchmark_mode():
+        timings = benchmark_timings(sim_report)
+        if timings:
+            check_benchmarks(timings, _sim_pool.size if _sim_pool is not None else default_pool_size())
+
+atexit.register(_write_sim_report)
+
+
+_sim_pool = None
+
+def get_sim_pool():
+    '''Get the simulator session pool shared by all test cases'''
+    global _sim_pool
+    if _sim_pool is None:
+        if not os.path.exists(TEST_OUT_DIR):
+            os.makedirs(TEST_OUT_DIR)
+
+        _sim_pool = ModelsimPool(TEST_OUT_DIR)
+        atexit.register(_sim_pool.quit)
+
+    return _sim_pool
 
 
 class VHDLTestCase(unittest.TestCase):
-    modelsim_proc = None
+    sim_pool = None
+    sim_timeout = None # Seconds each simulation can run. None uses the pool's timeout.
 
     def __init__(self, methodName='runTest'):
         unittest.TestCase.__init__(self, methodName=methodName)
         self.test_name = 'Unnamed test'
         self.trial = 0
         self.trial_count = 0
-        #if modelsim_proc is None:
-        #    modelsim_proc = Modelsim('test/test-output/unittest.log')
-        self.vsim = None
 
     @classmethod
     def setUpClass(cls):
-        out_dir = os.path.join('test', 'test-output')
-        if not os.path.exists(out_dir):
-            os.mkdir(out_dir)
-
-        cls.modelsim_proc = Modelsim('test/test-output/unittest.log')
-
-    @classmethod
-    def tearDownClass(cls):
-        if cls.modelsim_proc is not None:
-            cls.modelsim_proc.quit()
-            cls.modelsim_proc = None 
-
+        cls.sim_pool = get_sim_pool()
 
     def setUp(self):
-        self.vsim = self.__class__.modelsim_proc
         print('')
 
     def update_progress(self, cur_trial, dotted=True):
@@ -121,31 +302,67 @@ class VHDLTestCase(unittest.TestCase):
         self.assertTrue(status, 'Simulation failed')
 
     def run_simulation(self, entity, update=True, **generics):
-        log_file = os.path.join('test', 'test-output', entity.split('.')[1] + '.log')
-
         if update:
             self.test_name = 'Testbench ' + entity
             self.update_progress(1)
 
-        vsim_args = ''
-        if generics is not None:
-            vsim_args = ' '.join('-G{}={}'.format(k, v) for k, v in generics.iteritems())
+        result = self.sim_pool.run(entity, generics, self.sim_timeout)
+        self.check_simulation(result)
+        return result
 
-        cmds = []
-        cmds.append(self.vsim.exec_tcl('vsim {} {}; run -all'.format(entity, vsim_args)))
-        process_died = self.vsim.process_done()
-        if process_died:
-          self.vsim.restart()
+    def run_sweep(self, entity, trials, batch_size=None):
+        '''Run a sweep of simulations of an entity with varying generics
 
-        status = command_success(cmds[-1]) and not process_died
-        if not status:
-            print(''.join(cmds))
+        trials is a sequence of dicts with the generics for each simulation.
+        The simulations are sent to the simulator in batches that each take
+        one round trip and the batches are spread across the session pool.
+        '''
+        self.test_name = 'Testbench ' + entity
+        self.trial_count = len(trials)
 
-        # Write log
-        with open(log_file, 'w') as fh:
-            fh.write(''.join(cmds))
+        completed = [0]
+        def progress(result):
+            completed[0] += 1
+            self.update_progress(completed[0])
 
-        self.assertTrue(status, 'Simulation failed')
+        results = self.sim_pool.sweep(entity, trials, batch_size, progress, self.sim_timeout)
+        self.check_simulations(results)
+
+        return results
+
+    def check_simulation(self, result):
+        '''Check the result of a simulation
+
+        The log of the simulation was written by the session pool as the
+        output arrived.
+        '''
+        status = not result.failed and not result.process_died
+        sim_report.add(self.id(), result, status)
+        if not status:
+            print(result.output)
+
+        msg = 'Simulation timed out' if result.timed_out else 'Simulation failed'
+        if result.generics:
+            msg += ': ' + format_generics(result.generics)
+        self.assertTrue(status, msg)
+
+    def check_simulations(self, results):
+        '''Check the results of a sweep
+
+        The output of each worker's share of the sweep was written to one
+        log with the generics of each run as a header.
+        '''
+        failed = []
+        for r in results:
+            status = not r.failed and not r.process_died
+            sim_report.add(self.id(), r, status)
+            if not status:
+                print(r.output)
+                failed.append(r)
+
+        msg = 'Simulation failed: ' + '; '.join(format_generics(r.generics) + \
+            (' (timed out)' if r.timed_out else '') for r in failed)
+        self.assertFalse(failed, msg)
 
     def assertRelativelyEqual(self, a, b, epsilon, msg=None):
         if not relativelyEqual(a, b, epsilon):
@@ -176,12 +393,18 @@ class RandomSeededTestCase(VHDLTestCase):
         try:
             self.seed = long(os.environ[self.seed_var_name])
         except KeyError:
-            random.seed()
-            self.seed = long(random.random() * 1e9)
+            if benchmark_mode(): # Keep the workload the same from run to run
+                self.seed = 1
+            else:
+                random.seed()
+                self.seed = long(random.random() * 1e9)
 
         print(color.note('\n * Random seed: {} *'.format(self.seed)))
         random.seed(self.seed)
 
+        # Private generator keeps the sequence reproducible when tests run concurrently
+        self.random = random.Random(self.seed)
+
         VHDLTestCase.setUp(self)
 
     def XXXupdate_progress(self, cur_trial, dotted=True):
@@ -204,6 +427,74 @@ class RandomSeededTestCase(VHDLTestCase):
             raise self.failureException(msg)
 
 
+class _LockedResult(object):
+    '''Serialize access to a TestResult shared by concurrent tests'''
+    def __init__(self, result):
+        self._result = result
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name):
+        attr = getattr(self._result, name)
+        if not callable(attr):
+            return attr
+
+        def locked(*args, **kwargs):
+            with self._lock:
+                return attr(*args, **kwargs)
+        return locked
+
+
+def _flatten_suite(suite):
+    for t in suite:
+        if isinstance(t, unittest.TestSuite):
+            for st in _flatten_suite(t):
+                yield st
+        else:
+            yield t
+
+
+class ConcurrentTestSuite(unittest.TestSuite):
+    '''Test suite that runs its test cases in parallel
+
+    Each test case runs in its own thread so that their simulations
+    can be spread across the shared simulator session pool.
+    '''
+    def __init__(self, tests=(), jobs=None):
+        unittest.TestSuite.__init__(self, tests)
+        self.jobs = jobs
+
+    def run(self, result):
+        tests = list(_flatten_suite(self))
+        if not tests:
+            return result
+
+        classes = []
+        for t in tests:
+            if t.__class__ not in classes:
+                classes.append(t.__class__)
+
+        for cls in classes:
+            setup = getattr(cls, 'setUpClass', None)
+            if setup is not None:
+                setup()
+
+        jobs = self.jobs if self.jobs is not None else get_sim_pool().size
+        locked_result = _LockedResult(result)
+        tpool = ThreadPool(max(1, min(jobs, len(tests))))
+        try:
+            tpool.map(lambda t: t(locked_result), tests)
+        finally:
+            tpool.close()
+            tpool.join()
+
+        for cls in classes:
+            teardown = getattr(cls, 'tearDownClass', None)
+            if teardown is not None:
+                teardown()
+
+        return result
+
+
 def timedtest(f):
     '''Decorator that times execution of a test case'''
     def wrapper(self, *args, **kwargs):
@@ -249,5 +540,7 @@ def timedtest(f):
         print('*   Test duration: total {}, per iteration {}, rate {}'.format( \
             eng_si(delta, 's'), eng_si(per_iter, 's'), eng_si(processing_rate, unit_name + '/s') ))
 
+        timed_results[self.id()] = per_iter
+
     return wrapper
 
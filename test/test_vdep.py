@@ -0,0 +1,63 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''VHDL-extras library
+   Dependency scanner test
+'''
+
+# Copyright © 2014 Kevin Thibedeau
+
+# This file is part of VHDL-extras.
+
+
+from __future__ import print_function, division
+
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+import vdep
+
+
+def make_files(deps):
+    '''Build FileInfo objects from a dict of file names and their dependencies'''
+    infos = []
+    for name, depends in sorted(deps.items()):
+        fi = vdep.FileInfo(name)
+        fi.depends = set(depends)
+        infos.append(fi)
+    return infos
+
+
+class TestVdep(unittest.TestCase):
+
+    def test_trailing_comment(self):
+        for fname in ('rtl/extras/sizing.vhdl', 'rtl/extras/characters_latin_1.vhdl'):
+            with io.open(fname, encoding='latin-1') as fh:
+                text = fh.read()
+            tokens = vdep.tokenize(text)
+
+            self.assertEqual(vdep.tokenize(text + '-- a comment'), tokens)
+            self.assertEqual(vdep.tokenize(text + '\n-- note\n'), tokens)
+            self.assertEqual(vdep.tokenize(text + '/* block */'), tokens)
+
+    def test_sort(self):
+        infos = make_files({'a': ['b', 'c'], 'b': ['c'], 'c': [], 'd': ['x']})
+        self.assertEqual([fi.name for fi in vdep.sort_dependencies(infos)], ['c', 'b', 'a', 'd'])
+
+    def test_cycle_below_long_chain(self):
+        chain = 3000
+        deps = dict(('f{:04}'.format(i), ['f{:04}'.format(i+1)]) for i in range(chain))
+        deps['f{:04}'.format(chain)] = ['z0']
+        deps['z0'] = ['z1']
+        deps['z1'] = ['z0']
+
+        with self.assertRaises(vdep.DependencyCycleError) as cm:
+            vdep.sort_dependencies(make_files(deps))
+        self.assertEqual(str(cm.exception), 'Dependency cycle: z0 -> z1 -> z0')
+
+
+if __name__ == '__main__':
+    unittest.main()
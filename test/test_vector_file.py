@@ -0,0 +1,54 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''VHDL-extras library
+   Binary vector file test
+'''
+
+# Copyright © 2014 Kevin Thibedeau
+
+# This file is part of VHDL-extras.
+
+
+from __future__ import print_function, division
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import test.vector_file as vfile
+
+
+class TestVectorFile(unittest.TestCase):
+
+    def test_layout(self):
+        self.assertEqual(vfile.pack_vectors([0x12345, 0xABCDE], 20),
+            b'\x45\x23\x01\xDE\xBC\x0A')
+        self.assertEqual(vfile.pack_vectors([0x12345, 0xABCDE], 20, vfile.BIG_ENDIAN),
+            b'\x01\x23\x45\x0A\xBC\xDE')
+        self.assertEqual(vfile.pack_vectors([-2], 12), b'\xFE\xFF') # Sign extended
+        self.assertEqual(list(vfile.unpack_vectors(b'\xFE\xFF', 12, signed=True)), [-2])
+        self.assertRaises(ValueError, vfile.unpack_vectors, b'\x00\x00\x00', 12)
+
+    def test_round_trip(self):
+        path = os.path.join(tempfile.mkdtemp(), 'vectors.dat')
+        try:
+            for width in (1, 8, 20, 64, 100):
+                words = [(i * 0x9E3779B97F4A7C15) & (2**width-1) for i in range(1000)]
+                for order in (vfile.LITTLE_ENDIAN, vfile.BIG_ENDIAN):
+                    vfile.write_vectors(path, words, width, order)
+                    self.assertEqual(os.path.getsize(path), len(words) * vfile.word_octets(width))
+                    self.assertEqual([int(w) for w in vfile.read_vectors(path, width, order)],
+                        words)
+
+                    if vfile.np is not None and width <= 64:
+                        a = vfile.np.array(words, dtype=vfile.np.uint64)
+                        self.assertEqual(vfile.pack_vectors(a, width, order),
+                            vfile.pack_vectors(words, width, order))
+        finally:
+            shutil.rmtree(os.path.dirname(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,17 +12,21 @@
 
 from __future__ import print_function, division
 
-import random
+import struct
 import test.test_support as tsup
+import test.vector_file as vfile
+from test.eng import eng_si
+from golden.crc_catalogue import CRC_CATALOGUE
 import unittest
 import os
 
 
-class TestVHDL(tsup.VHDLTestCase):
+def load_tests(loader, tests, pattern):
+    # Spread the testbenches across the simulator session pool
+    return tsup.ConcurrentTestSuite(tests)
 
-    def test_binaryio(self):
-        entity = 'test.test_binaryio'
-        self.run_simulation(entity, TEST_OUT_DIR='test/test-output')
+
+class TestVHDL(tsup.VHDLTestCase):
 
     def test_gray_code(self):
         entity = 'test.test_gray_code'
@@ -63,25 +67,34 @@ class TestVHDL(tsup.VHDLTestCase):
     def test_lcar_ops(self):
         entity = 'test.test_lcar_ops'
 
-        self.test_name = 'Testbench ' + entity
-        self.trial_count = 20 # Go up to maximal length rules for 22-bit array
-        for i in xrange(self.trial_count):
-            self.update_progress(i+1)
-
-            self.run_simulation(entity, update=False, WIDTH=i+2)
+        # Go up to maximal length rules for 22-bit array. The full
+        # table is checked in test_maxlen_tables.
+        trials = [dict(WIDTH=i+2) for i in xrange(20)]
+        self.run_sweep(entity, trials)
 
     def test_lfsr_ops(self):
         entity = 'test.test_lfsr_ops'
 
-        self.test_name = 'Testbench ' + entity
-        self.trial_count = 10
-        for i in xrange(self.trial_count):
-            self.update_progress(i+1)
+        trials = []
+        for i in xrange(10):
+            trials.append(dict(WIDTH=i+2, KIND='normal'))
+            trials.append(dict(WIDTH=i+2, KIND='inverted'))
+            trials.append(dict(WIDTH=i+2, KIND='normal', FULL_CYCLE='true'))
+            trials.append(dict(WIDTH=i+2, KIND='inverted', FULL_CYCLE='true'))
+
+        self.run_sweep(entity, trials)
+
+    def test_lfsr_leap(self):
+        entity = 'test.test_lfsr_leap'
 
-            self.run_simulation(entity, update=False, WIDTH=i+2, KIND='normal')
-            self.run_simulation(entity, update=False, WIDTH=i+2, KIND='inverted')
-            self.run_simulation(entity, update=False, WIDTH=i+2, KIND='normal', FULL_CYCLE='true')
-            self.run_simulation(entity, update=False, WIDTH=i+2, KIND='inverted', FULL_CYCLE='true')
+        trials = []
+        for w in (3, 8, 17, 30):
+            for s in (1, 5, 32, 100):
+                for k in ('normal', 'inverted'):
+                    trials.append(dict(WIDTH=w, STEPS=s, KIND=k))
+                    trials.append(dict(WIDTH=w, STEPS=s, KIND=k, FULL_CYCLE='true'))
+
+        self.run_sweep(entity, trials)
 
     def test_muxing(self):
         entity = 'test.test_muxing'
@@ -99,6 +112,31 @@ class TestVHDL(tsup.VHDLTestCase):
         entity = 'test.test_strings_unbounded'
         self.run_simulation(entity)
 
+    def test_string_builder_throughput(self):
+        '''Compare string_builder appends against unbounded_string appends'''
+        entity = 'test.test_string_builder_throughput'
+        chars = 1000000 if tsup.benchmark_mode() else 50000
+
+        for builder in (False, True):
+            # Plain appends are quadratic so they get a smaller run
+            count = chars if builder else min(chars, 50000)
+            result = self.run_simulation(entity, CHARS=count, USE_BUILDER='true' if builder else 'false')
+
+            run_time = result.stats.wall - (result.stats.elab or 0.0)
+            if run_time > 0:
+                print('  {}: {}'.format('string_builder' if builder else 'unbounded_string', \
+                    eng_si(count / run_time, 'chars/s')))
+
+    def test_tokenize_throughput(self):
+        entity = 'test.test_tokenize_throughput'
+        chars = 4000000 if tsup.benchmark_mode() else 100000
+
+        result = self.run_simulation(entity, CHARS=chars)
+
+        run_time = result.stats.wall - (result.stats.elab or 0.0)
+        if run_time > 0:
+            print('  {}'.format(eng_si(chars / run_time, 'chars/s')))
+
     def test_strings_bounded(self):
         entity = 'test_2008.test_strings_bounded'
         self.run_simulation(entity)
@@ -107,9 +145,70 @@ class TestVHDL(tsup.VHDLTestCase):
         entity = 'test.test_text_buffering'
         self.run_simulation(entity)
 
+    def test_random(self):
+        entity = 'test.test_random'
+        self.run_simulation(entity)
+
+    def test_random_20xx(self):
+        entity = 'test_2008.test_random_20xx'
+        self.run_simulation(entity)
+
 
 class TestRandVHDL(tsup.RandomSeededTestCase):
 
+    def test_binaryio(self):
+        entity = 'test.test_binaryio'
+        out_dir = 'test/test-output'
+        stim = [self.random.randint(0, 2**20-1) for _ in xrange(1000)]
+        vfile.write_vectors(os.path.join(out_dir, 'binary_stimulus.dat'), stim, 20, vfile.BIG_ENDIAN)
+
+        self.run_simulation(entity, TEST_OUT_DIR=out_dir)
+
+        resp = vfile.read_vectors(os.path.join(out_dir, 'binary_response.dat'), 20)
+        self.assertEqual([int(w) for w in resp], [w ^ (2**20-1) for w in stim], \
+            'Response mismatch (seed {})'.format(self.seed))
+
+    def test_binaryio_throughput(self):
+        '''Copy a sample file with the single word and block binaryio procedures'''
+        entity = 'test.test_binaryio_throughput'
+        out_dir = 'test/test-output'
+        word_size = 12
+        num_samples = 4000000 if tsup.benchmark_mode() else 50000
+
+        in_file = os.path.join(out_dir, 'samples_in.dat')
+        samples = [self.random.randint(0, 2**word_size-1) for _ in xrange(num_samples)]
+        vfile.write_vectors(in_file, samples, word_size)
+        with open(in_file, 'rb') as fh:
+            in_data = fh.read()
+
+        for bulk in (False, True):
+            out_file = os.path.join(out_dir, 'samples_out_{}.dat'.format('bulk' if bulk else 'word'))
+            result = self.run_simulation(entity, IN_FILE=in_file, OUT_FILE=out_file, \
+                WORD_SIZE=word_size, BULK='true' if bulk else 'false')
+
+            with open(out_file, 'rb') as fh:
+                self.assertEqual(fh.read(), in_data, 'Sample file mismatch')
+
+            run_time = result.stats.wall - (result.stats.elab or 0.0)
+            if run_time > 0:
+                print('  {}: {}'.format('Block' if bulk else 'Single word', \
+                    eng_si(num_samples / run_time, 'samples/s')))
+
+    def test_random_throughput(self):
+        '''Compare the uniform and xorshift PRNGs for wide vectors'''
+        entity = 'test.test_random_throughput'
+        words = 1000000 if tsup.benchmark_mode() else 10000
+
+        for size in (32, 256, 1024):
+            for xorshift in (False, True):
+                result = self.run_simulation(entity, SIZE=size, WORDS=words, \
+                    USE_XORSHIFT='true' if xorshift else 'false', TEST_SEED=self.seed)
+
+                run_time = result.stats.wall - (result.stats.elab or 0.0)
+                if run_time > 0:
+                    print('  {} bits, {}: {}'.format(size, 'xorshift' if xorshift else 'uniform', \
+                        eng_si(words / run_time, 'words/s')))
+
     def test_timing_ops(self):
         entity = 'test.test_timing_ops'
         self.run_simulation(entity, TEST_SEED=self.seed)
@@ -118,6 +217,20 @@ class TestRandVHDL(tsup.RandomSeededTestCase):
         entity = 'test.test_crc_ops'
         self.run_simulation(entity, TEST_SEED=self.seed)
 
+    def test_crc_table(self):
+        entity = 'test.test_crc_table'
+        cat_file = 'test/test-output/crc_catalogue.dat'
+        with open(cat_file, 'wb') as fh:
+            for name, width, poly, init, refin, refout, xorout, check in CRC_CATALOGUE:
+                fh.write(struct.pack('<BBBQQQQ', width, refin, refout, poly, init, xorout, check))
+
+        self.run_simulation(entity, CATALOGUE_FILE=cat_file, TEST_SEED=self.seed)
+
+    def test_parallel_crc(self):
+        entity = 'test.test_parallel_crc'
+        trials = [dict(PIPELINE=p, TEST_SEED=self.seed) for p in ('false', 'true')]
+        self.run_sweep(entity, trials)
+
     def test_simple_fifo(self):
         entity = 'test.test_simple_fifo'
         self.run_simulation(entity, TEST_SEED=self.seed)
@@ -138,6 +251,21 @@ class TestRandVHDL(tsup.RandomSeededTestCase):
         entity = 'test.test_secded_edac'
         self.run_simulation(entity, TEST_SEED=self.seed)
 
+    def test_edac_throughput(self):
+        '''Compare the interleaved and table driven Hamming decoders'''
+        entity = 'test.test_edac_throughput'
+        decodes = 1000000 if tsup.benchmark_mode() else 20000
+
+        for data_size in (16, 64, 256):
+            for table in (False, True):
+                result = self.run_simulation(entity, DATA_SIZE=data_size, DECODES=decodes, \
+                    USE_TABLE='true' if table else 'false', TEST_SEED=self.seed)
+
+                run_time = result.stats.wall - (result.stats.elab or 0.0)
+                if run_time > 0:
+                    print('  {} bits, {}: {}'.format(data_size, 'table' if table else 'interleaved', \
+                        eng_si(decodes / run_time, 'decodes/s')))
+
 
     def test_dual_port_ram(self):
         entity = 'test.test_dual_port_ram'
@@ -145,21 +273,20 @@ class TestRandVHDL(tsup.RandomSeededTestCase):
 
     def test_rom(self):
         entity = 'test.test_rom'
-        self.test_name = 'Testbench ' + entity
-        self.trial_count = 20
-        for i in xrange(self.trial_count):
-            self.update_progress(i+1)
 
-            rom_size = random.randint(1, 256)
-            rom_width = random.randint(1, 128)
-            hex_format = random.choice((True, False))
+        roms = []
+        trials = []
+        for i in xrange(20):
+            rom_size = self.random.randint(1, 256)
+            rom_width = self.random.randint(1, 128)
+            hex_format = self.random.choice((True, False))
 
             rom_format = 'HEX_TEXT' if hex_format else 'BINARY_TEXT'
 
             # Create randomized ROM file
-            rom = [random.randint(0, 2**rom_width-1) for _ in xrange(rom_size)]
+            rom = [self.random.randint(0, 2**rom_width-1) for _ in xrange(rom_size)]
 
-            rom_file = 'test/test-output/rom_in.txt'
+            rom_file = 'test/test-output/rom_in_{}.txt'.format(i)
             with open(rom_file, 'w') as fh:
                 for w in rom:
                     if hex_format:
@@ -167,12 +294,16 @@ class TestRandVHDL(tsup.RandomSeededTestCase):
                     else:
                         print('{:0{}b}'.format(w, rom_width), file=fh)
 
-            out_rom_file = 'test/test-output/rom_out.txt'
+            out_rom_file = 'test/test-output/rom_out_{}.bin'.format(i)
             #out_rom_file = 'rom_out.txt'
 
-            self.run_simulation(entity, update=False, ROM_FILE=rom_file, \
-                OUT_ROM_FILE=out_rom_file, FORMAT=rom_format, ROM_SIZE=rom_size, ROM_WIDTH=rom_width)
+            roms.append((rom, out_rom_file, rom_width))
+            trials.append(dict(ROM_FILE=rom_file, OUT_ROM_FILE=out_rom_file, \
+                FORMAT=rom_format, ROM_SIZE=rom_size, ROM_WIDTH=rom_width))
 
+        self.run_sweep(entity, trials)
+
+        for rom, out_rom_file, rom_width in roms:
             self.assertTrue(os.path.exists(out_rom_file), 'Missing ROM output')
 
             #print('ROM format:', rom_format)
@@ -180,13 +311,8 @@ class TestRandVHDL(tsup.RandomSeededTestCase):
             #with open(rom_file, 'r') as fh:
             #    for l in fh: print(l, end='')
 
-            #print('Out:')
-            #with open(out_rom_file, 'r') as fh:
-            #    for l in fh: print(l, end='')
-
             # Read back the simulated ROM and verify contents
-            with open(out_rom_file, 'r') as fh:
-                rom_out = [int(l.strip(), base=2) for l in fh.readlines()]
+            rom_out = [int(w) for w in vfile.read_vectors(out_rom_file, rom_width)]
 
             self.assertEqual(len(rom), len(rom_out), 'ROM length mismatch')
             self.assertEqual(rom, rom_out, 'ROM mismatch')
@@ -198,14 +324,8 @@ class TestRandVHDL(tsup.RandomSeededTestCase):
         min_freq = 1e4
         max_freq = 5e5
 
-        self.test_name = 'Testbench ' + entity
-        self.trial_count = 10
-        for i in xrange(self.trial_count):
-            self.update_progress(i+1)
-
-            freq = float(random.randint(min_freq, max_freq))
-
-            self.run_simulation(entity, update=False, TGT_FREQ=freq)
+        trials = [dict(TGT_FREQ=float(self.random.randint(min_freq, max_freq))) for _ in xrange(10)]
+        self.run_sweep(entity, trials)
 
 
     def test_parity_ops(self):
@@ -215,15 +335,14 @@ class TestRandVHDL(tsup.RandomSeededTestCase):
     def test_handshake_synchronizer(self):
         entity = 'test.test_handshake_synchronizer'
 
-        self.test_name = 'Testbench ' + entity
-        self.trial_count = 50
-        for i in xrange(self.trial_count):
-            self.update_progress(i+1)
-
+        trials = []
+        for i in xrange(50):
             # Select random frequencies for tx and rx sides
-            tx_freq = '{}MHz'.format(random.randint(1, 100))
-            rx_freq = '{}MHz'.format(random.randint(1, 100))
-            self.run_simulation(entity, update=False, TEST_SEED=self.seed, TX_FREQ=tx_freq, RX_FREQ=rx_freq)
+            tx_freq = '{}MHz'.format(self.random.randint(1, 100))
+            rx_freq = '{}MHz'.format(self.random.randint(1, 100))
+            trials.append(dict(TEST_SEED=self.seed, TX_FREQ=tx_freq, RX_FREQ=rx_freq))
+
+        self.run_sweep(entity, trials)
 
     def test_secded_codec(self):
         entity = 'test.test_secded_codec'
@@ -237,45 +356,43 @@ class TestRandVHDL(tsup.RandomSeededTestCase):
         entity = 'test.test_reg_file'
 
 
-        self.test_name = 'Testbench ' + entity
-        self.trial_count = 10
-        for i in xrange(self.trial_count):
-            self.update_progress(i+1)
-
-            num_regs = random.randint(1, 10);
+        trials = []
+        for i in xrange(10):
+            num_regs = self.random.randint(1, 10);
             reg_size = 16
             nibbles = (reg_size + 3) // 4
 
-            strobe_mask = [random.randint(0, 2**reg_size-1) for _ in xrange(num_regs)]
-            direct_read_mask = [random.randint(0, 2**reg_size-1) for _ in xrange(num_regs)]
+            strobe_mask = [self.random.randint(0, 2**reg_size-1) for _ in xrange(num_regs)]
+            direct_read_mask = [self.random.randint(0, 2**reg_size-1) for _ in xrange(num_regs)]
 
             strobe_mask = 'X"{}"'.format('_'.join('{:0{}x}'.format(r, nibbles) for r in strobe_mask))
             direct_read_mask = 'X"{}"'.format('_'.join('{:0{}x}'.format(r, nibbles) for r in direct_read_mask))
 
-            self.run_simulation(entity, update=False, TEST_SEED=self.seed, NUM_REGS=num_regs, \
-              STROBE_BIT_MASK_BV=strobe_mask, DIRECT_READ_BIT_MASK_BV=direct_read_mask)
+            trials.append(dict(TEST_SEED=self.seed, NUM_REGS=num_regs, \
+              STROBE_BIT_MASK_BV=strobe_mask, DIRECT_READ_BIT_MASK_BV=direct_read_mask))
+
+        self.run_sweep(entity, trials)
 
     def test_reg_file_2008(self):
         entity = 'test_2008.test_reg_file'
 
 
-        self.test_name = 'Testbench ' + entity
-        self.trial_count = 10
-        for i in xrange(self.trial_count):
-            self.update_progress(i+1)
-
-            num_regs = random.randint(1, 10);
+        trials = []
+        for i in xrange(10):
+            num_regs = self.random.randint(1, 10);
             reg_size = 16
             nibbles = (reg_size + 3) // 4
 
-            strobe_mask = [random.randint(0, 2**reg_size-1) for _ in xrange(num_regs)]
-            direct_read_mask = [random.randint(0, 2**reg_size-1) for _ in xrange(num_regs)]
+            strobe_mask = [self.random.randint(0, 2**reg_size-1) for _ in xrange(num_regs)]
+            direct_read_mask = [self.random.randint(0, 2**reg_size-1) for _ in xrange(num_regs)]
 
             strobe_mask = 'X"{}"'.format('_'.join('{:0{}x}'.format(r, nibbles) for r in strobe_mask))
             direct_read_mask = 'X"{}"'.format('_'.join('{:0{}x}'.format(r, nibbles) for r in direct_read_mask))
 
-            self.run_simulation(entity, update=False, TEST_SEED=self.seed, NUM_REGS=num_regs, \
-              STROBE_BIT_MASK_BV=strobe_mask, DIRECT_READ_BIT_MASK_BV=direct_read_mask)
+            trials.append(dict(TEST_SEED=self.seed, NUM_REGS=num_regs, \
+              STROBE_BIT_MASK_BV=strobe_mask, DIRECT_READ_BIT_MASK_BV=direct_read_mask))
+
+        self.run_sweep(entity, trials)
 
     def test_interrupt_ctl(self):
         entity = 'test.test_interrupt_ctl'
@@ -285,9 +402,5 @@ class TestRandVHDL(tsup.RandomSeededTestCase):
         entity = 'test.test_bit_ops'
         #self.run_simulation(entity, TEST_SEED=self.seed)
 
-        self.test_name = 'Testbench ' + entity
-        self.trial_count = 10
-        for i in xrange(self.trial_count):
-            self.update_progress(i+1)
-            self.run_simulation(entity, update=False)
+        self.run_sweep(entity, [{}] * 10)
 
@@ -0,0 +1,114 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''VHDL-extras library
+   Binary vector files
+
+   A vector file is a sequence of fixed width words with no header or
+   separators. Each word occupies the smallest number of octets that hold
+   its width, in the same layout the binaryio read() and write() procedures
+   use. Testbenches can stream stimulus from these files and dump responses
+   to them without any text formatting.
+
+   NumPy is used when it is installed and the words fit in 64 bits.
+'''
+
+# Copyright © 2014 Kevin Thibedeau
+
+# This file is part of VHDL-extras.
+
+from __future__ import print_function, division
+
+import binascii
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+LITTLE_ENDIAN = 'little'
+BIG_ENDIAN = 'big'
+
+
+def word_octets(width):
+    '''Number of octets used for each word'''
+    return (width - 1) // 8 + 1
+
+
+def _check_order(octet_order):
+    if octet_order not in (LITTLE_ENDIAN, BIG_ENDIAN):
+        raise ValueError('Unknown octet order: {}'.format(octet_order))
+
+
+def pack_vectors(words, width, octet_order=LITTLE_ENDIAN):
+    '''Convert a sequence of unsigned words into a vector file image
+
+    Negative words are sign extended to fill their octets the same as
+    binaryio's signed write().
+    '''
+    _check_order(octet_order)
+    n = word_octets(width)
+    word_mask = (1 << (n * 8)) - 1
+
+    if np is not None and n <= 8 and isinstance(words, np.ndarray):
+        le = words.astype('<u8').view(np.uint8).reshape(-1, 8)
+        octets = le[:, :n] if octet_order == LITTLE_ENDIAN else le[:, n-1::-1]
+        return octets.tobytes()
+
+    # Hex formatting produces big-endian words. Reversing the word order
+    # and then the whole image gives the little-endian layout.
+    if octet_order == LITTLE_ENDIAN:
+        words = reversed(list(words))
+    hex_words = ''.join('{:0{}x}'.format(w & word_mask, n * 2) for w in words)
+    image = binascii.unhexlify(hex_words)
+    return image[::-1] if octet_order == LITTLE_ENDIAN else image
+
+
+def unpack_vectors(image, width, octet_order=LITTLE_ENDIAN, signed=False):
+    '''Convert a vector file image into a list of words
+
+    The padding bits above width are discarded or used for sign extension
+    when signed is True. A NumPy array is returned when NumPy is installed
+    and the words fit in 64 bits.
+    '''
+    _check_order(octet_order)
+    n = word_octets(width)
+    if len(image) % n != 0:
+        raise ValueError('Vector data is not a multiple of {} octets'.format(n))
+
+    word_mask = (1 << width) - 1
+    sign_bit = 1 << (width - 1)
+
+    if np is not None and n <= 8 and (not signed or width < 64):
+        octets = np.frombuffer(image, dtype=np.uint8).reshape(-1, n)
+        if octet_order == BIG_ENDIAN:
+            octets = octets[:, ::-1]
+        le = np.zeros((octets.shape[0], 8), dtype=np.uint8)
+        le[:, :n] = octets
+        words = le.view('<u8').reshape(-1) & np.uint64(word_mask)
+        if signed:
+            words = words.astype(np.int64)
+            words -= (words & sign_bit) << 1
+        return words
+
+    if octet_order == LITTLE_ENDIAN:
+        image = image[::-1]
+    hex_words = binascii.hexlify(image)
+    words = [int(hex_words[i:i+n*2], 16) & word_mask for i in range(0, len(hex_words), n*2)]
+    if octet_order == LITTLE_ENDIAN:
+        words.reverse()
+    if signed:
+        words = [w - ((w & sign_bit) << 1) for w in words]
+    return words
+
+
+def write_vectors(fname, words, width, octet_order=LITTLE_ENDIAN):
+    '''Write a sequence of words to a vector file'''
+    with open(fname, 'wb') as fh:
+        fh.write(pack_vectors(words, width, octet_order))
+
+
+def read_vectors(fname, width, octet_order=LITTLE_ENDIAN, signed=False):
+    '''Read all words from a vector file'''
+    with open(fname, 'rb') as fh:
+        return unpack_vectors(fh.read(), width, octet_order, signed)